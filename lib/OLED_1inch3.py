@@ -10,8 +10,8 @@
 
     @author     : Waveshare
     @author     : Veltys
-    @date       : 2023-11-12
-    @version    : 1.1.1
+    @date       : 2026-10-18
+    @version    : 1.2.0
     @usage      : (imported when needed)
     @note       : ...
 '''
@@ -22,6 +22,10 @@ import time
 from machine import Pin, SPI
 import framebuf
 
+from gc_policy import POLICY                                                    # Garbage collection scheduling
+from metrics import REGISTRY, counter, histogram                                # Instrumentation
+from ticks import ticks_diff, ticks_us                                          # Microsecond ticks
+
 
 DC = 8
 RST = 12
@@ -29,6 +33,9 @@ MOSI = 11
 SCK = 10
 CS = 9
 
+FRAME_BYTES = REGISTRY.register(counter('picotemp_display_bytes_total', 'Display data bytes sent'))
+FRAME_TIME = REGISTRY.register(histogram('picotemp_display_frame_seconds', 'Display refresh time'))
+
 
 class OLED_1inch3(framebuf.FrameBuffer):
     def __init__(self):
@@ -54,6 +61,18 @@ class OLED_1inch3(framebuf.FrameBuffer):
         self.dc(1)
 
         self.buffer = bytearray(self.height * self.width // 8)
+        self._rows = []                                                         # Preallocated zero-copy row views, for bulk transfers
+        self._cmd_buf = bytearray(1)                                            # Preallocated single byte command / data buffer
+        self._address_buf = bytearray(3)                                        # Preallocated page and column address commands buffer
+        self._shadow = bytearray(len(self.buffer))                              # Copy of the last frame sent to the display
+        self._shadow_valid = False                                              # Whether the display content matches the shadow copy
+
+        self.bytes_sent = 0                                                     # Data bytes sent by the last refresh
+        self.bytes_saved = 0                                                    # Data bytes skipped by the last refresh
+        self.total_bytes_saved = 0                                              # Data bytes skipped since the display was initialized
+
+        for start in range(0, len(self.buffer), self.width // 8):
+            self._rows.append(memoryview(self.buffer)[start:start + self.width // 8])
 
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_HMSB)
 
@@ -80,6 +99,8 @@ class OLED_1inch3(framebuf.FrameBuffer):
 
         self.rst(1)
 
+        self.invalidate()
+
         self.write_cmd(0xAE)                                                    # Turn off OLED display
 
         self.write_cmd(0x00)                                                    # Set lower column address
@@ -118,23 +139,75 @@ class OLED_1inch3(framebuf.FrameBuffer):
         self.write_cmd(0XAF)
 
 
+    def invalidate(self):
+        '''!
+            Shadow copy invalidator
+
+            Forces the next call to `show()` to send the whole buffer, e.g. after the display has been reset
+        '''
+
+        self._shadow_valid = False
+
+
     def show(self):
         '''!
             Show buffer on the display
 
             Transfers the buffer data to the OLED display for rendering
+
+            Only the rows which changed since the last refresh are sent. Each row is sent whole as a single SPI
+            transaction straight from the buffer memory, through its preallocated view (slicing a `memoryview` would
+            allocate a new one), preceded by its page and column address commands, also sent as a single transaction.
+            No automatic garbage collection interrupts the transfers, so nothing is allocated meanwhile
+
+            `bytes_sent` and `bytes_saved` are updated with the data bytes sent and skipped by this refresh
         '''
 
-        self.write_cmd(0xb0)
+        begin = ticks_us()
+        buffer = self.buffer
+        shadow = self._shadow
+        full = not self._shadow_valid
+        row_bytes = self.width // 8
+        sent = 0
+
+        with POLICY.critical():                                                 # No automatic garbage collection during the transfers
+            for page in range(0, 64):
+                start = page * row_bytes
+                end = start + row_bytes
+
+                if(not full):
+                    while(start < end and buffer[start] == shadow[start]):
+                        start += 1
+
+                    if(start == end):
+                        continue
+
+                    start = page * row_bytes
+
+                self.column = 63 - page
+
+                self._address_buf[0] = 0xb0
+                self._address_buf[1] = 0x00 + (self.column & 0x0f)
+                self._address_buf[2] = 0x10 + (self.column >> 4)
+
+                self._write(0, self._address_buf)
+                self._write(1, self._rows[page])
+
+                while(start < end):                                             # Byte by byte, as slicing allocates
+                    shadow[start] = buffer[start]
+
+                    start += 1
+
+                sent += row_bytes
 
-        for page in range(0, 64):
-            self.column = 63 - page
+        self._shadow_valid = True
 
-            self.write_cmd(0x00 + (self.column & 0x0f))
-            self.write_cmd(0x10 + (self.column >> 4))
+        self.bytes_sent = sent
+        self.bytes_saved = len(buffer) - sent
+        self.total_bytes_saved += self.bytes_saved
 
-            for num in range(0, 16):
-                self.write_data(self.buffer[page * 16 + num])
+        FRAME_BYTES.inc(0, sent)
+        FRAME_TIME.observe(ticks_diff(ticks_us(), begin))
 
 
     @staticmethod
@@ -162,26 +235,41 @@ class OLED_1inch3(framebuf.FrameBuffer):
         return framebuf.FrameBuffer(data, width, height, framebuf.MONO_HLSB)
 
 
-    def write_cmd(self, cmd):
+    def _write(self, dc, buf):
         '''!
-            Write command to the OLED display
+            Write a whole buffer to the OLED display
 
-            Sends a command to the OLED display
+            Sends the buffer in a single SPI transaction, without copying it
 
-            @param  cmd         : Command to be sent
+            @param  dc          : Data / command pin value (0 for commands, 1 for data)
+            @param  buf         : Buffer (bytes, bytearray or memoryview) to be sent
         '''
 
         self.cs(1)
 
-        self.dc(0)
+        self.dc(dc)
 
         self.cs(0)
 
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(buf)
 
         self.cs(1)
 
 
+    def write_cmd(self, cmd):
+        '''!
+            Write command to the OLED display
+
+            Sends a command to the OLED display
+
+            @param  cmd         : Command to be sent
+        '''
+
+        self._cmd_buf[0] = cmd
+
+        self._write(0, self._cmd_buf)
+
+
     def write_data(self, buf):
         '''!
             Write data to the OLED display
@@ -191,12 +279,6 @@ class OLED_1inch3(framebuf.FrameBuffer):
             @param  buf         : Data to be sent
         '''
 
-        self.cs(1)
+        self._cmd_buf[0] = buf
 
-        self.dc(1)
-
-        self.cs(0)
-
-        self.spi.write(bytearray([buf]))
-
-        self.cs(1)
+        self._write(1, self._cmd_buf)
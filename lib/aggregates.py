@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    aggregates
+
+    @file       : aggregates.py
+    @brief      : Multi-resolution measurements aggregates module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+from array import array                                                         # Compact arrays of basic values
+
+
+RESOLUTIONS = (                                                                 # Name, bucket length in seconds and buckets kept
+    ('minute', 60, 60),
+    ('hour', 3600, 24),
+    ('day', 86400, 7),
+)
+
+
+class buckets:
+    _count = None
+    _id = None
+    _max = None
+    _min = None
+    _size = None
+    _sum = None
+
+
+    def __init__(self, size):
+        '''!
+            Class constructor
+
+            Initializes default values of the class, preallocating all the arrays
+
+            @param size                 : Number of buckets kept
+        '''
+
+        self._count = array('I', [0] * size)
+        self._id = array('I', [0] * size)
+        self._max = array('h', [0] * size)
+        self._min = array('h', [0] * size)
+        self._size = size
+        self._sum = array('i', [0] * size)
+
+
+    def add(self, bucket_id, value):
+        '''!
+            Value adder
+
+            Updates the bucket in O(1), reusing its slot if it belonged to an expired bucket. Late values for buckets
+            already expired are ignored
+
+            @param bucket_id            : Bucket identifier (timestamp divided by the bucket length)
+            @param value                : Value to be added, in tenths
+        '''
+
+        i = bucket_id % self._size
+
+        if(self._count[i] and bucket_id < self._id[i]):                       # Late sample of an expired bucket
+            return
+
+        if(self._id[i] != bucket_id or self._count[i] == 0):
+            self._id[i] = bucket_id
+            self._count[i] = 1
+            self._max[i] = value
+            self._min[i] = value
+            self._sum[i] = value
+
+        else:
+            self._count[i] += 1
+            self._sum[i] += value
+
+            if(value > self._max[i]):
+                self._max[i] = value
+
+            if(value < self._min[i]):
+                self._min[i] = value
+
+
+    def bucket(self, bucket_id):
+        '''!
+            Bucket observer
+
+            @param bucket_id            : Bucket identifier
+
+            @return                     : A tuple (`min`, `max`, `sum`, `count`), in tenths, or `None` if there is no
+                                          data for the bucket
+        '''
+
+        i = bucket_id % self._size
+
+        if(self._id[i] == bucket_id and self._count[i]):
+            return self._min[i], self._max[i], self._sum[i], self._count[i]
+
+        else:
+            return None
+
+
+    def window(self, bucket_id):
+        '''!
+            Window observer
+
+            Combines every bucket kept, up to the given one
+
+            @param bucket_id            : Last bucket identifier of the window
+
+            @return                     : A tuple (`min`, `max`, `sum`, `count`), in tenths, or `None` if there is no
+                                          data for the window
+        '''
+
+        res = None
+
+        for i in range(self._size):
+            if(self._count[i] and bucket_id - self._size < self._id[i] <= bucket_id):
+                if(res is None):
+                    res = [self._min[i], self._max[i], self._sum[i], self._count[i]]
+
+                else:
+                    res[0] = min(res[0], self._min[i])
+                    res[1] = max(res[1], self._max[i])
+                    res[2] += self._sum[i]
+                    res[3] += self._count[i]
+
+        return tuple(res) if(res is not None) else None
+
+
+class aggregates:
+    _humidity = None
+    _temperature = None
+
+
+    def __init__(self, sensors):
+        '''!
+            Class constructor
+
+            Initializes default values of the class, preallocating the buckets of every sensor and resolution
+
+            @param sensors              : Number of sensors
+        '''
+
+        self._humidity = [[buckets(size) for _, _, size in RESOLUTIONS] for _ in range(sensors)]
+        self._temperature = [[buckets(size) for _, _, size in RESOLUTIONS] for _ in range(sensors)]
+
+
+    def append(self, sensor, timestamp, temperature, humidity):
+        '''!
+            Sample appender
+
+            Updates the current bucket of every resolution in O(1). Values are stored in tenths
+
+            @param sensor               : Sensor index
+            @param timestamp            : Sample time, in seconds
+            @param temperature          : Temperature, or `None` if unknown
+            @param humidity             : Humidity, or `None` if unknown
+        '''
+
+        timestamp = int(timestamp)
+
+        for r, (_, length, _) in enumerate(RESOLUTIONS):
+            if(temperature is not None):
+                self._temperature[sensor][r].add(timestamp // length, round(temperature * 10))
+
+            if(humidity is not None):
+                self._humidity[sensor][r].add(timestamp // length, round(humidity * 10))
+
+
+    def bucket(self, sensor, resolution, timestamp):
+        '''!
+            Bucket observer
+
+            @param sensor               : Sensor index
+            @param resolution           : Resolution index (see `RESOLUTIONS`)
+            @param timestamp            : Any time inside the bucket, in seconds
+
+            @return                     : A tuple (`temperature`, `humidity`) of tuples (`min`, `max`, `sum`, `count`),
+                                          in tenths, or `None` where there is no data
+        '''
+
+        bucket_id = int(timestamp) // RESOLUTIONS[resolution][1]
+
+        return self._temperature[sensor][resolution].bucket(bucket_id), self._humidity[sensor][resolution].bucket(bucket_id)
+
+
+    def sensors(self):
+        '''!
+            Sensors count observer
+
+            @return                     : Number of sensors
+        '''
+
+        return len(self._temperature)
+
+
+    def window(self, sensor, resolution, timestamp):
+        '''!
+            Rolling window observer
+
+            Combines all the buckets kept for the resolution, e.g. the last 24 hours for the hourly one
+
+            @param sensor               : Sensor index
+            @param resolution           : Resolution index (see `RESOLUTIONS`)
+            @param timestamp            : End of the window, in seconds
+
+            @return                     : A tuple (`temperature`, `humidity`) of tuples (`min`, `max`, `sum`, `count`),
+                                          in tenths, or `None` where there is no data
+        '''
+
+        bucket_id = int(timestamp) // RESOLUTIONS[resolution][1]
+
+        return self._temperature[sensor][resolution].window(bucket_id), self._humidity[sensor][resolution].window(bucket_id)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    backlog
+
+    @file       : backlog.py
+    @brief      : Store-and-forward measurements buffer module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+from array import array                                                         # Compact arrays of basic values
+
+
+BACKLOG_SIZE = 512
+NO_VALUE = -32768                                                               # Stored in place of unknown values
+
+
+class backlog:
+    _count = 0
+    _first = 1                                                                  # Sequence number of the oldest record
+    _humidity = None
+    _sensor = None
+    _size = None
+    _temperature = None
+    _time = None
+
+
+    def __init__(self, size = BACKLOG_SIZE):
+        '''!
+            Class constructor
+
+            Initializes default values of the class, preallocating all the buffers
+
+            @param size                 : Maximum number of records kept
+        '''
+
+        self._humidity = array('h', [NO_VALUE] * size)
+        self._sensor = array('B', [0] * size)
+        self._size = size
+        self._temperature = array('h', [NO_VALUE] * size)
+        self._time = array('I', [0] * size)
+
+
+    def acknowledge(self, sequence):
+        '''!
+            Records acknowledger
+
+            Drops every record up to the given sequence number, once the collector stored them
+
+            @param sequence             : Sequence number of the last record received by the collector
+        '''
+
+        if(sequence >= self._first):
+            dropped = min(sequence - self._first + 1, self._count)
+
+            self._first += dropped
+            self._count -= dropped
+
+
+    def append(self, timestamp, sensor, temperature, humidity):
+        '''!
+            Record appender
+
+            Queues a record, dropping the oldest one if the buffer is full. Values are stored in tenths
+
+            @param timestamp            : Sample time, in seconds
+            @param sensor               : Sensor index
+            @param temperature          : Temperature, or `None` if unknown
+            @param humidity             : Humidity, or `None` if unknown
+        '''
+
+        if(self._count == self._size):
+            self._first += 1
+            self._count -= 1
+
+        i = (self._first + self._count) % self._size
+
+        self._time[i] = int(timestamp)
+        self._sensor[i] = sensor
+        self._temperature[i] = round(temperature * 10) if(temperature is not None) else NO_VALUE
+        self._humidity[i] = round(humidity * 10) if(humidity is not None) else NO_VALUE
+
+        self._count += 1
+
+
+    def count(self):
+        '''!
+            Records count observer
+
+            @return                     : Number of queued records
+        '''
+
+        return self._count
+
+
+    def first(self):
+        '''!
+            First sequence number observer
+
+            @return                     : Sequence number of the oldest queued record
+        '''
+
+        return self._first
+
+
+    def records(self, after = 0, limit = None):
+        '''!
+            Records iterator
+
+            @param after                : Only records with a greater sequence number are returned
+            @param limit                : Maximum number of records returned, all if `None`
+
+            @return                     : Generator of tuples (`sequence`, `timestamp`, `sensor`, `temperature`,
+                                          `humidity`), from the oldest to the newest record, with values in tenths
+                                          (`NO_VALUE` if unknown)
+        '''
+
+        start = max(after + 1, self._first)
+        end = self._first + self._count
+
+        if(limit is not None):
+            end = min(end, start + limit)
+
+        for sequence in range(start, end):
+            i = sequence % self._size
+
+            yield sequence, self._time[i], self._sensor[i], self._temperature[i], self._humidity[i]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    buttons
+
+    @file       : buttons.py
+    @brief      : Interrupt-driven buttons manager module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+from array import array                                                         # Compact arrays of basic values
+
+from machine import Pin                                                         # GPIO pins management
+from ticks import ticks_diff, ticks_ms                                          # Millisecond ticks
+
+
+DEBOUNCE = 500                                                                  # Milliseconds ignoring a button after a press
+QUEUE_SIZE = 8                                                                  # Pending events kept, newer ones are dropped when full
+
+
+class buttons:
+    _debounce = None
+    _events = None
+    _head = 0                                                                   # Only modified by the consumer
+    _last = None
+    _pins = None
+    _tail = 0                                                                   # Only modified by the interrupt handler
+
+
+    def __init__(self, pins, debounce = DEBOUNCE, size = QUEUE_SIZE):
+        '''!
+            Class constructor
+
+            Initializes default values of the class, preallocating the events queue, and enables the interrupts of
+            the buttons, active low (pulled up)
+
+            @param pins                 : List of GPIO buttons pins
+            @param debounce             : Milliseconds ignoring a button after a press
+            @param size                 : Maximum number of pending events
+        '''
+
+        self._debounce = debounce
+        self._events = array('B', [0] * (size + 1))                             # One slot is always free, to tell full from empty
+        self._last = [ticks_ms() - debounce] * len(pins)                       # Ticks are small integers, updating them does not allocate
+        self._pins = [Pin(pin, Pin.IN, Pin.PULL_UP) for pin in pins]
+
+        for pin in self._pins:
+            pin.irq(trigger = Pin.IRQ_FALLING, handler = self._handler)
+
+
+    def get(self):
+        '''!
+            Event consumer
+
+            @return                     : Index of the oldest pressed button not consumed yet, or `None` if there are
+                                          no pending events
+        '''
+
+        if(self._head == self._tail):
+            return None
+
+        res = self._events[self._head]
+
+        self._head = (self._head + 1) % len(self._events)
+
+        return res
+
+
+    def _handler(self, pin):
+        '''!
+            Interrupt handler
+
+            Queues a press event, unless the button was pressed less than the debounce time ago (contact bounces).
+            It does not allocate memory
+
+            @param pin                  : Pin which triggered the interrupt
+        '''
+
+        now = ticks_ms()
+
+        for i in range(len(self._pins)):
+            if(self._pins[i] is pin):
+                if(ticks_diff(now, self._last[i]) >= self._debounce):
+                    self._last[i] = now
+
+                    tail = (self._tail + 1) % len(self._events)
+
+                    if(tail != self._head):                                     # Not full
+                        self._events[self._tail] = i
+
+                        self._tail = tail
+
+                break
+
+
+    def pressed(self, button):
+        '''!
+            Button state observer
+
+            @param button               : Button index
+
+            @return                     : Whether the button is currently pressed
+        '''
+
+        return not self._pins[button].value()
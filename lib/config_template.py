@@ -9,19 +9,31 @@
     @brief      : Config class
 
     @author     : Veltys
-    @date       : 2025-03-17
-    @version    : 1.6.0
+    @date       : 2026-10-18
+    @version    : 1.7.0
     @usage      : (imported when needed)
     @note       : ...
 '''
 
 
 class config(object):
+    alloc_monitor = False                                                       # Measure and report the heap allocations of every task
+    async_server = True                                                         # Serve concurrent clients with asyncio, as soon as they are ready, instead of polling for them
+    backlog_size = 512                                                          # Readings queued while offline, for /backlog
     buttons_pins = [15, 17]
     dst = True
 #   leds_pins = ['LED']
+    dht11_interval = 1000                                                       # Minimum milliseconds between DHT11 readings
     dht11_pins = [2, 13]
+    dht22_interval = 2000                                                       # Minimum milliseconds between DHT22 readings
     dht22_pins = [4]
+    gc_threshold = 8192                                                         # Bytes allocated before collecting the garbage in idle slots, None to let it run on its own
+    history_size = 120                                                          # Samples kept per sensor for /history
+    log_directory = None                                                        # Directory of the persistent measurements log (e.g. '/log'), None to disable it
+    ntp_period = 3600                                                           # Seconds between clock synchronizations
+    sampling_period = 2                                                         # Seconds between readings of each sensor
+    sampling_periods = None                                                     # Seconds between readings, per sensor (overrides sampling_period)
     screen = True
+    server_port = 80
     wifi_ssid = 'YOUR_WIFI_SSID'
     wifi_password = 'YOUR_WIFI_PASSWORD'
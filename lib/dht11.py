@@ -9,8 +9,8 @@
     @brief		: DHT11 sensor manager module
 
     @author		: Veltys
-    @date		: 2023-12-18
-    @version	: 2.0.0
+    @date		: 2026-10-18
+    @version	: 2.1.0
     @usage		: (imported when needed)
     @note		: ...
 '''
@@ -22,6 +22,8 @@ from machine import Pin
 
 
 class dht11(dht_sensor):
+    MIN_INTERVAL = 1000															# Minimum milliseconds between readings
+
     _humidity = None
     _sensor = None
     _temperature = None
@@ -9,31 +9,65 @@
     @brief		: Generic DHT11/22 sensor manager module
 
     @author		: Veltys
-    @date		: 2023-12-18
-    @version	: 2.0.0
+    @date		: 2026-10-18
+    @version	: 2.1.0
     @usage		: (imported when needed)
     @note		: ...
 '''
 
 
+from gc_policy import POLICY													# Garbage collection scheduling
+from metrics import REGISTRY, counter, histogram								# Instrumentation
+from ticks import ticks_diff, ticks_ms, ticks_us								# Millisecond and microsecond ticks
+
+
 class dht_sensor:
+    MIN_INTERVAL = 2000															# Minimum milliseconds between readings
+
+    _failures = None
     _humidity = None
+    _last_attempt = None
+    _last_reading = None
+    _min_interval = None
+    _read_time = None
+    _readings = 0
     _sensor = None
     _temperature = None
+    _valid = False
 
 
-    def __init__(self, pin = None):
+    def __init__(self, pin = None, min_interval = None):
         '''!
             Class constructor
 
             Initializes default values of the class
 
             @param pin					: GPIO sensor pin
+            @param min_interval			: Minimum milliseconds between readings, `MIN_INTERVAL` if not given
         '''
 
+        self._min_interval = min_interval if(min_interval is not None) else self.MIN_INTERVAL
+
         if(pin != None):
             self.sensor(pin)
 
+            self._failures = REGISTRY.register(counter('picotemp_sensor_failures_total', 'Failed sensor readings', 'pin', (pin,)))
+            self._read_time = REGISTRY.register(histogram('picotemp_sensor_read_seconds', 'Successful sensor reading time', label = 'pin', value = pin))
+
+
+    def age(self):
+        '''!
+            Reading age observer
+
+            @return						: Milliseconds since the last successful reading, or `None` if there is none
+        '''
+
+        if(self._last_reading is not None):
+            return ticks_diff(ticks_ms(), self._last_reading)
+
+        else:
+            return None
+
 
     def humidity(self):
         '''!
@@ -48,19 +82,85 @@ class dht_sensor:
     def measure(self):
         '''!
             Measures temperature and humidity
+
+            The sensor is only read if at least the minimum interval passed since the last attempt. Otherwise, or if
+            the reading fails, the last good values are kept (see `age()` and `valid()`). No automatic garbage
+            collection interrupts the reading, as its timing is critical
+
+            @return						: Whether new values were read, or `None` if the sensor was not read because
+                                          the minimum interval did not pass yet
         '''
 
+        res = False
+
         if(self._sensor != None):
-            try:
-                self._sensor.measure()
+            now = ticks_ms()
+
+            if(self._last_attempt is None or ticks_diff(now, self._last_attempt) >= self._min_interval):
+                self._last_attempt = now
+
+                start = ticks_us()
+
+                try:
+                    with POLICY.critical():
+                        self._sensor.measure()
 
-            except Exception:
-                self._temperature = None
-                self._humidity = None
+                except Exception:
+                    self._valid = False
+
+                    if(self._failures is not None):
+                        self._failures.inc()
+
+                else:
+                    if(self._read_time is not None):
+                        self._read_time.observe(ticks_diff(ticks_us(), start))
+
+                    self._temperature = self._sensor.temperature()
+                    self._humidity = self._sensor.humidity()
+                    self._last_reading = now
+                    self._readings += 1
+                    self._valid = True
+
+                    res = True
 
             else:
-                self._temperature = self._sensor.temperature()
-                self._humidity = self._sensor.humidity()
+                res = None
+
+        return res
+
+
+    def min_interval(self):
+        '''!
+            Minimum interval observer
+
+            @return						: Minimum milliseconds between readings
+        '''
+
+        return self._min_interval
+
+
+    def ready_in(self):
+        '''!
+            Readiness observer
+
+            @return						: Milliseconds until the minimum interval since the last reading attempt passes,
+                                          `0` if the sensor can be read now
+        '''
+
+        if(self._last_attempt is None):
+            return 0
+
+        return max(self._min_interval - ticks_diff(ticks_ms(), self._last_attempt), 0)
+
+
+    def readings(self):
+        '''!
+            Successful readings counter observer
+
+            @return						: Number of successful readings since the sensor was configured
+        '''
+
+        return self._readings
 
 
     def temperature(self):
@@ -71,3 +171,13 @@ class dht_sensor:
         '''
 
         return self._temperature
+
+
+    def valid(self):
+        '''!
+            Validity observer
+
+            @return						: Whether the last reading attempt succeeded
+        '''
+
+        return self._valid
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    flash_log
+
+    @file       : flash_log.py
+    @brief      : Append-only binary measurements log module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+import os                                                                       # Filesystem functions
+import struct                                                                   # Binary records packing
+
+
+BATCH_RECORDS = 16
+HEADER_FORMAT = '<4sI'                                                          # Magic, segment sequence number
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b'PTLG'
+NO_VALUE = -32768                                                               # Stored in place of unknown values
+RECORD_FORMAT = '<BIBhh'                                                        # Marker, timestamp, sensor, temperature and humidity (tenths)
+RECORD_MARKER = 0xA5
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+SEGMENT_RECORDS = 1024
+SEGMENTS = 4
+
+
+class flash_log:
+    _batch = None
+    _batch_len = 0
+    _directory = None
+    _position = 0
+    _segment = 0
+    _segment_records = None
+    _segments = None
+    _sequence = 0
+
+
+    def __init__(self, directory, segments = SEGMENTS, segment_records = SEGMENT_RECORDS, batch_records = BATCH_RECORDS):
+        '''!
+            Class constructor
+
+            Initializes default values of the class and recovers the write position from the existing segments,
+            creating the first one if needed
+
+            @param directory            : Directory where the segment files are stored
+            @param segments             : Number of segment files, used round-robin
+            @param segment_records      : Maximum number of records per segment file
+            @param batch_records        : Number of records buffered in RAM before writing them
+        '''
+
+        self._batch = bytearray(RECORD_SIZE * batch_records)
+        self._directory = directory
+        self._segment_records = segment_records
+        self._segments = segments
+
+        try:
+            os.mkdir(directory)
+
+        except OSError:                                                         # Already exists
+            pass
+
+        self._recover()
+
+
+    def append(self, timestamp, sensor, temperature, humidity):
+        '''!
+            Record appender
+
+            Buffers a record, writing the whole batch to flash when it is full
+
+            @param timestamp            : Sample time, in seconds
+            @param sensor               : Sensor index
+            @param temperature          : Temperature, or `None` if unknown
+            @param humidity             : Humidity, or `None` if unknown
+        '''
+
+        struct.pack_into(
+            RECORD_FORMAT,
+            self._batch,
+            self._batch_len,
+            RECORD_MARKER,
+            int(timestamp),
+            sensor,
+            round(temperature * 10) if(temperature is not None) else NO_VALUE,
+            round(humidity * 10) if(humidity is not None) else NO_VALUE
+        )
+
+        self._batch_len += RECORD_SIZE
+
+        if(self._batch_len == len(self._batch)):
+            self.flush()
+
+
+    def _create(self, segment, sequence):
+        '''!
+            Segment creator
+
+            Truncates the segment file (replacing the oldest records, if it was in use) and writes its header, so the
+            records are appended after it
+
+            @param segment              : Segment index
+            @param sequence             : Segment sequence number
+        '''
+
+        with open(self._path(segment), 'wb') as f:
+            f.write(struct.pack(HEADER_FORMAT, MAGIC, sequence))
+
+
+    def flush(self):
+        '''!
+            Batch writer
+
+            Appends the buffered records to the current segment, rotating to the next one when it is full. Segments are
+            only appended to, never overwritten in place, so the filesystem does not copy their already written blocks
+        '''
+
+        written = 0
+
+        while(written < self._batch_len):
+            if(self._position == self._segment_records):
+                self._segment = (self._segment + 1) % self._segments
+                self._sequence += 1
+                self._position = 0
+
+                self._create(self._segment, self._sequence)
+
+            count = min((self._batch_len - written) // RECORD_SIZE, self._segment_records - self._position)
+
+            with open(self._path(self._segment), 'ab') as f:
+                f.write(memoryview(self._batch)[written:written + count * RECORD_SIZE])
+
+            self._position += count
+
+            written += count * RECORD_SIZE
+
+        self._batch_len = 0
+
+
+    def _path(self, segment):
+        '''!
+            Segment path builder
+
+            @param segment              : Segment index
+
+            @return                     : Segment file path
+        '''
+
+        return f"{ self._directory }/{ segment }.bin"
+
+
+    def records(self):
+        '''!
+            Records iterator
+
+            @return                     : Generator of tuples (`timestamp`, `sensor`, `temperature`, `humidity`), from
+                                          the oldest to the newest record, with values in tenths (`NO_VALUE` if
+                                          unknown). Records still in the batch are not included
+        '''
+
+        for sequence, segment in sorted(self._sequences()):
+            with open(self._path(segment), 'rb') as f:
+                f.seek(HEADER_SIZE)
+
+                for _ in range(self._segment_records):
+                    data = f.read(RECORD_SIZE)
+
+                    if(len(data) < RECORD_SIZE or data[0] != RECORD_MARKER):
+                        break
+
+                    yield struct.unpack(RECORD_FORMAT, data)[1:]
+
+
+    def _recover(self):
+        '''!
+            Write position recoverer
+
+            Finds the newest segment from the headers, whose size gives the write position, as records are only
+            appended. A segment ending with a partial record (an interrupted write) is left as it is, and the next
+            records go to a new segment
+        '''
+
+        sequences = self._sequences()
+
+        if(not sequences):
+            self._segment = 0
+            self._sequence = 1
+            self._position = 0
+
+            self._create(self._segment, self._sequence)
+
+        else:
+            self._sequence, self._segment = max(sequences)
+
+            size = os.stat(self._path(self._segment))[6] - HEADER_SIZE            # Size, in MicroPython and CPython
+
+            if(size % RECORD_SIZE == 0):
+                self._position = min(size // RECORD_SIZE, self._segment_records)
+
+            else:                                                               # Interrupted write
+                self._position = self._segment_records
+
+
+    def _sequences(self):
+        '''!
+            Segments sequence numbers reader
+
+            @return                     : List of tuples (`sequence`, `segment`) of the valid segments
+        '''
+
+        res = []
+
+        for segment in range(self._segments):
+            try:
+                with open(self._path(segment), 'rb') as f:
+                    header = f.read(HEADER_SIZE)
+
+            except OSError:                                                     # Missing segment
+                continue
+
+            if(len(header) == HEADER_SIZE):
+                magic, sequence = struct.unpack(HEADER_FORMAT, header)
+
+                if(magic == MAGIC):
+                    res.append((sequence, segment))
+
+        return res
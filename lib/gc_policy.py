@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    gc_policy
+
+    @file       : gc_policy.py
+    @brief      : Garbage collection scheduling module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : Under CPython, memory is freed by reference counting and `gc.mem_alloc()` does not exist, so
+                  collections are never run in idle slots there: only the critical sections are kept
+'''
+
+
+import gc                                                                       # Garbage collector
+
+from metrics import REGISTRY, counter, function, histogram                      # Instrumentation
+from ticks import ticks_diff, ticks_us                                          # Microsecond ticks
+
+try:
+    from gc import mem_alloc, mem_free                                          # MicroPython heap usage
+
+except ImportError:
+    mem_alloc = None
+    mem_free = None
+
+
+THRESHOLD = 8192                                                                # Bytes allocated since the last collection before collecting in an idle slot
+
+
+class gc_policy:
+    _allocated = 0
+    _collections = None
+    _collect_time = None
+    _depth = 0
+    _enabled = True
+    _threshold = None
+
+
+    def __init__(self, threshold = THRESHOLD):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param threshold            : Bytes allocated since the last collection before collecting in an idle slot,
+                                          `None` to disable the policy and let the garbage collector run on its own
+        '''
+
+        self._threshold = threshold
+
+        self._collections = REGISTRY.register(counter('picotemp_gc_collections_total', 'Garbage collections run in idle slots'))
+        self._collect_time = REGISTRY.register(histogram('picotemp_gc_collect_seconds', 'Garbage collection time in idle slots'))
+
+        if(mem_free is not None):
+            REGISTRY.register(function('picotemp_gc_free_bytes', 'Free heap memory', mem_free))
+
+
+    def __enter__(self):
+        '''!
+            Critical section opener
+
+            Disables the automatic garbage collection, if the policy is enabled. Sections can be nested
+        '''
+
+        if(self._threshold is not None):
+            if(self._depth == 0):
+                self._enabled = gc.isenabled()
+
+                gc.disable()
+
+            self._depth += 1
+
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        '''!
+            Critical section closer
+
+            Restores the automatic garbage collection when leaving the outermost section
+        '''
+
+        if(self._depth > 0):
+            self._depth -= 1
+
+            if(self._depth == 0 and self._enabled):
+                gc.enable()
+
+        return False
+
+
+    def critical(self):
+        '''!
+            Critical section observer
+
+            To be used in a `with` statement around timing-sensitive code (sensor readings, SPI transfers...), so no
+            automatic collection interrupts it. The code inside must allocate little memory, as the heap cannot be
+            collected to make room for it
+
+            @return                     : The policy object, as context manager
+        '''
+
+        return self
+
+
+    def idle(self):
+        '''!
+            Idle slot handler
+
+            To be called when there is time to spare (e.g. after a frame is sent, or while the server waits for a
+            client). Collects the garbage if at least `threshold` bytes were allocated since the last collection, and
+            accounts the collection time
+
+            @return                     : Whether the garbage was collected
+        '''
+
+        res = False
+
+        if(self._threshold is not None and self._depth == 0 and mem_alloc is not None):
+            if(mem_alloc() - self._allocated >= self._threshold):
+                start = ticks_us()
+
+                gc.collect()
+
+                self._collect_time.observe(ticks_diff(ticks_us(), start))
+                self._collections.inc()
+
+                self._allocated = mem_alloc()
+
+                res = True
+
+        return res
+
+
+    def threshold(self, threshold = False):
+        '''!
+            Threshold reader / writer
+
+            @param threshold            : Bytes allocated since the last collection before collecting in an idle slot,
+                                          `None` to disable the policy, `False` to read it
+
+            @return                     : Threshold if `threshold` is `False`
+        '''
+
+        if(threshold is False):
+            return self._threshold
+
+        self._threshold = threshold
+
+        return None
+
+
+POLICY = gc_policy()                                                            # Default policy, shared by the drivers and the main loop
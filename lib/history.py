@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    history
+
+    @file       : history.py
+    @brief      : Measurements history ring buffer module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+from array import array                                                         # Compact arrays of basic values
+
+
+HISTORY_SIZE = 120
+NO_VALUE = -32768                                                               # Stored in place of unknown values
+
+
+class history:
+    _count = None
+    _head = None
+    _humidity = None
+    _size = None
+    _temperature = None
+    _time = None
+
+
+    def __init__(self, sensors, size = HISTORY_SIZE):
+        '''!
+            Class constructor
+
+            Initializes default values of the class, preallocating all the buffers
+
+            @param sensors              : Number of sensors
+            @param size                 : Number of samples kept per sensor
+        '''
+
+        self._count = [0] * sensors
+        self._head = [0] * sensors
+        self._humidity = [array('h', [NO_VALUE] * size) for _ in range(sensors)]
+        self._size = size
+        self._temperature = [array('h', [NO_VALUE] * size) for _ in range(sensors)]
+        self._time = [array('I', [0] * size) for _ in range(sensors)]
+
+
+    def append(self, sensor, timestamp, temperature, humidity):
+        '''!
+            Sample appender
+
+            Stores a sample, overwriting the oldest one if the buffer is full. Values are stored in tenths
+
+            @param sensor               : Sensor index
+            @param timestamp            : Sample time, in seconds
+            @param temperature          : Temperature, or `None` if unknown
+            @param humidity             : Humidity, or `None` if unknown
+        '''
+
+        head = self._head[sensor]
+
+        self._time[sensor][head] = int(timestamp)
+        self._temperature[sensor][head] = round(temperature * 10) if(temperature is not None) else NO_VALUE
+        self._humidity[sensor][head] = round(humidity * 10) if(humidity is not None) else NO_VALUE
+
+        self._head[sensor] = (head + 1) % self._size
+
+        if(self._count[sensor] < self._size):
+            self._count[sensor] += 1
+
+
+    def count(self, sensor):
+        '''!
+            Sample count observer
+
+            @param sensor               : Sensor index
+
+            @return                     : Number of samples stored for the sensor
+        '''
+
+        return self._count[sensor]
+
+
+    def samples(self, sensor):
+        '''!
+            Samples iterator
+
+            @param sensor               : Sensor index
+
+            @return                     : Generator of tuples (`timestamp`, `temperature`, `humidity`), from the oldest
+                                          to the newest sample, with values in tenths (`NO_VALUE` if unknown)
+        '''
+
+        count = self._count[sensor]
+        start = (self._head[sensor] - count) % self._size
+
+        for i in range(count):
+            j = (start + i) % self._size
+
+            yield self._time[sensor][j], self._temperature[sensor][j], self._humidity[sensor][j]
+
+
+    def sensors(self):
+        '''!
+            Sensors count observer
+
+            @return                     : Number of sensors
+        '''
+
+        return len(self._count)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    layout
+
+    @file       : layout.py
+    @brief      : Retained-mode screen layout module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+import framebuf
+
+
+CHAR_HEIGHT = 8
+CHAR_WIDTH = 8
+
+
+class field:
+    def __init__(self, kind, x, y, width, height, centered = False):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param kind                 : Field kind ('image' or 'text')
+            @param x                    : Horizontal position of the field region
+            @param y                    : Vertical position of the field region
+            @param width                : Width of the field region
+            @param height               : Height of the field region
+            @param centered             : Whether text must be centered inside the region
+        '''
+
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.centered = centered
+        self.value = None
+
+
+    def draw(self, display, value):
+        '''!
+            Field painter
+
+            Clears the field region and draws the new value on it. `None` values leave the region blank
+
+            @param display              : Display (FrameBuffer) to paint on
+            @param value                : Image (FrameBuffer) or text to be drawn
+        '''
+
+        display.fill_rect(self.x, self.y, self.width, self.height, 0)
+
+        if(value is not None):
+            if(self.kind == 'image'):
+                display.blit(value, self.x, self.y)
+
+            elif(self.centered):
+                display.text(value, self.x + (self.width - len(value) * CHAR_WIDTH) // 2, self.y, 1)
+
+            else:
+                display.text(value, self.x, self.y, 1)
+
+        self.value = value
+
+
+class layout:
+    _base = None
+    _base_fb = None
+    _display = None
+    _fields = None
+    _valid = False
+
+
+    def __init__(self, display):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param display              : Display (FrameBuffer with `buffer`, `width` and `height`) to be managed
+        '''
+
+        self._display = display
+        self._base = bytearray(len(display.buffer))
+        self._base_fb = framebuf.FrameBuffer(self._base, display.width, display.height, framebuf.MONO_HMSB)
+        self._fields = {}
+
+
+    def image_field(self, name, x, y, width, height):
+        '''!
+            Dynamic image field declarer
+
+            @param name                 : Field name, used in `set()`
+            @param x                    : Horizontal position of the field region
+            @param y                    : Vertical position of the field region
+            @param width                : Width of the image
+            @param height               : Height of the image
+        '''
+
+        self._fields[name] = field('image', x, y, width, height)
+
+
+    def invalidate(self):
+        '''!
+            Layout invalidator
+
+            Forces the next call to `set()` to restore the static layer and redraw every field,
+            e.g. after the display buffer has been overwritten
+        '''
+
+        self._valid = False
+
+
+    def set(self, name, value):
+        '''!
+            Field painter
+
+            Paints a single field value on the display buffer, without building a dictionary of values, so nothing is
+            allocated when called on every screen tick. The field is redrawn only if its value changed. If the layout
+            is not valid, the static layer is copied in with a single blit and every field is restored first
+
+            @param name                 : Field name
+            @param value                : Field value
+
+            @return                     : Whether the display buffer was modified
+        '''
+
+        display = self._display
+        changed = False
+
+        if(not self._valid):
+            display.blit(self._base_fb, 0, 0)
+
+            for f in self._fields.values():
+                f.draw(display, f.value)
+
+            self._valid = True
+
+            changed = True
+
+        f = self._fields[name]
+
+        if(value != f.value):
+            f.draw(display, value)
+
+            changed = True
+
+        return changed
+
+
+    def static_image(self, image, x, y):
+        '''!
+            Static image painter
+
+            @param image                : Image (FrameBuffer) to be drawn on the static layer
+            @param x                    : Horizontal position
+            @param y                    : Vertical position
+        '''
+
+        self._base_fb.blit(image, x, y)
+
+        self._valid = False
+
+
+    def static_rect(self, x, y, width, height):
+        '''!
+            Static filled rectangle painter
+
+            @param x                    : Horizontal position
+            @param y                    : Vertical position
+            @param width                : Rectangle width
+            @param height               : Rectangle height
+        '''
+
+        self._base_fb.fill_rect(x, y, width, height, 1)
+
+        self._valid = False
+
+
+    def static_text(self, text, y, x = None):
+        '''!
+            Static text painter
+
+            @param text                 : Text to be drawn on the static layer
+            @param y                    : Vertical position
+            @param x                    : Horizontal position, or `None` to center it on the display
+        '''
+
+        if(x is None):
+            x = (self._display.width - len(text) * CHAR_WIDTH) // 2
+
+        self._base_fb.text(text, x, y, 1)
+
+        self._valid = False
+
+
+    def text_field(self, name, x, y, width, centered = False):
+        '''!
+            Dynamic text field declarer
+
+            @param name                 : Field name, used in `set()`
+            @param x                    : Horizontal position of the field region
+            @param y                    : Vertical position of the field region
+            @param width                : Width of the field region
+            @param centered             : Whether text must be centered inside the region
+        '''
+
+        self._fields[name] = field('text', x, y, width, CHAR_HEIGHT, centered)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    metrics
+
+    @file       : metrics.py
+    @brief      : Instrumentation counters and histograms module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : Metrics preallocate their values, so updating them does not allocate memory (as long as the values
+                  fit in small integers). They are rendered in the Prometheus text exposition format
+'''
+
+
+from array import array                                                         # Compact arrays of basic values
+
+
+LATENCY_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000)   # Microseconds
+
+
+class counter:
+    help = None
+    labels = None
+    name = None
+    _values = None
+
+
+    def __init__(self, name, help, label = None, values = None):
+        '''!
+            Class constructor
+
+            Initializes default values of the class, preallocating one value per label value
+
+            @param name                 : Metric name
+            @param help                 : Metric description
+            @param label                : Label name, `None` for an unlabelled counter
+            @param values               : Tuple of label values
+        '''
+
+        self.help = help
+        self.labels = tuple(f"{{{ label }=\"{ value }\"}}" for value in values) if(label is not None) else ('',)
+        self.name = name
+        self._values = array('I', [0] * len(self.labels))
+
+
+    def inc(self, i = 0, n = 1):
+        '''!
+            Counter incrementer
+
+            @param i                    : Label value index
+            @param n                    : Increment
+        '''
+
+        self._values[i] += n
+
+
+    def lines(self):
+        '''!
+            Exposition lines generator
+
+            @return                     : Generator of sample lines
+        '''
+
+        for label, value in zip(self.labels, self._values):
+            yield f"{ self.name }{ label } { value }"
+
+
+    def type(self):
+        '''!
+            Metric type observer
+
+            @return                     : Prometheus metric type
+        '''
+
+        return 'counter'
+
+
+    def value(self, i = 0):
+        '''!
+            Counter observer
+
+            @param i                    : Label value index
+
+            @return                     : Counter value
+        '''
+
+        return self._values[i]
+
+
+class function:
+    help = None
+    labels = None
+    name = None
+    _function = None
+    _type = None
+
+
+    def __init__(self, name, help, function, type = 'gauge', label = None, value = None):
+        '''!
+            Class constructor
+
+            Initializes default values of the class. The value is taken from a function when rendered, for values
+            already kept elsewhere
+
+            @param name                 : Metric name
+            @param help                 : Metric description
+            @param function             : Function returning the value, or `None` if unknown
+            @param type                 : Prometheus metric type (`gauge` or `counter`)
+            @param label                : Label name, `None` for an unlabelled metric
+            @param value                : Label value
+        '''
+
+        self.help = help
+        self.labels = f"{{{ label }=\"{ value }\"}}" if(label is not None) else ''
+        self.name = name
+        self._function = function
+        self._type = type
+
+
+    def lines(self):
+        '''!
+            Exposition lines generator
+
+            @return                     : Generator of sample lines, empty if the value is unknown
+        '''
+
+        value = self._function()
+
+        if(value is not None):
+            yield f"{ self.name }{ self.labels } { value }"
+
+
+    def type(self):
+        '''!
+            Metric type observer
+
+            @return                     : Prometheus metric type
+        '''
+
+        return self._type
+
+
+class histogram:
+    bounds = None
+    help = None
+    labels = None
+    name = None
+    _counts = None
+    _sum_ms = 0
+    _sum_us = 0                                                                 # Below a millisecond, so the sum stays a small integer for days
+
+
+    def __init__(self, name, help, bounds = LATENCY_BUCKETS, label = None, value = None):
+        '''!
+            Class constructor
+
+            Initializes default values of the class, preallocating one count per bucket
+
+            @param name                 : Metric name, the values being rendered in seconds
+            @param help                 : Metric description
+            @param bounds               : Tuple of increasing buckets upper bounds, in microseconds
+            @param label                : Label name, `None` for an unlabelled histogram
+            @param value                : Label value
+        '''
+
+        self.bounds = bounds
+        self.help = help
+        self.labels = f"{ label }=\"{ value }\"," if(label is not None) else ''
+        self.name = name
+        self._counts = array('I', [0] * (len(bounds) + 1))                      # The last one is the `+Inf` bucket
+
+
+    def lines(self):
+        '''!
+            Exposition lines generator
+
+            @return                     : Generator of sample lines: cumulative buckets, sum and count
+        '''
+
+        total = 0
+
+        for bound, count in zip(self.bounds, self._counts):
+            total += count
+
+            yield f"{ self.name }_bucket{{{ self.labels }le=\"{ bound / 1000000 }\"}} { total }"
+
+        total += self._counts[-1]
+
+        yield f"{ self.name }_bucket{{{ self.labels }le=\"+Inf\"}} { total }"
+
+        labels = f"{{{ self.labels[:-1] }}}" if(self.labels) else ''
+
+        yield f"{ self.name }_sum{ labels } { self._sum_ms / 1000 + self._sum_us / 1000000 }"
+        yield f"{ self.name }_count{ labels } { total }"
+
+
+    def observe(self, value):
+        '''!
+            Observation recorder
+
+            @param value                : Observed value, in microseconds
+        '''
+
+        i = 0
+        last = len(self.bounds)
+
+        while(i < last and value > self.bounds[i]):
+            i += 1
+
+        self._counts[i] += 1
+        self._sum_us += value
+
+        if(self._sum_us >= 1000):
+            self._sum_ms += self._sum_us // 1000
+            self._sum_us %= 1000
+
+
+    def type(self):
+        '''!
+            Metric type observer
+
+            @return                     : Prometheus metric type
+        '''
+
+        return 'histogram'
+
+
+class registry:
+    _metrics = None
+
+
+    def __init__(self):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+        '''
+
+        self._metrics = []
+
+
+    def register(self, metric):
+        '''!
+            Metric register
+
+            Metrics with the same name (e.g. one per sensor) are rendered together
+
+            @param metric               : Metric object (`counter`, `function` or `histogram`)
+
+            @return                     : The metric object
+        '''
+
+        self._metrics.append(metric)
+
+        return metric
+
+
+    def render(self):
+        '''!
+            Exposition builder
+
+            @return                     : Every metric, in the Prometheus text exposition format
+        '''
+
+        lines = []
+        names = []
+
+        for metric in sorted(self._metrics, key = lambda metric: metric.name):
+            if(metric.name not in names):
+                names.append(metric.name)
+
+                lines.append(f"# HELP { metric.name } { metric.help }")
+                lines.append(f"# TYPE { metric.name } { metric.type() }")
+
+            lines.extend(metric.lines())
+
+        lines.append('')
+
+        return '\n'.join(lines)
+
+
+REGISTRY = registry()                                                           # Default registry, served on /metrics
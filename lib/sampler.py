@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    sampler
+
+    @file       : sampler.py
+    @brief      : Staggered sensors sampling scheduler module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+from time import sleep                                                          # Sleep function
+
+from ticks import ticks_add, ticks_diff, ticks_ms                               # Millisecond ticks
+
+
+WAIT_MAX = 20                                                                   # Maximum milliseconds waited for a sensor to be ready, less than a reading takes
+
+
+class sampler:
+    _due = None
+    _next_slot = None
+    _periods = None
+    _sensors = None
+    _slot = None
+
+
+    def __init__(self, sensors, periods):
+        '''!
+            Class constructor
+
+            Initializes default values of the class. Periods shorter than the minimum interval of their sensors are
+            clamped to it. Sensors are spread evenly across the shortest sampling period, each one starting in its own
+            slot
+
+            @param sensors              : List of sensor objects, each supporting `measure()`, which returns `None` if
+                                          it is too soon to read the sensor, `min_interval()` and `ready_in()`
+            @param periods              : Sampling period in milliseconds, common or as a list with one per sensor
+        '''
+
+        now = ticks_ms()
+
+        self._sensors = sensors
+        self._periods = list(periods) if(isinstance(periods, (list, tuple))) else [periods] * len(sensors)
+        self._periods = [max(period, sensor.min_interval()) for period, sensor in zip(self._periods, sensors)]
+        self._slot = min(self._periods) // len(sensors) if(sensors) else 0
+        self._due = [ticks_add(now, i * self._slot) for i, _ in enumerate(sensors)]
+        self._next_slot = now
+
+
+    def next_due(self):
+        '''!
+            Next reading observer
+
+            @return                     : Milliseconds until the next sensor can be read (`0` if it is already due),
+                                          or `None` if there are no sensors
+        '''
+
+        if(not self._sensors):
+            return None
+
+        now = ticks_ms()
+        res = min(ticks_diff(due, now) for due in self._due)
+
+        return max(res, ticks_diff(self._next_slot, now), 0)
+
+
+    def poll(self):
+        '''!
+            Sampling step
+
+            Reads at most one sensor, the most overdue one, and only once its slot begins, so a call never stalls for
+            longer than a single sensor reading. Slots follow each other every `slot()` milliseconds, however late the
+            calls are, so the periods are kept on average. As the calls jitter, and periods may be as short as the
+            minimum intervals of their sensors, it may be too soon for a sensor itself: if it is ready in up to
+            `WAIT_MAX` milliseconds, it is waited for (otherwise, each late reading would delay all the next ones);
+            otherwise, it stays due, to be read in a later call, and the next overdue sensor is read instead
+
+            @return                     : Index of the sensor read, or `None` if none was due
+        '''
+
+        res = None
+
+        now = ticks_ms()
+
+        if(self._sensors and ticks_diff(now, self._next_slot) >= 0):
+            refused = 0                                                         # Bit mask of the sensors refusing to be read
+
+            while(res is None):
+                candidate = None
+                overdue = 0
+
+                for i in range(len(self._due)):                                 # Not `enumerate()`, which allocates
+                    if(not refused & (1 << i) and ticks_diff(now, self._due[i]) >= overdue):
+                        overdue = ticks_diff(now, self._due[i])
+
+                        candidate = i
+
+                if(candidate is None):
+                    break
+
+                wait = self._sensors[candidate].ready_in()
+
+                if(0 < wait <= WAIT_MAX):
+                    sleep(wait / 1000)
+
+                if(self._sensors[candidate].measure() is None):                 # Too soon for the sensor, retried later
+                    refused |= 1 << candidate
+
+                else:
+                    res = candidate
+
+            if(res is not None):
+                self._due[res] = ticks_add(self._due[res], self._periods[res])
+
+                if(ticks_diff(self._due[res], now) < 0):                        # Too late, do not try to catch up
+                    self._due[res] = ticks_add(now, self._periods[res])
+
+                self._next_slot = ticks_add(self._next_slot, self._slot)
+
+                if(ticks_diff(self._next_slot, now) < 0):                       # More than a slot late, do not try to catch up
+                    self._next_slot = now
+
+        return res
+
+
+    def slot(self):
+        '''!
+            Slot length observer
+
+            @return                     : Milliseconds between two sensor readings
+        '''
+
+        return self._slot
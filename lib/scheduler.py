@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    scheduler
+
+    @file       : scheduler.py
+    @brief      : Cooperative periodic tasks scheduler module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : Runs on MicroPython's asyncio (or uasyncio) and on CPython's asyncio. Heap allocations are measured
+                  with `gc.mem_alloc()`, or with `tracemalloc` under CPython
+'''
+
+
+from ticks import ticks_add, ticks_diff, ticks_ms, ticks_us                     # Millisecond and microsecond ticks
+
+try:
+    import asyncio                                                              # Asynchronous I/O
+
+except ImportError:
+    import uasyncio as asyncio                                                  # Asynchronous I/O (older MicroPython versions)
+
+try:
+    from sys import print_exception                                             # MicroPython exceptions printing
+
+except ImportError:
+    from traceback import print_exception                                       # CPython exceptions printing
+
+try:
+    from gc import mem_alloc                                                    # MicroPython heap usage
+
+except ImportError:
+    import tracemalloc                                                          # CPython memory allocations tracing
+
+
+    def mem_alloc():
+        '''!
+            Heap usage observer, for CPython
+
+            Starts tracing the allocations the first time it is called
+
+            @return                     : Bytes allocated
+        '''
+
+        if(not tracemalloc.is_tracing()):
+            tracemalloc.start()
+
+        return tracemalloc.get_traced_memory()[0]
+
+
+class task:
+    alloc_max = 0
+    alloc_runs = 0
+    alloc_total = 0
+    callback = None
+    deadline = None
+    delay = None
+    errors = 0
+    missed = 0
+    name = None
+    period = None
+    runs = 0
+    time_max = 0
+    time_total = 0
+
+
+    def __init__(self, name, period, callback, deadline = None, delay = 0):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param name                 : Task name, for the reports
+            @param period               : Milliseconds between runs
+            @param callback             : Function run periodically, without arguments. It may be a coroutine function
+            @param deadline             : Milliseconds after the due time for each run to finish, `period` if `None`
+            @param delay                : Milliseconds before the first run
+        '''
+
+        self.callback = callback
+        self.deadline = deadline if(deadline is not None) else period
+        self.delay = delay
+        self.name = name
+        self.period = period
+
+
+class scheduler:
+    _alloc = False
+    _running = False
+    _stopped = None
+    _tasks = None
+
+
+    def __init__(self, alloc = False):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param alloc                : Whether the heap allocations of every run are measured (see `allocations()`)
+        '''
+
+        self._alloc = alloc
+        self._tasks = []
+
+
+    def allocations(self):
+        '''!
+            Heap allocations statistics observer
+
+            Runs during which the garbage collector freed memory are not accounted. The runs of coroutine tasks also
+            account what other tasks allocated while they were awaiting
+
+            @return                     : List of tuples (`name`, `runs`, `average`, `max`), one per task, with the
+                                          bytes allocated per run, or an empty list if they are not measured
+        '''
+
+        return [
+            (t.name, t.alloc_runs, t.alloc_total // t.alloc_runs if(t.alloc_runs) else 0, t.alloc_max)
+            for t in self._tasks
+        ] if(self._alloc) else []
+
+
+    def every(self, name, period, callback, deadline = None, delay = 0):
+        '''!
+            Periodic task adder
+
+            Tasks must be added before calling `run()`
+
+            @param name                 : Task name, for the reports
+            @param period               : Milliseconds between runs
+            @param callback             : Function run periodically, without arguments. It may be a coroutine function
+            @param deadline             : Milliseconds after the due time for each run to finish, `period` if `None`
+            @param delay                : Milliseconds before the first run
+
+            @return                     : The task object, with its statistics
+        '''
+
+        res = task(name, period, callback, deadline, delay)
+
+        self._tasks.append(res)
+
+        return res
+
+
+    async def _loop(self, t):
+        '''!
+            Task runner
+
+            Runs the task on its schedule, accounting its execution time, whether it finished after its deadline and,
+            if enabled, its heap allocations. Runs are not caught up if they fall behind, and exceptions are counted
+            and printed without stopping the task
+
+            @param t                    : Task object
+        '''
+
+        due = ticks_add(ticks_ms(), t.delay)
+
+        while(self._running):
+            wait = ticks_diff(due, ticks_ms())
+
+            if(wait > 0):
+                await asyncio.sleep(wait / 1000)
+
+                if(not self._running):
+                    break
+
+            if(self._alloc):
+                allocated = mem_alloc()
+
+            start = ticks_us()
+
+            try:
+                res = t.callback()
+
+                if(hasattr(res, 'send')):                                       # Coroutine
+                    await res
+
+            except Exception as e:                                              # Cancellation is not an `Exception`
+                t.errors += 1
+
+                print(f"Task { t.name } failed:")
+
+                print_exception(e)
+
+            elapsed = ticks_diff(ticks_us(), start)
+            now = ticks_ms()
+
+            if(self._alloc):
+                allocated = mem_alloc() - allocated
+
+                if(allocated >= 0):                                             # Otherwise, a collection ran meanwhile
+                    t.alloc_runs += 1
+                    t.alloc_total += allocated
+
+                    if(allocated > t.alloc_max):
+                        t.alloc_max = allocated
+
+            t.runs += 1
+            t.time_total += elapsed
+
+            if(elapsed > t.time_max):
+                t.time_max = elapsed
+
+            if(ticks_diff(now, due) > t.deadline):
+                t.missed += 1
+
+            due = ticks_add(due, t.period)
+
+            if(ticks_diff(due, now) < 0):                                       # Too late, do not try to catch up
+                due = ticks_add(now, t.period)
+
+
+    def report(self):
+        '''!
+            Statistics observer
+
+            @return                     : List of tuples (`name`, `runs`, `average`, `max`, `missed`, `errors`), one per
+                                          task, with the execution times in microseconds
+        '''
+
+        return [
+            (t.name, t.runs, t.time_total // t.runs if(t.runs) else 0, t.time_max, t.missed, t.errors)
+            for t in self._tasks
+        ]
+
+
+    async def run(self):
+        '''!
+            Scheduler runner
+
+            Runs every task concurrently until `stop()` is called
+        '''
+
+        self._running = True
+        self._stopped = asyncio.Event()
+
+        running = [asyncio.create_task(self._loop(t)) for t in self._tasks]
+
+        await self._stopped.wait()
+
+        for r in running:
+            r.cancel()
+
+        await asyncio.sleep(0)                                                  # Let the tasks finish
+
+
+    def stop(self):
+        '''!
+            Scheduler stopper
+
+            Makes `run()` return. It can be called from any task
+        '''
+
+        self._running = False
+
+        if(self._stopped is not None):
+            self._stopped.set()
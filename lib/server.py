@@ -9,103 +9,262 @@
     @brief      : HTTP server module
 
     @author     : Veltys
-    @date       : 2023-11-25
-    @version    : 1.2.0
+    @date       : 2026-10-18
+    @version    : 2.0.0
     @usage      : (imported when needed)
     @note       : ...
 '''
 
 
-from re import match                                                            # match function for regular expressions
 import socket																	# Socket functions
+import time                                                                     # Time manipulation
+
+from aggregates import RESOLUTIONS                                              # Aggregates resolutions
+from history import NO_VALUE                                                    # Unknown history values
+from metrics import REGISTRY, counter, histogram                                # Instrumentation
+from ticks import ticks_diff, ticks_ms, ticks_us                                # Millisecond and microsecond ticks
+
+try:
+    import asyncio                                                              # Asynchronous I/O
+
+except ImportError:
+    import uasyncio as asyncio                                                  # Asynchronous I/O (older MicroPython versions)
+
+try:
+    import select                                                               # Streams polling
+
+except ImportError:
+    import uselect as select                                                    # Streams polling (older MicroPython versions)
+
+
+BACKLOG_PAGE = 32                                                               # Maximum records per /backlog page
+KEEP_ALIVE_MAX = 10                                                             # Maximum requests per persistent connection
+KEEP_ALIVE_TIMEOUT = 5                                                          # Idle seconds before a persistent connection is closed
+LISTEN_BACKLOG = 5                                                              # Maximum pending connections
+MAX_CONNECTIONS = 4                                                             # Maximum persistent connections
+REQUEST_MAX_SIZE = 1024
+ROUTE_ALL = 'all'
+ROUTE_BACKLOG = 'backlog'
+ROUTE_HISTORY = 'history'
+ROUTE_METRICS = 'metrics'
+ROUTE_NOT_FOUND = 'not_found'
+ROUTE_REDIRECT = 'redirect'
+ROUTE_SENSOR = 'sensor'
+ROUTE_STATS = 'stats'
+SEND_TIMEOUT = 1                                                                # Seconds a response may take to be sent
+SOCKET_TIMEOUT = 30
+STATUSES = ('200', '307', '404')                                                # Status codes, as labels of `REQUESTS`
 
+PARSE_TIME = REGISTRY.register(histogram('picotemp_http_parse_seconds', 'Time parsing and routing HTTP requests'))
+REQUESTS = REGISTRY.register(counter('picotemp_http_requests_total', 'HTTP requests served', 'status', STATUSES))
+SEND_TIME = REGISTRY.register(histogram('picotemp_http_send_seconds', 'Time sending HTTP responses'))
 
-SOCKET_TIMEOUT = 30
+
+class connection:
+    buffer = b''
+    last = 0
+    served = 0
+    socket = None
+
+
+    def __init__(self, socket, now):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param socket               : Client socket, non-blocking
+            @param now                  : Milliseconds ticks of the connection, as its last activity
+        '''
+
+        self.last = now
+        self.socket = socket
 
 
 class server:
+    _aggregates = None
+    _backlog = None
     _bound = False
+    _cache = None
+    _clients = None
+    _connections = 0
+    _history = None
+    _ip = '0.0.0.0'
+    _measures = None
+    _poll = None
+    _poll_timeout = -1
+    _poller = None
+    _port = 80
+    _server = None
     _socket = None
+    _timeout = None
 
-    def __init__(self):
+    def __init__(self, timeout = SOCKET_TIMEOUT, history = None, aggregates = None, backlog = None):
         '''!
             Class constructor
 
             Initializes default values of the class
+
+            @param timeout              : Seconds `accept()` waits for a client, or for data from a connected one
+            @param history              : Measurements history, to be served in `/history`
+            @param aggregates           : Measurements aggregates, to be served in `/stats`
+            @param backlog              : Store-and-forward buffer, to be served in `/backlog`
         '''
 
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._aggregates = aggregates
+        self._backlog = backlog
+        self._cache = {}
+        self._clients = []
+        self._history = history
+        self._measures = []
+        self._timeout = timeout
 
-        self._socket.settimeout(SOCKET_TIMEOUT)
+        self._open()
 
 
-    def accept(self, response, ip):
+    def accept(self, measures = None, ip = None):
         '''!
             Socket accepter
-            
-            @param response             : Plain text response
+
+            Accepts the waiting clients and serves the requests received from the connected ones with the last values
+            set with `update()`, without blocking on any of them: client sockets are non-blocking, and the requests
+            received partially are kept until the next call. Persistent connections are kept open, serving pipelined
+            requests, while there are no more than `MAX_CONNECTIONS` of them, until the client closes them,
+            `KEEP_ALIVE_TIMEOUT` seconds pass without requests or `KEEP_ALIVE_MAX` requests are served. Requests
+            reaching `REQUEST_MAX_SIZE` bytes without the end of their headers are handled with what was received, and
+            the connection is closed afterwards
+
+            @param measures             : Sensors readings, if the values must be updated first (see `update()`)
+            @param ip                   : Server IP address, for redirections
+
+            @return                     : Whether there was any client activity
         '''
 
-        res = None
+        if(measures is not None):
+            self.update(measures, ip)
+
+        res = False
 
         if(self._bound):
-            try:
-                cl, _ = self._socket.accept()
+            if(self._clients):
+                now = ticks_ms()
+                i = len(self._clients) - 1
 
-            except OSError:
-                res = False
+                while(i >= 0):                                                  # Backwards, as closed connections are removed
+                    if(ticks_diff(now, self._clients[i].last) >= KEEP_ALIVE_TIMEOUT * 1000):
+                        self._serve(self._clients[i], True)
 
-            else:
-                request = str(cl.recv(1024).decode()).splitlines()[0]           # Decode, convert to str, split in lines and take the first one
+                    i -= 1
+
+            if(self._ready()):
+                res = True
 
-                matched = match(r".* HTTP/(\d+\.?\d*)", request)
+                try:
+                    cl, _ = self._socket.accept()
 
-                if(matched):
-                    http_version = matched.group(1)
+                except OSError:                                                 # No client waiting, but data from a connected one
+                    pass
 
-                    if(match(r"GET /(?:\?.*)? HTTP/(?:\d+\.?\d*)", request)):
-                        request = request[4:]                                   # Trim the "GET " initial part
+                else:
+                    cl.settimeout(0)
 
-                        matched = match(r"/\?.*sensor=(\d)", request)
+                    self._poller.register(cl, select.POLLIN)
+                    self._clients.append(connection(cl, ticks_ms()))
 
-                        if(matched) and 0 <= int(matched.group(1)) < len(response):
-                            index = int(matched.group(1))
+                i = len(self._clients) - 1
 
-                            cl.send(f"HTTP/{ http_version } 200 OK\r\nContent-type: text/plain\r\n\r\n")
-                            cl.send(str(response[index]) if response[index] is not None else '??')
+                while(i >= 0):
+                    self._serve(self._clients[i], False)
 
-                        else:
-                            index = 0
+                    i -= 1
 
-                            cl.send(f"HTTP/{ http_version } 307 Temporary Redirect\r\nLocation: http://{ ip }/?sensor=0\r\n\r\n")
-                            cl.send(str(response[index]) if response[index] is not None else '??')
+        return res
 
-                    else:
-                        cl.send(f"HTTP/{ http_version } 404 Not Found\r\nContent-type: text/plain\r\n\r\n")
-                        cl.send('404 Error: Not Found')
 
-                else:
-                    pass
+    async def _accept_async(self, reader, writer):
+        '''!
+            Asynchronous client handler
 
-                cl.close()
+            Serves a client with the last values set with `update()`, keeping persistent connections as `accept()`
+            does while there are no more than `MAX_CONNECTIONS` of them
 
-                res = True
+            @param reader               : Client stream reader
+            @param writer               : Client stream writer
+        '''
 
-        else:
-            res = False
+        buffer = b''
+        keep_alive = True
+        served = 0
 
-        return res
+        self._connections += 1
+
+        try:
+            while(keep_alive):
+                end = server.request_end(buffer)
+                truncated = False
+
+                if(end < 0):
+                    if(len(buffer) < REQUEST_MAX_SIZE):
+                        try:
+                            data = await asyncio.wait_for(reader.read(REQUEST_MAX_SIZE), KEEP_ALIVE_TIMEOUT)
+
+                        except asyncio.TimeoutError:
+                            data = b''
+
+                        if(data):
+                            buffer += data
+
+                            continue
+
+                        elif(not buffer or served):
+                            break
+
+                    else:                                                       # Too large, the rest of it is not read
+                        truncated = True
+
+                    end = len(buffer)                                           # Unterminated request
+
+                served += 1
+
+                data, keep_alive = self._handle(buffer[:end], served < KEEP_ALIVE_MAX and self._connections <= MAX_CONNECTIONS and not truncated)
 
+                buffer = buffer[end:]
 
-    def bind(self, ip = '0.0.0.0', port = 80):
+                if(data is None):
+                    break
+
+                start = ticks_us()
+
+                writer.write(data)
+
+                await writer.drain()
+
+                SEND_TIME.observe(ticks_diff(ticks_us(), start))
+
+        except OSError:
+            pass
+
+        finally:
+            self._connections -= 1
+
+            writer.close()
+
+            await writer.wait_closed()
+
+
+    def bind(self, ip = '0.0.0.0', port = 80, backlog = LISTEN_BACKLOG):
         '''!
             Socket binder
 
             @param ip					: Socket IP to be bond
             @param port					: Socket port to be bond
+            @param backlog              : Maximum number of pending connections, accepted one per `accept()` call
         '''
 
         if(server.valid_ip(ip) and port >= 0 and port <= 65535):
+            if(self._socket is None):                                           # Closed, e.g. after losing the WiFi connection
+                self._open()
+
             try:
                 self._socket.bind(socket.getaddrinfo(ip, port)[0][-1])
 
@@ -113,19 +272,698 @@ class server:
                 self._bound = False
 
             else:
-                self._socket.listen(1)
+                self._socket.listen(backlog)
 
                 self._bound = True
 
+                if(port != self._port):                                         # Redirections include it
+                    self._port = port
+
+                    self._cache.clear()
+
         return self._bound
 
 
     def close(self):
         '''!
             Socket closer
+
+            The server can be bound again afterwards, e.g. to a new IP address
+        '''
+
+        while(self._clients):
+            self._disconnect(self._clients[-1])
+
+        if(self._socket is not None):
+            self._socket.close()
+
+            self._poll = None
+            self._poller = None
+            self._socket = None
+
+        if(self._server is not None):
+            self._server.close()
+
+            self._server = None
+
+        self._bound = False
+
+
+    def _disconnect(self, client):
+        '''!
+            Client connection closer
+
+            @param client               : Client connection
+        '''
+
+        self._poller.unregister(client.socket)
+
+        client.socket.close()
+
+        self._clients.remove(client)
+
+
+    def _handle(self, request, keep_alive = False):
+        '''!
+            Request handler
+
+            Responses to the plain text routes are built once per HTTP version, route and connection persistence,
+            and then served from the cache, which is cleared when the readings change (see `update()`)
+
+            @param request              : Raw request, as received
+            @param keep_alive           : Whether the connection may be kept open after this request
+
+            @return                     : A tuple (`response`, `keep_alive`) with the response bytes to be sent, or
+                                          `None` if nothing must be sent, and whether the connection is kept open
+        '''
+
+        start = ticks_us()
+
+        parsed = server.parse_request(request)
+
+        if(parsed is not None):
+            method, path, query, http_version = parsed
+
+            route = self._route(method, path, query)
+
+            PARSE_TIME.observe(ticks_diff(ticks_us(), start))
+            REQUESTS.inc(2 if(route[0] == ROUTE_NOT_FOUND) else 1 if(route[0] == ROUTE_REDIRECT) else 0)
+
+            keep_alive = keep_alive and method == b'GET' and server.keep_alive(request, http_version)
+
+            if(route[0] in (ROUTE_ALL, ROUTE_BACKLOG, ROUTE_HISTORY, ROUTE_METRICS, ROUTE_STATS)):  # Contents change with time, they cannot be cached
+                res = self._render(http_version.decode(), route, keep_alive)
+
+            else:
+                key = (http_version, route, keep_alive)
+
+                res = self._cache.get(key)
+
+                if(res is None):
+                    res = self._render(http_version.decode(), route, keep_alive)
+
+                    self._cache[key] = res
+
+        else:
+            res = None
+            keep_alive = False
+
+        return res, keep_alive
+
+
+    @staticmethod
+    def keep_alive(request, http_version):
+        '''!
+            Connection persistence checker
+
+            HTTP/1.1 connections are persistent unless the client sends `Connection: close`, older ones only if the
+            client sends `Connection: keep-alive`
+
+            @param request              : Raw request, as received
+            @param http_version         : HTTP version of the request, as bytes
+
+            @return                     : Whether the client asks for a persistent connection
+        '''
+
+        res = http_version >= b'1.1'
+
+        start = request.find(b'onnection:')
+
+        while(start > 0):
+            if(request[start - 1] in (0x43, 0x63)):                              # 'C' or 'c'
+                start += 10
+                end = request.find(b'\r', start)
+
+                if(end < 0):
+                    end = len(request)
+
+                value = request[start:end].strip().lower()
+
+                if(value == b'close'):
+                    res = False
+
+                elif(value == b'keep-alive'):
+                    res = True
+
+                break
+
+            start = request.find(b'onnection:', start + 10)
+
+        return res
+
+
+    @staticmethod
+    def parse_request(request):
+        '''!
+            Request line parser
+
+            Parses the request line straight from the received bytes, without decoding them nor using regular
+            expressions
+
+            @param request              : Raw request, as received
+
+            @return                     : A tuple (`method`, `path`, `query`, `http_version`) of bytes, `query`
+                                          being empty if there is none, or `None` if the request line is malformed
+        '''
+
+        end = request.find(b'\n')
+
+        if(end < 0):
+            end = len(request)
+
+        if(end > 0 and request[end - 1] == 0x0d):                               # '\r'
+            end -= 1
+
+        method_end = request.find(b' ', 0, end)
+        version_start = request.rfind(b' HTTP/', 0, end)
+
+        if(method_end <= 0 or version_start < method_end):
+            return None
+
+        # HTTP version: digits, optionally followed by a dot and more digits
+        i = version_start + 6
+        digits = 0
+
+        while(i < end and 0x30 <= request[i] <= 0x39):
+            i += 1
+            digits += 1
+
+        if(digits and i < end and request[i] == 0x2e):                           # '.'
+            i += 1
+
+            while(i < end and 0x30 <= request[i] <= 0x39):
+                i += 1
+
+        if(not digits or i != end):
+            return None
+
+        target_start = method_end + 1
+        query_start = request.find(b'?', target_start, version_start)
+
+        if(query_start < 0):
+            path = request[target_start:version_start]
+            query = b''
+
+        else:
+            path = request[target_start:query_start]
+            query = request[query_start + 1:version_start]
+
+        return request[:method_end], path, query, request[version_start + 6:end]
+
+
+    @staticmethod
+    def query_int(query, name):
+        '''!
+            Query string integer parameter observer
+
+            @param query                : Query string, as bytes
+            @param name                 : Parameter name, as bytes
+
+            @return                     : The integer value of the first `name` parameter, or `None` if it is
+                                          missing or not a valid integer
+        '''
+
+        value = server.query_value(query, name)
+
+        if(value is not None):
+            try:
+                value = int(value)
+
+            except ValueError:
+                value = None
+
+        return value
+
+
+    @staticmethod
+    def query_value(query, name):
+        '''!
+            Query string parameter observer
+
+            @param query                : Query string, as bytes
+            @param name                 : Parameter name, as bytes
+
+            @return                     : The value of the first `name` parameter, as bytes, or `None` if it is missing
+        '''
+
+        start = 0
+        length = len(query)
+
+        while(start < length):
+            end = query.find(b'&', start)
+
+            if(end < 0):
+                end = length
+
+            if(end - start > len(name) and query[start + len(name)] == 0x3d and query.startswith(name, start)):    # '='
+                return query[start + len(name) + 1:end]
+
+            start = end + 1
+
+        return None
+
+
+    def _ready(self):
+        '''!
+            Pending clients checker
+
+            Waits for a client, or for data from a connected one, as long as the socket timeout, without raising (and
+            allocating) an exception if there is none, so the server task does not allocate memory while idle
+
+            @return                     : Whether a client is waiting to be accepted or a connected one sent data
         '''
 
-        self._socket.close()
+        for _ in self._poll(self._poll_timeout):
+            return True
+
+        return False
+
+
+    def _render(self, http_version, route, keep_alive = False):
+        '''!
+            Response builder
+
+            @param http_version         : HTTP version of the request
+            @param route                : Route tuple, as returned by `_route()`
+            @param keep_alive           : Whether the connection is kept open after the response
+
+            @return                     : Complete response bytes
+        '''
+
+        connection = 'keep-alive' if(keep_alive) else 'close'
+
+        if(route[0] == ROUTE_NOT_FOUND):
+            status = '404 Not Found'
+            headers = 'Content-type: text/plain'
+            body = '404 Error: Not Found'
+
+        elif(route[0] == ROUTE_ALL):
+            status = '200 OK'
+            headers = 'Content-type: application/json'
+            body = self._render_json()
+
+        elif(route[0] == ROUTE_BACKLOG):
+            status = '200 OK'
+            headers = 'Content-type: application/json'
+            body = self._render_backlog(*route[1])
+
+        elif(route[0] == ROUTE_HISTORY):
+            status = '200 OK'
+            headers = 'Content-type: application/json'
+            body = self._render_history(route[1])
+
+        elif(route[0] == ROUTE_METRICS):
+            status = '200 OK'
+            headers = 'Content-type: text/plain; version=0.0.4'
+            body = REGISTRY.render()
+
+        elif(route[0] == ROUTE_STATS):
+            status = '200 OK'
+            headers = 'Content-type: application/json'
+            body = self._render_stats(route[1])
+
+        else:
+            body = self._measures[route[1]].get('temperature') if(self._measures) else None
+            body = str(body) if body is not None else '??'
+
+            if(route[0] == ROUTE_SENSOR):
+                status = '200 OK'
+                headers = 'Content-type: text/plain'
+
+            else:
+                status = '307 Temporary Redirect'
+                headers = f"Location: http://{ self._ip }/?sensor=0" if(self._port == 80) else f"Location: http://{ self._ip }:{ self._port }/?sensor=0"
+
+        return f"HTTP/{ http_version } { status }\r\n{ headers }\r\nContent-Length: { len(body) }\r\nConnection: { connection }\r\n\r\n{ body }".encode()
+
+
+    def _render_backlog(self, after, limit):
+        '''!
+            Store-and-forward buffer JSON body builder
+
+            Every record up to `after` is acknowledged (dropped) first. Then up to `limit` of the following records
+            are returned as `[sequence, timestamp, sensor, temperature, humidity]` arrays, along with the number of
+            records still `remaining` after them. Unknown values are `null`
+
+            @param after                : Sequence number of the last record received by the collector, or `None`
+            @param limit                : Maximum number of records returned
+
+            @return                     : Compact JSON body
+        '''
+
+        if(after is not None):
+            self._backlog.acknowledge(after)
+
+        else:
+            after = 0
+
+        records = []
+        last = after
+
+        for sequence, timestamp, sensor, temperature, humidity in self._backlog.records(after, limit):
+            records.append(
+                f'[{ sequence },{ timestamp },{ sensor },'
+                f'{ "null" if temperature == NO_VALUE else temperature / 10 },'
+                f'{ "null" if humidity == NO_VALUE else humidity / 10 }]'
+            )
+
+            last = sequence
+
+        remaining = max(self._backlog.first() + self._backlog.count() - 1 - max(last, self._backlog.first() - 1), 0)
+
+        return f'{{"remaining":{ remaining },"records":[{ ",".join(records) }]}}'
+
+
+    def _render_history(self, sensor):
+        '''!
+            Sensor history JSON body builder
+
+            Each sample is a `[timestamp, temperature, humidity]` array, from the oldest to the newest one. Unknown
+            values are `null`
+
+            @param sensor               : Sensor index
+
+            @return                     : Compact JSON body
+        '''
+
+        samples = []
+
+        for timestamp, temperature, humidity in self._history.samples(sensor):
+            samples.append(
+                f'[{ timestamp },'
+                f'{ "null" if temperature == NO_VALUE else temperature / 10 },'
+                f'{ "null" if humidity == NO_VALUE else humidity / 10 }]'
+            )
+
+        return f'{{"sensor":{ sensor },"samples":[{ ",".join(samples) }]}}'
+
+
+    def _render_json(self):
+        '''!
+            All sensors JSON body builder
+
+            Each sensor is described by its index, type, temperature, humidity, reading age in seconds and validity.
+            Unknown values are `null`
+
+            @return                     : Compact JSON body
+        '''
+
+        now = time.time()
+        sensors = []
+
+        for i, measure in enumerate(self._measures):
+            temperature = measure.get('temperature')
+            humidity = measure.get('humidity')
+            reading_time = measure.get('time')
+
+            sensors.append(
+                f'{{"sensor":{ i },"type":"{ measure.get("type") }",'
+                f'"temperature":{ "null" if temperature is None else temperature },'
+                f'"humidity":{ "null" if humidity is None else humidity },'
+                f'"age":{ "null" if reading_time is None else int(now - reading_time) },'
+                f'"valid":{ "true" if measure.get("valid", temperature is not None and humidity is not None) else "false" }}}'
+            )
+
+        return f'{{"sensors":[{ ",".join(sensors) }]}}'
+
+
+    def _render_stats(self, sensor):
+        '''!
+            Sensor aggregates JSON body builder
+
+            For every resolution, `current` holds the aggregates of the current bucket (e.g. this minute) and
+            `window` those of all the buckets kept (e.g. the last 60 minutes). Each one has the `min`, `max`, `mean`
+            and `count` of the temperature and humidity, or `null` if there is no data
+
+            @param sensor               : Sensor index
+
+            @return                     : Compact JSON body
+        '''
+
+        now = time.time()
+        resolutions = []
+
+        for r, (name, _, _) in enumerate(RESOLUTIONS):
+            current = self._aggregates.bucket(sensor, r, now)
+            window = self._aggregates.window(sensor, r, now)
+
+            resolutions.append(
+                f'"{ name }":{{'
+                f'"current":{{"temperature":{ server._render_aggregate(current[0]) },"humidity":{ server._render_aggregate(current[1]) }}},'
+                f'"window":{{"temperature":{ server._render_aggregate(window[0]) },"humidity":{ server._render_aggregate(window[1]) }}}}}'
+            )
+
+        return f'{{"sensor":{ sensor },{ ",".join(resolutions) }}}'
+
+
+    @staticmethod
+    def _render_aggregate(aggregate):
+        '''!
+            Aggregate JSON builder
+
+            @param aggregate            : A tuple (`min`, `max`, `sum`, `count`), in tenths, or `None`
+
+            @return                     : Compact JSON object, or `null`
+        '''
+
+        if(aggregate is None):
+            return 'null'
+
+        minimum, maximum, total, count = aggregate
+
+        return f'{{"min":{ minimum / 10 },"max":{ maximum / 10 },"mean":{ round(total / count) / 10 },"count":{ count }}}'
+
+
+    def _route(self, method, path, query):
+        '''!
+            Request router
+
+            @param method               : Request method, as bytes
+            @param path                 : Request path, as bytes
+            @param query                : Request query string, as bytes
+
+            @return                     : A route tuple (`route`, `argument`), `argument` being the sensor index, a
+                                          tuple (`after`, `limit`) for the backlog, or `0`
+        '''
+
+        if(method != b'GET'):
+            res = (ROUTE_NOT_FOUND, 0)
+
+        elif(path == b'/all' or (path == b'/' and server.query_value(query, b'format') == b'json')):
+            res = (ROUTE_ALL, 0)
+
+        elif(path == b'/'):
+            index = server.query_int(query, b'sensor')
+
+            if(index is not None and 0 <= index < len(self._measures)):
+                res = (ROUTE_SENSOR, index)
+
+            else:
+                res = (ROUTE_REDIRECT, 0)
+
+        elif(path == b'/backlog' and self._backlog is not None):
+            limit = server.query_int(query, b'limit')
+
+            res = (ROUTE_BACKLOG, (server.query_int(query, b'after'), min(limit, BACKLOG_PAGE) if(limit is not None and limit > 0) else BACKLOG_PAGE))
+
+        elif(path == b'/metrics'):
+            res = (ROUTE_METRICS, 0)
+
+        elif(path == b'/history' and self._history is not None):
+            index = server.query_int(query, b'sensor')
+
+            if(index is not None and 0 <= index < self._history.sensors()):
+                res = (ROUTE_HISTORY, index)
+
+            else:
+                res = (ROUTE_NOT_FOUND, 0)
+
+        elif(path == b'/stats' and self._aggregates is not None):
+            index = server.query_int(query, b'sensor')
+
+            if(index is not None and 0 <= index < self._aggregates.sensors()):
+                res = (ROUTE_STATS, index)
+
+            else:
+                res = (ROUTE_NOT_FOUND, 0)
+
+        else:
+            res = (ROUTE_NOT_FOUND, 0)
+
+        return res
+
+
+    def _open(self):
+        '''!
+            Socket opener
+        '''
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)     # Allow binding again right after closing
+
+        self._socket.settimeout(0)                                              # Waits in `_ready()`, for the clients too
+
+        self._poller = select.poll()
+        self._poller.register(self._socket, select.POLLIN)
+
+        self._poll = getattr(self._poller, 'ipoll', self._poller.poll)          # MicroPython's `ipoll()` does not allocate
+        self._poll_timeout = int(self._timeout * 1000) if(self._timeout is not None) else -1
+
+
+    async def serve(self, ip = '0.0.0.0', port = 80, backlog = LISTEN_BACKLOG):
+        '''!
+            Asynchronous server starter
+
+            Starts serving concurrent clients in the running event loop, instead of using `bind()` and `accept()`.
+            Responses are built from the last values set with `update()`
+
+            @param ip					: Server IP to be bond
+            @param port					: Server port to be bond
+            @param backlog              : Maximum number of pending connections
+
+            @return                     : Successfully bound
+        '''
+
+        if(server.valid_ip(ip) and port >= 0 and port <= 65535):
+            if(self._socket is not None):                                       # The blocking socket is not needed in this mode
+                self._socket.close()
+
+                self._socket = None
+
+            try:
+                self._server = await asyncio.start_server(self._accept_async, ip, port, backlog = backlog)
+
+            except OSError:
+                self._bound = False
+
+            else:
+                self._ip = ip
+
+                self._bound = True
+
+                if(port != self._port):                                         # Redirections include it
+                    self._port = port
+
+                    self._cache.clear()
+
+        return self._bound
+
+
+    def _serve(self, client, expired):
+        '''!
+            Client connection server
+
+            Receives what the client sent, without waiting for it, and serves every complete request received. The
+            connection is closed if the client closed it, if it must not be kept open or if it `expired` (then, an
+            unterminated request received is still handled)
+
+            @param client               : Client connection
+            @param expired              : Whether the connection was idle for `KEEP_ALIVE_TIMEOUT` seconds
+        '''
+
+        closed = expired
+        keep_alive = True
+
+        if(not expired):
+            try:
+                data = client.socket.recv(REQUEST_MAX_SIZE)
+
+            except OSError:                                                     # Nothing received (non-blocking)
+                data = None
+
+            if(data):
+                client.buffer += data
+                client.last = ticks_ms()
+
+            elif(data is not None):                                             # Closed by the client
+                closed = True
+
+        try:
+            while(keep_alive):
+                end = server.request_end(client.buffer)
+                truncated = False
+
+                if(end < 0):
+                    if(len(client.buffer) < REQUEST_MAX_SIZE):
+                        if(not closed):                                         # Wait for the rest of it
+                            return
+
+                        elif(not client.buffer or client.served):
+                            break
+
+                    else:                                                       # Too large, the rest of it is not read
+                        truncated = True
+
+                    end = len(client.buffer)                                    # Unterminated request
+
+                client.served += 1
+
+                data, keep_alive = self._handle(client.buffer[:end], client.served < KEEP_ALIVE_MAX and len(self._clients) <= MAX_CONNECTIONS and not truncated)
+
+                client.buffer = client.buffer[end:]
+
+                if(data is None):
+                    break
+
+                start = ticks_us()
+
+                client.socket.settimeout(SEND_TIMEOUT)
+                client.socket.sendall(data)
+                client.socket.settimeout(0)
+
+                SEND_TIME.observe(ticks_diff(ticks_us(), start))
+
+        except OSError:
+            pass
+
+        self._disconnect(client)
+
+
+    def update(self, measures, ip = None):
+        '''!
+            Response values modifier
+
+            Sets the values to be served and discards the cached responses. The readings are not copied: callers
+            updating them in place must call it again afterwards, and only then, so the responses are not built
+            again while nothing changed
+
+            @param measures             : Sensors readings, as a list of dictionaries with `temperature`, `humidity`,
+                                          `time` (of the last successful reading), `valid` (whether the last
+                                          reading attempt succeeded) and `type` keys
+            @param ip                   : Server IP address, for redirections
+        '''
+
+        if(ip is not None):
+            self._ip = ip
+
+        self._measures = measures
+
+        self._cache.clear()
+
+
+    @staticmethod
+    def request_end(buffer):
+        '''!
+            Request end finder
+
+            @param buffer               : Received bytes, possibly containing several pipelined requests
+
+            @return                     : Position right after the headers of the first request, or `-1` if they
+                                          are not complete yet
+        '''
+
+        end = buffer.find(b'\r\n\r\n')
+
+        if(end >= 0):
+            end += 4
+
+        bare_end = buffer.find(b'\n\n', 0, end if(end >= 0) else len(buffer))
+
+        if(bare_end >= 0):
+            end = bare_end + 2
+
+        return end
 
 
     @staticmethod
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    shared_state
+
+    @file       : shared_state.py
+    @brief      : Double-buffered state sharing between threads module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : ...
+'''
+
+
+try:
+    from collections import namedtuple                                          # Immutable records with named fields
+
+except ImportError:
+    from ucollections import namedtuple                                         # Immutable records with named fields (older MicroPython versions)
+
+
+class shared_state:
+    _back = None
+    _changed = False
+    _fields = None
+    _front = None
+    _snapshot = None
+
+
+    def __init__(self, **values):
+        '''!
+            Class constructor
+
+            Initializes default values of the class and publishes the initial snapshot
+
+            @param values               : Initial value of every field, as keyword arguments
+        '''
+
+        self._fields = tuple(sorted(values))
+        self._snapshot = namedtuple('snapshot', self._fields)
+        self._back = [values[name] for name in self._fields]
+
+        self._changed = True
+
+        self.publish()
+
+
+    def get(self):
+        '''!
+            Snapshot observer
+
+            Lock-free: the returned snapshot is immutable, so it is consistent even if the writer publishes a new one
+            while it is being read
+
+            @return                     : Last published snapshot, with one attribute per field
+        '''
+
+        return self._front
+
+
+    def publish(self):
+        '''!
+            Snapshot publisher
+
+            Copies the back buffer to a new immutable snapshot and makes it visible to the readers with a single
+            reference assignment, which is atomic. Nothing is allocated if no field changed since the last call
+        '''
+
+        if(self._changed):
+            self._changed = False
+
+            self._front = self._snapshot(*self._back)
+
+
+    def set(self, name, value):
+        '''!
+            Field modifier
+
+            Writes the field in the back buffer, which is not visible to the readers until `publish()` is called.
+            Only one thread must write
+
+            @param name                 : Field name
+            @param value                : New field value, immutable (e.g. a tuple instead of a list)
+        '''
+
+        i = self._fields.index(name)
+
+        if(self._back[i] != value):
+            self._back[i] = value
+
+            self._changed = True
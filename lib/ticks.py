@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    ticks
+
+    @file       : ticks.py
+    @brief      : Millisecond and microsecond ticks module
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported when needed)
+    @note       : MicroPython ticks functions, with CPython fallbacks for host-side runs
+'''
+
+
+try:
+    from time import ticks_add, ticks_diff, ticks_ms, ticks_us                  # MicroPython millisecond and microsecond ticks
+
+except ImportError:
+    from time import monotonic_ns
+
+
+    def ticks_add(ticks, delta):
+        '''!
+            Ticks adder
+
+            @param ticks                : Ticks value
+            @param delta                : Milliseconds (or microseconds) to be added
+
+            @return                     : Resulting ticks value
+        '''
+
+        return ticks + delta
+
+
+    def ticks_diff(ticks1, ticks2):
+        '''!
+            Ticks subtractor
+
+            @param ticks1               : Ticks value
+            @param ticks2               : Ticks value to be subtracted
+
+            @return                     : Signed difference, in milliseconds (or microseconds)
+        '''
+
+        return ticks1 - ticks2
+
+
+    def ticks_ms():
+        '''!
+            Ticks observer
+
+            @return                     : Milliseconds elapsed since an arbitrary point in time
+        '''
+
+        return monotonic_ns() // 1000000
+
+
+    def ticks_us():
+        '''!
+            Microsecond ticks observer
+
+            @return                     : Microseconds elapsed since an arbitrary point in time
+        '''
+
+        return monotonic_ns() // 1000
@@ -9,22 +9,53 @@
     @brief		: WiFi connector module
 
     @author		: Veltys
-    @date		: 2025-05-20
-    @version	: 1.4.1
+    @date		: 2026-10-18
+    @version	: 2.0.0
     @usage		: (imported when needed)
     @note		: ...
 '''
 
 
+from random import getrandbits													# Random numbers, for backoff jitter
 from time import sleep															# Sleep function
 
+from metrics import REGISTRY, function                                          # Instrumentation
+from ticks import ticks_add, ticks_diff, ticks_ms                               # Millisecond ticks
 import network                                                                  # Network management
 
 
+BACKOFF_MAX = 60000                                                             # Maximum milliseconds between connection attempts
+BACKOFF_MIN = 1000                                                              # Milliseconds before the first retry
+CONNECT_TIMEOUT = 30000                                                         # Milliseconds waiting for a connection attempt
+LINK_CHECK_PERIOD = 2000                                                        # Milliseconds between link checks while connected
+RSSI_ALPHA = 0.25                                                               # Weight of each new RSSI sample in its moving average
+RSSI_PERIOD = 5000                                                              # Milliseconds between RSSI samples while connected
+RSSI_TTL = 15000                                                                # Milliseconds an RSSI average is valid without new samples
+STATE_BACKOFF = 3                                                               # Waiting to retry after a failed attempt
+STATE_CONNECTED = 2
+STATE_CONNECTING = 1
+STATE_IDLE = 0
+STATE_NAMES = ('IDLE', 'CONNECTING', 'CONNECTED', 'BACKOFF')
+
+
 class wifi:
-    _password	= None
-    _ssid		= None
-    _wlan		= None
+    _attempts			= 0
+    _backoff			= 0
+    _deadline			= None
+    _downtime			= 0
+    _link_checked		= None
+    _link_lost_at		= None
+    _password			= None
+    _reconnects			= 0
+    _rssi				= None
+    _rssi_bars			= None
+    _rssi_due			= None
+    _rssi_sampled		= None
+    _ssid				= None
+    _state				= STATE_IDLE
+    _state_since		= None
+    _state_times		= None
+    _wlan				= None
 
 
     def __init__(self, password = None, ssid = None):
@@ -44,6 +75,13 @@ class wifi:
         if(ssid != None):
             self._ssid = ssid
 
+        self._state_since = ticks_ms()
+        self._state_times = [0] * len(STATE_NAMES)
+
+        REGISTRY.register(function('picotemp_wifi_downtime_seconds_total', 'Time without the WiFi link after losing it', lambda: self.downtime() / 1000, 'counter'))
+        REGISTRY.register(function('picotemp_wifi_reconnects_total', 'WiFi reconnections after losing the link', self.reconnects, 'counter'))
+        REGISTRY.register(function('picotemp_wifi_rssi_dbm', 'Smoothed WiFi RSSI', self.get_rssi))
+
 
     def connect(self):
         '''!
@@ -90,6 +128,39 @@ class wifi:
             return False
 
 
+    def _change_state(self, state):
+        '''!
+            State modifier
+
+            Accounts the time spent in the current state before changing it
+
+            @param state                : New state
+        '''
+
+        now = ticks_ms()
+
+        self._state_times[self._state] += ticks_diff(now, self._state_since)
+
+        self._state = state
+        self._state_since = now
+
+
+    def downtime(self):
+        '''!
+            Downtime observer
+
+            @return                     : Milliseconds spent without the WiFi link after losing it, including the
+                                          current outage
+        '''
+
+        res = self._downtime
+
+        if(self._link_lost_at is not None):
+            res += ticks_diff(ticks_ms(), self._link_lost_at)
+
+        return res
+
+
     def disconnect(self):
         '''!
             Connection disconnector
@@ -113,6 +184,41 @@ class wifi:
             return ''
 
 
+    def reconnects(self):
+        '''!
+            Reconnections observer
+
+            @return                     : Number of times the WiFi link was lost after connecting
+        '''
+
+        return self._reconnects
+
+
+    def state(self):
+        '''!
+            Connection state observer
+
+            @return                     : Current state of the connection state machine (`STATE_*`)
+        '''
+
+        return self._state
+
+
+    def state_times(self):
+        '''!
+            Connection state times observer
+
+            @return                     : List with the milliseconds spent in each state (`STATE_*` indices),
+                                          including the current one
+        '''
+
+        res = list(self._state_times)
+
+        res[self._state] += ticks_diff(ticks_ms(), self._state_since)
+
+        return res
+
+
     def isconnected(self):
         '''!
             Connection checker
@@ -125,28 +231,162 @@ class wifi:
         return self._wlan.isconnected()
 
 
+    def get_bars(self, total_bars):
+        '''!
+            Signal bars observer
+
+            Converts the cached RSSI with `signal_bars()`, only once per RSSI sample
+
+            @param total_bars           : Maximum number of bars to represent the signal strength
+
+            @return                     : An integer (`0` to `total_bars - 1`) representing the number of bars,
+                                          or `-1` if there is no valid RSSI
+        '''
+
+        rssi = self.get_rssi()
+        bars = self._rssi_bars                                                  # Local reference, it may be replaced by other thread
+
+        if(bars is None or bars[0] != total_bars or bars[1] != rssi):
+            bars = (total_bars, rssi, wifi.signal_bars(rssi, total_bars))
+
+            self._rssi_bars = bars
+
+        return bars[2]
+
+
     def get_rssi(self):
         '''!
             RSSI observer
 
-            Gets the Received Signal Strength Indicator (RSSI) of the connected WiFi network
+            Gets the Received Signal Strength Indicator (RSSI) of the connected WiFi network. It is served from the
+            moving average sampled by `poll()` every `RSSI_PERIOD`, so the radio is not queried
 
-            @return                     : The RSSI value in dBm if connected, None otherwise
+            @return                     : The RSSI value in dBm if connected and sampled in the last `RSSI_TTL`
+                                          milliseconds, None otherwise
         '''
 
-        res = None
-
-        if self.isconnected():
-            try:
-                res = self._wlan.status('rssi')
+        rssi = self._rssi
+        sampled = self._rssi_sampled
 
-            except (AttributeError, OSError):
-                res = None
+        if(rssi is not None and sampled is not None and ticks_diff(ticks_ms(), sampled) < RSSI_TTL):
+            return round(rssi)
 
         else:
-            res = None
+            return None
 
-        return res
+
+    def poll(self):
+        '''!
+            Non-blocking connection manager
+
+            Advances the connection state machine without waiting, so it must be called periodically:
+            - `STATE_IDLE`: starts a connection attempt
+            - `STATE_CONNECTING`: waits for the attempt to succeed, fail or time out (`CONNECT_TIMEOUT`)
+            - `STATE_BACKOFF`: waits before retrying, doubling the delay after each failed attempt (from `BACKOFF_MIN`
+              up to `BACKOFF_MAX`) plus a random jitter of up to a quarter of it
+            - `STATE_CONNECTED`: checks the link every `LINK_CHECK_PERIOD`, starting over if it was lost, and samples
+              the RSSI every `RSSI_PERIOD`
+
+            @return                     : WiFi status (`network.STAT_*`), or `False` if there are no credentials
+        '''
+
+        if(self._ssid == None or self._password == None):
+            return False
+
+        now = ticks_ms()
+        status = None
+
+        if(self._state == STATE_IDLE):
+            if(self._wlan is None):
+                self._wlan = network.WLAN(network.STA_IF)
+
+            self._wlan.active(True)
+            self._wlan.connect(self._ssid, self._password)
+
+            self._deadline = ticks_add(now, CONNECT_TIMEOUT)
+
+            self._change_state(STATE_CONNECTING)
+
+        elif(self._state == STATE_CONNECTING):
+            status = self._wlan.status()
+
+            if(status == network.STAT_GOT_IP):
+                self._attempts = 0
+                self._link_checked = now
+                self._rssi = None
+
+                if(self._link_lost_at is not None):                             # Reconnected
+                    self._downtime += ticks_diff(now, self._link_lost_at)
+                    self._link_lost_at = None
+
+                self._change_state(STATE_CONNECTED)
+
+                self._sample_rssi(now)                                          # Available as soon as connected
+
+            elif(status < network.STAT_IDLE or status > network.STAT_GOT_IP or ticks_diff(now, self._deadline) >= 0):
+                self._wlan.disconnect()
+
+                self._backoff = min(BACKOFF_MIN << min(self._attempts, 16), BACKOFF_MAX)
+                self._backoff += getrandbits(16) % (self._backoff // 4 + 1)
+                self._attempts += 1
+                self._deadline = ticks_add(now, self._backoff)
+
+                self._change_state(STATE_BACKOFF)
+
+        elif(self._state == STATE_BACKOFF):
+            if(ticks_diff(now, self._deadline) >= 0):
+                self._change_state(STATE_IDLE)
+
+        elif(self._state == STATE_CONNECTED):
+            if(ticks_diff(now, self._link_checked) >= LINK_CHECK_PERIOD):
+                self._link_checked = now
+
+                status = self._wlan.status()
+
+                if(status != network.STAT_GOT_IP or not self._wlan.isconnected()):  # Link lost, e.g. the AP rebooted
+                    self._wlan.disconnect()
+
+                    self._link_lost_at = now
+                    self._reconnects += 1
+
+                    status = None                                               # Read again after disconnecting
+
+                    self._rssi = None
+
+                    self._change_state(STATE_IDLE)
+
+            else:
+                status = network.STAT_GOT_IP                                    # Checked recently enough
+
+            if(self._state == STATE_CONNECTED and ticks_diff(now, self._rssi_due) >= 0):
+                self._sample_rssi(now)
+
+        if(status is None):
+            status = self._wlan.status() if(self._wlan is not None) else network.STAT_IDLE
+
+        return status
+
+
+    def _sample_rssi(self, now):
+        '''!
+            RSSI sampler
+
+            Queries the radio and updates the exponential moving average of the RSSI, scheduling the next sample
+
+            @param now                  : Current ticks, in milliseconds
+        '''
+
+        try:
+            rssi = self._wlan.status('rssi')
+
+        except (AttributeError, OSError, ValueError):
+            rssi = None
+
+        if(rssi is not None):
+            self._rssi = rssi if(self._rssi is None) else self._rssi + RSSI_ALPHA * (rssi - self._rssi)
+            self._rssi_sampled = now
+
+        self._rssi_due = ticks_add(now, RSSI_PERIOD)
 
 
     @staticmethod
@@ -9,27 +9,41 @@
     @brief      : Main module
 
     @author     : Veltys
-    @date       : 2025-05-20
-    @version    : 2.9.2                                                                     # Do not forget to update version number variable 
+    @date       : 2026-10-18
+    @version    : 3.0.0                                                                     # Do not forget to update version number variable 
     @usage      : python3 main.py | ./main.py
     @note       : ...
 '''
 
 
-import _thread                                                                              # Low-level threads management
 import errno                                                                                # Error codes
 import sys                                                                                  # System-specific parameters and functions
 import time                                                                                 # Time manipulation
 
+from aggregates import aggregates                                                           # Measurements aggregates
+from backlog import backlog                                                                 # Store-and-forward buffer
+from buttons import buttons                                                                 # Interrupt-driven buttons
 from dht11 import dht11                                                                     # DHT11 sensor management
 from dht22 import dht22                                                                     # DHT22 sensor management
+from flash_log import flash_log, NO_VALUE                                                   # Persistent measurements log
+from gc_policy import POLICY, THRESHOLD                                                     # Garbage collection scheduling
+from history import history                                                                 # Measurements history
+from layout import layout                                                                   # Screen layout management
+from sampler import sampler                                                                 # Staggered sensors sampling
+from scheduler import scheduler                                                             # Cooperative periodic tasks scheduler
+from shared_state import shared_state                                                       # Double-buffered state sharing between threads
 # from leds import leds                                                                     # LEDs management
-from machine import Pin                                                                     # GPIO pins management
 from server import server                                                                   # HTTP server
-from wifi import wifi                                                                       # WiFi hardware management
+from wifi import wifi, STATE_BACKOFF, STATE_CONNECTED                                       # WiFi hardware management
 import network                                                                              # Network management
 import ntptime                                                                              # NTP time management
 
+try:
+    import asyncio                                                                          # Asynchronous I/O
+
+except ImportError:
+    import uasyncio as asyncio                                                              # Asynchronous I/O (older MicroPython versions)
+
 
 try:
     from config import config                                                               # Configuration
@@ -43,11 +57,26 @@ if(config.screen):
     from OLED_1inch3 import OLED_1inch3                                                     # OLED screen hardware management
 
 
+ALLOC_MONITOR = getattr(config, 'alloc_monitor', False)
+ASYNC_SERVER = getattr(config, 'async_server', True)
+BACKLOG_SIZE = getattr(config, 'backlog_size', 512)
 DEBUG = False
+DISPLAY_PERIOD = 100                                                                        # Milliseconds between screen ticks
+GC_THRESHOLD = getattr(config, 'gc_threshold', THRESHOLD)
+HISTORY_SIZE = getattr(config, 'history_size', 120)
 HOUR_OFFSET = 0
+LOG_DIRECTORY = getattr(config, 'log_directory', None)
+NTP_PERIOD = getattr(config, 'ntp_period', 3600)
 PBM_HEIGHT = 16
 PBM_WIDTH = 16
-VERSION = '2.9.2'
+READINGS_FIELDS = tuple((f"temperature{ i }", f"humidity{ i }") for i in range(len(config.dht11_pins + config.dht22_pins)))     # `display_state` fields of each sensor
+REPORT_PERIOD = 60                                                                          # Seconds between tasks statistics reports, in debug or allocations monitoring mode
+SAMPLING_PERIOD = getattr(config, 'sampling_period', 2)
+SAMPLING_PERIODS = getattr(config, 'sampling_periods', None)
+SENSORS_POLL_PERIOD = 100                                                                   # Maximum milliseconds between checks for due sensors
+SERVER_PORT = getattr(config, 'server_port', 80)
+SERVER_POLL_PERIOD = 50                                                                     # Milliseconds between checks for new clients, if `ASYNC_SERVER` is not set
+VERSION = '3.0.0'
 WIFI_STAT = {
     network.STAT_IDLE: 'IDLE',
     network.STAT_CONNECTING: 'CONNECTING',
@@ -56,32 +85,47 @@ WIFI_STAT = {
     network.STAT_CONNECT_FAIL: 'CONNECT_FAIL',
     network.STAT_GOT_IP: 'SUCCESS'
 }
+WIFI_POLL_PERIOD = 1                                                                        # Seconds between WiFi connection state machine steps
 
 
 bound = None
+bound_once = False
 connection = None
+display_state = None
 do_exit = [ False, False ]
 ip = '0.0.0.0'
 measures = []
+measures_aggregates = aggregates(len(config.dht11_pins + config.dht22_pins))
+measures_backlog = backlog(BACKLOG_SIZE)
+measures_history = history(len(config.dht11_pins + config.dht22_pins), HISTORY_SIZE)
+measures_log = None
+tasks_scheduler = None
 uptime_initial = None
 
 for i, _ in enumerate(config.dht11_pins + config.dht22_pins):
     measures.append({
         'humidity': None,
+        'readings': 0,
         'temperature': None,
+        'time': None,
+        'valid': False,
+        'type': 'DHT11' if(i < len(config.dht11_pins)) else 'DHT22',
     })
 
+display_state = shared_state(bound = bound, ip = ip, uptime_initial = uptime_initial, **{name: None for names in READINGS_FIELDS for name in names})
+
 
 def global_exit():
     '''!
         Sets the global exit flags to terminate the program execution
 
         This function updates the global `do_exit` list, setting both indices to `True`,
-        signaling that the program should exit
+        signaling that the program should exit, and stops the tasks scheduler
 
         If `DEBUG` is enabled, it prints the current status of `do_exit` before updating it
 
         @global do_exit             : List containing exit flags
+        @global tasks_scheduler     : Tasks scheduler
     '''
 
     global do_exit
@@ -100,29 +144,30 @@ Status:
     do_exit[0] = True
     do_exit[1] = True
 
+    if(tasks_scheduler is not None):
+        tasks_scheduler.stop()
+
 
-def button_event(buttons, oled, screen_on):
+def button_event(button, oled, screen_on):
     '''!
         Handles button press events to control the OLED screen and exit the program
 
-        This function listens for button presses and performs the following actions:
-        - If `buttons[0]` is pressed, it toggles the OLED screen state (on/off)
-        - If `buttons[1]` is pressed, it triggers the `global_exit()` function to terminate the program
+        This function performs the following actions, depending on the button pressed:
+        - If it is the first one, it toggles the OLED screen state (on/off)
+        - If it is the second one, it triggers the `global_exit()` function to terminate the program
 
         If `DEBUG` is enabled, the function prints messages indicating the actions performed
 
-        @param buttons              : List containing the button objects (two expected).
+        @param button               : Index of the pressed button, from its event (see `buttons.get()`)
         @param oled                 : OLED display object used for controlling the screen.
         @param screen_on            : Current state of the screen (True for on, False for off).
 
         @return                     : The updated state of the screen (`screen_on`).
     '''
 
-    if(not buttons[0].value()):
+    if(button == 0):
         screen_on = not screen_on
 
-        time.sleep(0.5)
-
         if(screen_on):
             if (DEBUG):
                 print('Switching screen on 💡')
@@ -138,7 +183,7 @@ def button_event(buttons, oled, screen_on):
             oled.fill(0xFFFF)
             oled.write_cmd(0xAE)
 
-    elif (not (buttons[1].value())):
+    elif (button == 1):
         if (DEBUG):
             print('Bye, bye 👋🏼')
 
@@ -147,7 +192,7 @@ def button_event(buttons, oled, screen_on):
     return screen_on
 
 
-def determine_image_number(i, total_ip, total_server):
+def determine_image_number(i, total_ip, total_server, ip, bound):
     '''!
         Determines the appropriate WiFi and server status images to display
 
@@ -169,56 +214,51 @@ def determine_image_number(i, total_ip, total_server):
         @param i                    : Current tick count (used for cycling through images)
         @param total_ip             : Number of images available for the WiFi animation
         @param total_server         : Number of images available for the server animation
+        @param ip                   : Current IP address string
+        @param bound                : Server connection status
 
         @return                     : A tuple containing:
-                                      - The WiFi image index (`res[0]`), which cycles when connecting
-                                      - The server image index (`res[1]`), which cycles if bound is active
+                                      - The WiFi image index, which cycles when connecting
+                                      - The server image index, which cycles if bound is active
     '''
 
-    # global bound
     # global connection
-    # global ip
-
-    res = []
 
     if(ip == '0.0.0.0'):
-        res.append(i % total_ip)
+        wifi_image_number = i % total_ip
 
     elif(ip == 'WiFi Error'):
-        res.append(-1)
+        wifi_image_number = -1
 
     else:
-        wifi_rssi = connection.get_rssi()
-
         if(DEBUG):
-            print(f"wifi_rssi = { wifi_rssi }")
+            print(f"wifi_rssi = { connection.get_rssi() }")
 
-        wifi_bars = wifi.signal_bars(wifi_rssi, total_ip)
+        wifi_image_number = connection.get_bars(total_ip)                       # Cached, the radio is not queried
 
         if(DEBUG):
-            print(f"wifi_bars = { wifi_bars }")
+            print(f"wifi_bars = { wifi_image_number }")
 
-        res.append(wifi_bars)
-        # res.append(total_ip - 1)
+        # wifi_image_number = total_ip - 1
 
     if(bound is not None and bound):
-        res.append(i % total_server)
+        server_image_number = i % total_server
 
     else:
-        res.append(-1)
+        server_image_number = -1
 
     if(DEBUG):
-        print(f"wifi_image_number = { res[0] }, server_image_number = { res[1] }")
+        print(f"wifi_image_number = { wifi_image_number }, server_image_number = { server_image_number }")
 
-    return res[0], res[1]
+    return wifi_image_number, server_image_number
 
 
-def determine_uptime():
+def determine_uptime(uptime_initial):
     '''!
         Calculates the system uptime since initialization
 
-        This function computes the elapsed time since the system started, based on the
-        global variable `uptime_initial`. It returns a formatted string indicating the
+        This function computes the elapsed time since the system started, based on
+        `uptime_initial`. It returns a formatted string indicating the
         uptime in days, hours, minutes, and seconds
 
         - If `uptime_initial` is set, it calculates the difference between the current time
@@ -226,12 +266,12 @@ def determine_uptime():
         - The time is formatted as `Up: X d HH:MM:SS`
         - If `uptime_initial` is `None`, it returns `None`
 
+        @param uptime_initial       : Timestamp of system start, or `None` if not known yet
+
         @return                     : A formatted string representing the uptime (`Up: X d HH:MM:SS`),
                                       or `None` if `uptime_initial` is not set
     '''
 
-    # global uptime_initial
-
     if(uptime_initial is not None):
         uptime_diff = time.time() - uptime_initial
 
@@ -254,21 +294,18 @@ def get_measures(sensors):
         This function iterates through the given list of sensor objects, triggers a measurement,
         and updates the global `measures` list with the latest humidity and temperature values
 
-        - Calls `measure()` on each sensor to refresh the readings
-        - Stores the humidity and temperature values in `measures[i]`
+        - Calls `measure()` on each sensor to refresh the readings (sensors read too soon keep their last good values)
+        - Stores the readings in `measures[i]` (see `store_measure()`)
 
         @param sensors              : List of sensor objects, each supporting `measure()`, `humidity()`, and `temperature()` methods.
 
         @global measures            : A list where each index corresponds to a sensor's readings.
     '''
 
-    global measures
-
     for i, sensor in enumerate(sensors):
         sensor.measure()
 
-        measures[i]['humidity'] = sensor.humidity()
-        measures[i]['temperature'] = sensor.temperature()
+        store_measure(i, sensor)
 
 
 def get_temperature_humidity():
@@ -282,368 +319,631 @@ def get_temperature_humidity():
         - The sensor index is calculated dynamically to provide a smooth rotation
 
         The returned function:
-        - Retrieves temperature and humidity from the selected sensor
+        - Retrieves temperature and humidity from the selected sensor readings
         - Formats them for display, ensuring leading zeros for consistent output
         - If no valid reading is available, it substitutes `??`
+        - Returns the same tuple while the sensor and its readings do not change, so the strings are not formatted
+          again on every tick
 
-        @return                     : A function that takes (`i`, `total_ticks`) and returns a tuple (`temperature`, `humidity`)
+        It must be created once, not on every tick
+
+        @return                     : A function that takes (`i`, `total_ticks`, `state`) and returns a tuple (`temperature`, `humidity`)
     '''
 
     # global measures
 
+    last_humidity = None
+    last_index = None
+    last_temperature = None
     num_measures = len(measures)
+    res = None
 
 
-    def inner_function(i, total_ticks):
+    def inner_function(i, total_ticks, state):
         '''!
             Selects a sensor and formats its temperature and humidity for display
 
             @param i                : Current tick count (used to determine the active sensor)
             @param total_ticks      : Total ticks in the display cycle
+            @param state            : Snapshot of `display_state`, with the readings of every sensor
 
             @return                 : A tuple (`temperature`, `humidity`) formatted as strings
         '''
 
-        # global measures
-
+        nonlocal last_humidity
+        nonlocal last_index
+        nonlocal last_temperature
         nonlocal num_measures
+        nonlocal res
 
         max_portion = 10
         max_ticks_per_sensor = total_ticks // max_portion                               # Calculate the maximum number of ticks per sensor, not to exceed a quarter of total_ticks
         switch_rate = min(total_ticks // num_measures, max_ticks_per_sensor)            # Calculate how often to switch sensors, based on the total number of sensors and the max ticks per sensor
         measures_index = (i // switch_rate) % num_measures                              # Calculate the sensor index based on the current tick
+        sensor_temperature = getattr(state, READINGS_FIELDS[measures_index][0])         # Both from the same reading
+        sensor_humidity = getattr(state, READINGS_FIELDS[measures_index][1])
 
+        if(res is not None and measures_index == last_index and sensor_temperature == last_temperature and sensor_humidity == last_humidity):
+            return res
 
-        if measures[measures_index]['temperature'] is not None:
-            temperature = f"T{ measures_index + 1 }: { '{:0>2}'.format(measures[measures_index]['temperature']) }C"
+        if sensor_temperature is not None:
+            temperature = f"T{ measures_index + 1 }: { '{:0>2}'.format(sensor_temperature) }C"
 
         else:
             temperature = f"T{ measures_index + 1 }: ??C"
 
-        if measures[measures_index]['humidity'] is not None:
-            humidity = f"H{ measures_index + 1 }: {'{:0>2}'.format(measures[measures_index]['humidity']) }%"
+        if sensor_humidity is not None:
+            humidity = f"H{ measures_index + 1 }: {'{:0>2}'.format(sensor_humidity) }%"
 
         else:
             humidity = f"H{ measures_index + 1 }: ??%"
 
-        return temperature, humidity
+        last_humidity = sensor_humidity
+        last_index = measures_index
+        last_temperature = sensor_temperature
+        res = (temperature, humidity)
+
+        return res
 
     return inner_function
 
 
-def paint_screen(oled, wifi_image, server_image, thermometer_image, temperature, humidity, ip, now, uptime):
+def create_layout(oled, thermometer_image):
     '''!
-        Renders the OLED screen with system information
+        Creates the screen layout
+
+        This function declares the static elements of the screen (thermometer icon, separator bar, application name
+        and version), which are rendered once into a cached layer, and the regions of the dynamic fields:
+        - `wifi_image` and `server_image`: WiFi and server status icons
+        - `temperature` and `humidity`: Temperature and humidity readings
+        - `ip`, `now` and `uptime`: IP address, current time and uptime, centered on the screen
+
+        @param oled                 : OLED display object
+        @param thermometer_image    : Image representing the thermometer icon
+
+        @return                     : The layout object
+    '''
+
+    OFFSET_H = 3
+    OFFSET_V = 2
+    RECT_HEIGHT = 2
+    TEXT_HEIGHT = 8
+
+    screen = layout(oled)
+
+    screen.static_image(thermometer_image, 0 * (PBM_WIDTH + OFFSET_H), 0)
+    screen.image_field('wifi_image', 1 * (PBM_WIDTH + OFFSET_H), 0, PBM_WIDTH, PBM_HEIGHT)
+    screen.image_field('server_image', 2 * (PBM_WIDTH + OFFSET_H), 0, PBM_WIDTH, PBM_HEIGHT)
+
+    screen.text_field('temperature', 3 * (PBM_WIDTH + OFFSET_H), 0 * (TEXT_HEIGHT + OFFSET_V), oled.width - 3 * (PBM_WIDTH + OFFSET_H))
+    screen.text_field('humidity', 3 * (PBM_WIDTH + OFFSET_H), 1 * (TEXT_HEIGHT + OFFSET_V), oled.width - 3 * (PBM_WIDTH + OFFSET_H))
+
+    screen.static_rect(0, 2 * (TEXT_HEIGHT + OFFSET_V), oled.width, RECT_HEIGHT)
+
+    screen.text_field('ip', 0, 2 * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.width, True)
+    screen.text_field('now', 0, 3 * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.width, True)
+    screen.text_field('uptime', 0, 4 * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.width, True)
+
+    screen.static_text(f"PicoTemp { VERSION } M", 5 * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V)
+
+    return screen
+
+
+async def manage_network(s):
+    '''!
+        Keeps the WiFi connection and the server up
+
+        Advances the WiFi connection state machine and binds the server once connected, synchronizing the time the
+        first time. If the WiFi link is lost, the server is closed, to be bound again on the new IP address once
+        reconnected (meanwhile, readings are queued in `measures_backlog`, see `store_measure()`). If binding fails,
+        it is tried again in the next call, but for the first binding since boot, which ends the program
+
+        @param s                    : Server object
+
+        @global bound               : Server connection status
+        @global bound_once          : Whether the server was ever bound since boot
+        @global connection          : WiFi connection
+        @global ip                  : Current device IP address
+    '''
+
+    global bound
+    global bound_once
+    global ip
+
+    connected = connection.poll()                                               # Non-blocking
+
+    if(connected == network.STAT_GOT_IP):
+        if(bound is None):
+            ip = connection.ip()
+
+            if(DEBUG):
+                print('WiFi connected 😁')
+                print(f"IP: { ip }")
+
+            if(uptime_initial is None):
+                synchronize_time()
+
+            if(ASYNC_SERVER):
+                bound = await s.serve(ip = ip, port = SERVER_PORT)
+
+            else:
+                bound = s.bind(ip = ip, port = SERVER_PORT)
+
+            if(bound):
+                if(DEBUG):
+                    print('Server bound 👍🏼')
+
+                bound_once = True
+
+                s.update(measures, ip)
+
+            else:
+                if(DEBUG):
+                    print('Cannot bind 👎🏼')
+
+                s.close()
+
+                bound = None                                                    # Tried again in the next call
+
+                if(not bound_once):                                             # Unusable configuration, e.g. the port is taken
+                    global_exit()
+
+    else:
+        if(bound):                                                              # WiFi link lost, bind again once reconnected
+            if(DEBUG):
+                print(f"WiFi link lost, reconnection #{ connection.reconnects() }")
+
+            s.close()
+
+            bound = None
+
+        if(connected is False or connection.state() == STATE_BACKOFF):
+            ip = 'WiFi Error'
+
+            if(DEBUG):
+                print(f"WiFi error: { WIFI_STAT.get(connected, connected) }")
 
-        This function updates the OLED display with various system status indicators, 
-        including temperature, humidity, WiFi signal strength, server status, IP address, 
-        current time, uptime, and the application version
+        else:
+            ip = '0.0.0.0'
+
+            if(DEBUG):
+                print('WiFi connect...')
+
+    publish_state()
+
+
+def paint_screen(oled, screen, wifi_image, server_image, temperature, humidity, ip, now, uptime, bound):
+    '''!
+        Renders the OLED screen with system information
 
-        The layout consists of:
-        - Icons for thermometer, WiFi, and server status
-        - Temperature and humidity readings
-        - A horizontal separator bar
-        - IP address, current time, and uptime centered on the screen
-        - The application name and version at the bottom
+        This function updates the dynamic fields of the screen layout (see `create_layout()`) and refreshes the OLED
+        display. Only the fields whose value changed are redrawn, and only the changed display rows are sent. Fields
+        are set one by one, so no dictionary of values is built on every tick
 
         @param oled                 : OLED display object
+        @param screen               : Screen layout object
         @param wifi_image           : Image representing WiFi status
         @param server_image         : Image representing server status
-        @param thermometer_image    : Image representing the thermometer icon
         @param temperature          : Formatted temperature string (`T1: 25C` or `??C`)
         @param humidity             : Formatted humidity string (`H1: 60%` or `??%`)
         @param ip                   : Current IP address string
         @param now                  : Current time string
         @param uptime               : Uptime string (`Up: X d HH:MM:SS`) or `None` if not available
+        @param bound                : Server connection status
     '''
 
-    OFFSET_H = 3
-    OFFSET_V = 2
-    RECT_HEIGHT = 2
-    TEXT_HEIGHT = 8
+    changed = screen.set('wifi_image', wifi_image)
+    changed |= screen.set('server_image', server_image if(bound is not None) else None)
+    changed |= screen.set('temperature', temperature)
+    changed |= screen.set('humidity', humidity)
+    changed |= screen.set('ip', ip)
+    changed |= screen.set('now', now)
+    changed |= screen.set('uptime', uptime if(uptime is not None) else 'Up: calc...')
 
-    position_h = 0
-    position_v = 0
+    if(changed):
+        oled.show()
 
-    oled.fill(0)                                                                            # Clean screen
 
-    oled.blit(thermometer_image, position_h * (PBM_WIDTH + OFFSET_H), position_v * (PBM_HEIGHT + OFFSET_V))
+def publish_state(i = None):
+    '''!
+        Publishes the values shown on the screen
 
-    position_h += 1
+        Copies the globals owned by the main thread to `display_state` and publishes them at once, so the screen
+        thread never mixes values from different updates (e.g. the temperature of a reading with the humidity of the
+        next one)
 
-    oled.blit(wifi_image, position_h * (PBM_WIDTH + OFFSET_H), position_v * (PBM_HEIGHT + OFFSET_V))
+        @param i                    : Index of the sensor whose readings changed, so they are copied too, or `None`
 
-    position_h += 1
+        @global display_state       : Values shared with the screen thread
+    '''
 
-    if(bound is not None):
-        oled.blit(server_image, position_h * (PBM_WIDTH + OFFSET_H), position_v * (PBM_HEIGHT + OFFSET_V))
+    display_state.set('bound', bound)
+    display_state.set('ip', ip)
 
-    position_h += 1
+    if(i is not None):
+        display_state.set(READINGS_FIELDS[i][0], measures[i]['temperature'])
+        display_state.set(READINGS_FIELDS[i][1], measures[i]['humidity'])
 
-    oled.text(temperature, position_h * (PBM_WIDTH + OFFSET_H), position_v * (PBM_HEIGHT + OFFSET_V), oled.white)
+    display_state.set('uptime_initial', uptime_initial)
 
-    position_v += 1
+    display_state.publish()
 
-    oled.text(humidity, position_h * (PBM_WIDTH + OFFSET_H), position_v * (TEXT_HEIGHT + OFFSET_V), oled.white)
 
-    position_v += 1
+def report_tasks():
+    '''!
+        Prints the execution statistics of the scheduled tasks and, in allocations monitoring mode, the heap memory
+        they allocate per run
 
-    oled.rect(0, position_v * (TEXT_HEIGHT + OFFSET_V), 128, RECT_HEIGHT, oled.white, True)
+        @global tasks_scheduler     : Tasks scheduler
+    '''
 
-    position_v = 2
+    for name, runs, average, maximum, missed, errors in tasks_scheduler.report():
+        print(f"{ name }: { runs } runs, { average } µs average, { maximum } µs max, { missed } missed deadlines, { errors } errors")
 
-    oled.text(ip, int((128 - len(ip) * 8) / 2), position_v * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.white)
+    for name, runs, average, maximum in tasks_scheduler.allocations():
+        print(f"{ name }: { average } B allocated per run on average, { maximum } B max ({ runs } runs measured)")
 
-    position_v += 1
 
-    oled.text(now, int((128 - len(now) * 8) / 2), position_v * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.white)
+def restore_measures():
+    '''!
+        Restores the measurements history and aggregates from the persistent log
 
-    position_v += 1
+        Replays every record of `measures_log`, from the oldest to the newest one, so readings survive reboots
 
-    if(uptime is not None):
-        oled.text(uptime, int((128 - len(uptime) * 8) / 2), position_v * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.white)
+        @global measures_aggregates : Measurements aggregates
+        @global measures_history    : Measurements history
+        @global measures_log        : Persistent measurements log
+    '''
 
-    else:
-        oled.text('Up: calc...', int((128 - 11 * 8) / 2), position_v * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.white)
+    for timestamp, i, temperature, humidity in measures_log.records():
+        if(i < len(measures)):
+            temperature = temperature / 10 if(temperature != NO_VALUE) else None
+            humidity = humidity / 10 if(humidity != NO_VALUE) else None
 
-    position_v += 1
+            measures_history.append(i, timestamp, temperature, humidity)
+            measures_aggregates.append(i, timestamp, temperature, humidity)
+
+
+def sample_measure(s, sensors, sensors_sampler):
+    '''!
+        Reads the next due sensor, if any, and stores its readings
+
+        @param s                    : Server object
+        @param sensors              : List of sensor objects
+        @param sensors_sampler      : Sensors sampling scheduler
+
+        @return                     : Whether a sensor was read
+    '''
 
-    oled.text(f"PicoTemp { VERSION } M", int((128 - 16 * 8) / 2), position_v * (TEXT_HEIGHT + OFFSET_V) + RECT_HEIGHT + OFFSET_V, oled.white)
+    i = sensors_sampler.poll()
 
-    oled.show()
+    if(i is not None and store_measure(i, sensors[i])):
+        s.update(measures)                                                      # The cached responses are outdated
+
+    return i is not None
+
+
+def serve_clients(s):
+    '''!
+        Accepts the waiting client and serves the requests received from the connected ones, if any, without
+        waiting for them (see `server.accept()`)
+
+        While there is no client activity, the garbage is collected if needed (see `gc_policy.idle()`)
+
+        @param s                    : Server object
+    '''
+
+    if(not s.accept()):
+        POLICY.idle()
+
+
+def store_measure(i, sensor):
+    '''!
+        Stores the current readings of a sensor
+
+        Stores the humidity and temperature values in `measures[i]`, along with the time of the last successful
+        reading and whether the last reading attempt succeeded. New successful readings are also appended to
+        `measures_history`, `measures_aggregates` and, if enabled, `measures_log`, and published to the screen. While
+        the server is not bound (e.g. during WiFi outages), they are queued in `measures_backlog` too, to be collected
+        through `/backlog`. Nothing is allocated if there is no new reading
+
+        @param i                    : Sensor index
+        @param sensor               : Sensor object
+
+        @return                     : Whether any stored value changed, so the served values must be updated
+
+        @global measures            : A list where each index corresponds to a sensor's readings.
+        @global measures_aggregates : Measurements aggregates
+        @global measures_backlog    : Store-and-forward buffer
+        @global measures_history    : Measurements history
+        @global measures_log        : Persistent measurements log
+    '''
+
+    global measures
+
+    res = sensor.humidity() != measures[i]['humidity'] or sensor.temperature() != measures[i]['temperature'] or sensor.valid() != measures[i]['valid']
+
+    measures[i]['humidity'] = sensor.humidity()
+    measures[i]['temperature'] = sensor.temperature()
+
+    measures[i]['valid'] = sensor.valid()
+
+    if(sensor.readings() != measures[i]['readings']):
+        res = True
+
+        measures[i]['readings'] = sensor.readings()
+        measures[i]['time'] = time.time() - sensor.age() // 1000
+
+        measures_history.append(i, measures[i]['time'], measures[i]['temperature'], measures[i]['humidity'])
+        measures_aggregates.append(i, measures[i]['time'], measures[i]['temperature'], measures[i]['humidity'])
+
+        if(measures_log is not None):
+            measures_log.append(measures[i]['time'], i, measures[i]['temperature'], measures[i]['humidity'])
+
+        if(not bound):
+            measures_backlog.append(measures[i]['time'], i, measures[i]['temperature'], measures[i]['humidity'])
+
+        publish_state(i)
+
+    return res
 
 
 def screen_buttons_manager():
     '''!
-        Manages screen updates and button interactions in the main loop
+        Creates the screen and buttons tasks
 
         This function:
         - Initializes the OLED display and loads images for WiFi and server status
-        - Monitors buttons for toggling the screen state and exiting the program
+        - Returns the function run periodically by the tasks scheduler (see `main()`) to update the screen, which
+          also handles the buttons events, for toggling the screen state and exiting the program. Buttons presses are
+          queued by interrupts, so they are not polled
         - Cycles through sensor data and updates the screen periodically
-        - Implements automatic screen turn-off after inactivity
+        - Implements automatic screen turn-off after inactivity (`total_ticks` screen ticks without button events)
         - Handles daylight saving time (DST) adjustments (marked as TODO)
 
-        The loop runs while `do_exit[1]` is `False`, iterating through `total_ticks`
-        Each iteration updates sensor readings, retrieves WiFi/server status, and paints the screen
+        Each screen tick takes a snapshot of the values published by the other tasks (IP address, server status,
+        sensor readings and start time, see `publish_state()`), and paints the screen from it
 
-        @global do_exit             : List controlling exit conditions
-        @global ip                  : Current device IP address
-        @global bound               : Server connection status
-        @global measures            : List containing sensor temperature/humidity readings
-        @global uptime_initial      : Timestamp of system start
+        @global display_state       : Values shared with the other tasks
+
+        @return                     : A tuple (`paint`, `switch_off`) with the screen tick and the function to
+                                      switch the screen off before exiting
     '''
 
     NUM_SERVER_IMAGES = 2
     NUM_WIFI_IMAGES = 4
 
-#   global bound
-#   global do_exit
-#   global ip
-#   global measures
-#   global uptime_initial
+#   global display_state
 
-    buttons = [
-        Pin(config.buttons_pins[0], Pin.IN, Pin.PULL_UP),
-        Pin(config.buttons_pins[1], Pin.IN, Pin.PULL_UP),
-    ]
+    get_temp_hum = get_temperature_humidity()
     humidity = None
+    i = 0
     image_error = OLED_1inch3.load_pbm('./resources/error.pbm', PBM_WIDTH, PBM_HEIGHT)
     image_thermometer = OLED_1inch3.load_pbm('./resources/thermometer.pbm', PBM_WIDTH, PBM_HEIGHT)
 #   led = leds(config.leds_pins)
     now = None
-    now_text = ''
+    now_texts = ('', '')                                                                    # Current time, with and without the blinking colon
     oled = OLED_1inch3()
+    screen = create_layout(oled, image_thermometer)
+    screen_buttons = buttons(config.buttons_pins)
     screen_on = True
     server_images = []
     server_image_number = 0
     temperature = None
     total_ticks = 60 * 5
     uptime = ''
+    uptime_seconds = None
     wifi_images = []
     wifi_image_number = 0
 
-    for i in range(1, NUM_WIFI_IMAGES + 1):
-        wifi_images.append(OLED_1inch3.load_pbm(f"./resources/wifi{ i }.pbm", PBM_WIDTH, PBM_HEIGHT))
+    for j in range(1, NUM_WIFI_IMAGES + 1):
+        wifi_images.append(OLED_1inch3.load_pbm(f"./resources/wifi{ j }.pbm", PBM_WIDTH, PBM_HEIGHT))
+
+    for j in range(1, NUM_SERVER_IMAGES + 1):
+        server_images.append(OLED_1inch3.load_pbm(f"./resources/server{ j }.pbm", PBM_WIDTH, PBM_HEIGHT))
 
-    for i in range(1, NUM_SERVER_IMAGES + 1):
-        server_images.append(OLED_1inch3.load_pbm(f"./resources/server{ i }.pbm", PBM_WIDTH, PBM_HEIGHT))
 
+    def paint():
+        '''!
+            Screen tick: handles the pending buttons events (see `button_event()`) and updates the screen, switching
+            it off after `total_ticks` ticks without events
+        '''
 
-    while(not do_exit[1]):
-        for i in range(total_ticks):
+        nonlocal humidity
+        nonlocal i
+        nonlocal now
+        nonlocal now_texts
+        nonlocal screen_on
+        nonlocal server_image_number
+        nonlocal temperature
+        nonlocal uptime
+        nonlocal uptime_seconds
+        nonlocal wifi_image_number
+
+        if(DEBUG):
+            print(f"i = { i }")
+
+        button = screen_buttons.get()
+
+        while(button is not None):
             if(DEBUG):
-                print(f"i = { i }")
+                print(f"Button event detected 😮 (button { button })")
 
-            if(do_exit[1]):
-                if(DEBUG):
-                    print('Exit event detected 👋🏼')
+            screen_on = button_event(button, oled, screen_on)
 
-#               led.off(0)
+            if(screen_on):
+                screen.invalidate()                                                         # Screen buffer may have been overwritten while off
 
-                global_exit()
+            i = 0                                                                           # Restart the inactivity countdown
 
-            if(not(buttons[0].value()) or not(buttons[1].value())):
-                if(DEBUG):
-                    print('Button event detected 😮')
-                    print(
-f'''
-Status:
-    {{ buttons[0].value() ➡ { buttons[0].value() } (screen on / off) }},
-    {{ buttons[1].value() ➡ { buttons[1].value() } (exit) }},
-'''
-                    )
+            button = screen_buttons.get()
 
-                screen_on = button_event(buttons, oled, screen_on)
+        state = display_state.get()                                                         # Consistent for the whole tick
 
-                break
+        # It is necessary to do this calculation always or the connection will fail, I do not know the reason
+        wifi_image_number, server_image_number = determine_image_number(i, NUM_WIFI_IMAGES, NUM_SERVER_IMAGES, state.ip, state.bound)
 
-            # It is necessary to do this calculation always or the connection will fail, I do not know the reason
-            wifi_image_number, server_image_number = determine_image_number(i, NUM_WIFI_IMAGES, NUM_SERVER_IMAGES)
+        if(screen_on):
+#           led.off(0)
 
-            if(screen_on):
-#               led.off(0)
-
-                wifi_image = wifi_images[wifi_image_number] if(wifi_image_number >= 0) else image_error
-                server_image = server_images[server_image_number] if(server_image_number >= 0) else image_error
-                thermometer_image = image_thermometer
-                get_temp_hum = get_temperature_humidity()
-                temperature, humidity = get_temp_hum(i, total_ticks)
-                now = time.localtime(time.time() + HOUR_OFFSET + (HOUR_OFFSET if config.dst else 0)) if(i % 100 == 0) else now   # TODO: DST handling still needed
-                now_text = f"{ '{:0>2}'.format(now[3]) }:{ '{:0>2}'.format(now[4]) } { '{:0>2}'.format(now[2]) }/{ '{:0>2}'.format(now[1]) }/{ now[0] }" if i % 6 in (0, 1, 2) else f"{ '{:0>2}'.format(now[3]) } { '{:0>2}'.format(now[4]) } { '{:0>2}'.format(now[2]) }/{ '{:0>2}'.format(now[1]) }/{ now[0] }"
-                uptime = determine_uptime() if(i % 2 == 0) else uptime
-
-                paint_screen(
-                    oled,
-                    wifi_image,
-                    server_image,
-                    thermometer_image,
-                    temperature,
-                    humidity,
-                    ip,
-                    now_text,
-                    uptime
+            wifi_image = wifi_images[wifi_image_number] if(wifi_image_number >= 0) else image_error
+            server_image = server_images[server_image_number] if(server_image_number >= 0) else image_error
+            temperature, humidity = get_temp_hum(i, total_ticks, state)
+
+            if(i % 100 == 0 or now is None):                                                # Both texts are formatted only when the time is read
+                now = time.localtime(time.time() + HOUR_OFFSET + (HOUR_OFFSET if config.dst else 0))   # TODO: DST handling still needed
+                now_texts = (
+                    f"{ '{:0>2}'.format(now[3]) }:{ '{:0>2}'.format(now[4]) } { '{:0>2}'.format(now[2]) }/{ '{:0>2}'.format(now[1]) }/{ now[0] }",
+                    f"{ '{:0>2}'.format(now[3]) } { '{:0>2}'.format(now[4]) } { '{:0>2}'.format(now[2]) }/{ '{:0>2}'.format(now[1]) }/{ now[0] }"
                 )
 
-            else:
-#               if(i % 10 == 0):
-#                   led.toggle(0)
+            seconds = int(time.time())
 
-                pass
+            if(seconds != uptime_seconds):                                                  # Formatted once per second, not on every tick
+                uptime = determine_uptime(state.uptime_initial)
+                uptime_seconds = seconds
 
-            time.sleep(0.1)
+            paint_screen(
+                oled,
+                screen,
+                wifi_image,
+                server_image,
+                temperature,
+                humidity,
+                state.ip,
+                now_texts[0] if(i % 6 < 3) else now_texts[1],
+                uptime,
+                state.bound
+            )
 
-        if(i >= 60 and screen_on):
-            if(DEBUG):
-                print('Switching screen off 🕯️')
+            POLICY.idle()                                                                   # The frame was sent, there is time until the next tick
 
-            screen_on = False
+        else:
+#           if(i % 10 == 0):
+#               led.toggle(0)
 
-            oled.fill(0xFFFF)
-            oled.write_cmd(0xAE)
+            pass
 
-    oled.fill(0xFFFF)
-    oled.write_cmd(0xAE)
+        i += 1
 
+        if(i == total_ticks):
+            i = 0
 
-def main(argv = sys.argv[1:]): # @UnusedVariable
+            if(screen_on):
+                if(DEBUG):
+                    print('Switching screen off 🕯️')
+
+                screen_on = False
+
+                oled.fill(0xFFFF)
+                oled.write_cmd(0xAE)
+
+
+    def switch_off():
+        '''!
+            Switches the screen off
+        '''
+
+        oled.fill(0xFFFF)
+        oled.write_cmd(0xAE)
+
+
+    return paint, switch_off
+
+
+def synchronize_time():
     '''!
-        Performs the needed operations to work
+        Synchronizes the clock with the NTP server, if connected
 
-        @param argv:    Program arguments
+        The system start time is taken after the first attempt, successful or not, so the clock change does not count
+        as uptime
 
-        @return:        Return code
+        @global uptime_initial      : Timestamp of system start
     '''
 
-    global bound
-    global connection
-    global do_exit
-    global ip
-    global measures
     global uptime_initial
 
-    connected = network.STAT_IDLE
-    connection = wifi(ssid = config.wifi_ssid, password = config.wifi_password)
-    s = server()
-    sensors = [dht11(pin) for pin in config.dht11_pins]
-    sensors += [dht22(pin) for pin in config.dht22_pins]
+    if(connection.state() == STATE_CONNECTED):
+        try:
+            ntptime.settime()
 
-    get_measures(sensors)                                                       # Initial measurement for painting the screen
+        except OSError:
+            pass
 
-    if(config.screen):
-        _thread.start_new_thread(screen_buttons_manager, ())                    # Thread to make screen_buttons_manager
+        if(uptime_initial is None):
+            uptime_initial = time.time()
 
-    time.sleep(1)
 
-    while(not do_exit[0]):
-        if(connected < network.STAT_GOT_IP):
-            connected = connection.connect()
+def main(argv = sys.argv[1:]): # @UnusedVariable
+    '''!
+        Performs the needed operations to work
 
-            if(DEBUG):
-                print('WiFi connect...')
+        Every activity runs as a periodic task of a single cooperative scheduler: WiFi connection and server
+        management, serving clients (only if `ASYNC_SERVER` is not set, as otherwise the event loop itself serves them
+        as soon as they are ready), NTP synchronization, sensors sampling, and, if there is a screen, screen updates
+        and buttons events
 
-        if(connected == network.STAT_GOT_IP):
-            ip = connection.ip()
+        The garbage is collected in idle slots (after screen frames and while no client waits), once `GC_THRESHOLD`
+        bytes were allocated, instead of in the middle of sensor readings or screen transfers
 
-            if(DEBUG):
-                print('WiFi connected 😁')
-                print(f"IP: { ip }")
+        @param argv:    Program arguments
 
-            if(ntptime.host != 'hora.roa.es'):
-                ntptime.host = 'hora.roa.es'
+        @return:        Return code
+    '''
 
-                try:
-                    ntptime.settime()
+    global connection
+    global measures_log
+    global tasks_scheduler
 
-                except OSError:
-                    pass
+    if(LOG_DIRECTORY is not None):
+        measures_log = flash_log(LOG_DIRECTORY)
 
-                else:
-                    pass
+        restore_measures()
 
-                finally:
-                    uptime_initial = time.time()
+    connection = wifi(ssid = config.wifi_ssid, password = config.wifi_password)
+    sensors = [dht11(pin, getattr(config, 'dht11_interval', None)) for pin in config.dht11_pins]
+    sensors += [dht22(pin, getattr(config, 'dht22_interval', None)) for pin in config.dht22_pins]
+    sensors_sampler = sampler(sensors, [int(period * 1000) for period in SAMPLING_PERIODS] if(SAMPLING_PERIODS) else int(SAMPLING_PERIOD * 1000))
+    s = server(
+        timeout = 0,                                                            # Non-blocking, the server task polls it
+        history = measures_history,
+        aggregates = measures_aggregates,
+        backlog = measures_backlog
+    )
+    tasks_scheduler = scheduler(ALLOC_MONITOR)
 
-            if(bound is None):
-                bound = s.bind(ip = connection.ip())
+    POLICY.threshold(GC_THRESHOLD)
 
-            if(bound):
-                if(DEBUG):
-                    print('Server bound 👍🏼')
+    ntptime.host = 'hora.roa.es'
 
-                while(not do_exit[0]):
-                    if(measures[0]['humidity'] is not None and measures[0]['temperature'] is not None):
-                        if(DEBUG):
-                            print(f"Temp: { measures[0]['temperature'] }º C")
+    get_measures(sensors)                                                       # Initial measurement for painting the screen
 
-                        s.accept([measure.get('temperature') for measure in measures], ip)
+    tasks_scheduler.every('network', WIFI_POLL_PERIOD * 1000, lambda: manage_network(s))
+    tasks_scheduler.every('ntp', NTP_PERIOD * 1000, synchronize_time, delay = NTP_PERIOD * 1000)
 
-                    else:
-                        if(DEBUG):
-                            print('Cannot get temp 😭')
+    if(not ASYNC_SERVER):
+        tasks_scheduler.every('server', SERVER_POLL_PERIOD, lambda: serve_clients(s))
 
-                    for i, sensor in enumerate(sensors):
-                        sensor.measure()
+    if(sensors):
+        tasks_scheduler.every('sensors', max(min(sensors_sampler.slot(), SENSORS_POLL_PERIOD), 1), lambda: sample_measure(s, sensors, sensors_sampler))   # Sensors read too soon are retried shortly
 
-                        measures[i]['humidity'] = sensor.humidity()
-                        measures[i]['temperature'] = sensor.temperature()
+    if(config.screen):
+        paint, switch_off = screen_buttons_manager()
 
-            else:
-                if(DEBUG):
-                    print('Cannot bind 👎🏼')
+        tasks_scheduler.every('display', DISPLAY_PERIOD, paint)
 
-                break
+    if(DEBUG or ALLOC_MONITOR):
+        tasks_scheduler.every('report', REPORT_PERIOD * 1000, report_tasks, delay = REPORT_PERIOD * 1000)
 
-        else:
-            ip = 'WiFi Error'
+    asyncio.run(tasks_scheduler.run())                                          # Runs until `global_exit()` is called
 
-            if(DEBUG):
-                print(f"WiFi error: { WIFI_STAT[connected] }")
+    if(config.screen):
+        switch_off()
 
-        if(not do_exit[0]):
-            time.sleep(30)
+    s.close()
 
-    global_exit()
+    if(measures_log is not None):
+        measures_log.flush()                                                    # Do not lose the buffered records
 
     time.sleep(1)
 
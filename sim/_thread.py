@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    _thread
+
+    @file       : _thread.py
+    @brief      : MicroPython _thread module simulation
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported instead of MicroPython's _thread module, see `run.py`)
+    @note       : Backed by CPython threads
+'''
+
+
+import threading                                                                # CPython threads
+
+
+def allocate_lock():
+    '''!
+        Lock creator
+
+        @return                     : A new lock
+    '''
+
+    return threading.Lock()
+
+
+def get_ident():
+    '''!
+        Thread identifier observer
+
+        @return                     : Identifier of the current thread
+    '''
+
+    return threading.get_ident()
+
+
+def start_new_thread(function, args, kwargs = None):
+    '''!
+        Thread starter
+
+        @param function             : Function run by the thread
+        @param args                 : Tuple of positional arguments
+        @param kwargs               : Dictionary of keyword arguments
+
+        @return                     : Identifier of the new thread
+    '''
+
+    thread = threading.Thread(target = function, args = args, kwargs = kwargs or {}, daemon = True)
+
+    thread.start()
+
+    return thread.ident
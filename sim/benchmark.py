@@ -0,0 +1,691 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    benchmark
+
+    @file       : benchmark.py
+    @brief      : Host-side benchmark suite
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : python3 sim/benchmark.py [-h] [--baseline FILE] [--output FILE] [--update-baseline]
+    @note       : Runs the hot paths against the simulated hardware (see `run.py`), writes the results as JSON and
+                  fails if any metric regressed past its baseline
+'''
+
+
+import argparse                                                                 # Command line arguments parsing
+import asyncio                                                                  # Asynchronous I/O
+import gc                                                                       # Garbage collector
+import json                                                                     # JSON encoding and decoding
+import os                                                                       # Paths management
+import socket                                                                   # Socket functions
+import sys                                                                      # System-specific parameters and functions
+import tempfile                                                                 # Temporary directories
+import threading                                                                # CPython threads
+import time                                                                     # Time manipulation
+import tracemalloc                                                              # Memory allocations tracing
+
+import run                                                                      # Simulation environment
+
+
+BASELINE = os.path.join(run.SIMULATION, 'baseline.json')
+CLIENTS = 4                                                                     # Concurrent clients of the server benchmark
+FRAMES = 290                                                                    # Screen ticks, less than a whole cycle (the screen switches off after it)
+FLASH_LOG_RECORDS = 8192                                                        # Records appended by the flash log benchmark
+ITERATIONS = 200                                                                # Iterations of the allocation benchmarks
+PARSER_ITERATIONS = 10000                                                       # Requests parsed by the parser benchmark
+PARSER_REQUEST = b'GET /?sensor=0 HTTP/1.1\r\nHost: picotemp\r\nUser-Agent: benchmark\r\nAccept: */*\r\n\r\n'
+REQUESTS = 50                                                                   # Requests per client
+TASK_REQUESTS = 30                                                              # Requests per client of the server task benchmark, on persistent connections
+TOLERANCE = 0.25                                                                # Default allowed regression, relative to the baseline
+
+
+def benchmark_allocations(device, paint, s):
+    '''!
+        Measures the heap allocations per loop iteration
+
+        The peak of memory allocated during each iteration, traced with `tracemalloc`, is averaged for the screen
+        tick, the sensors sampling step, the handling of a request and the server task while there are no clients.
+        Some of it is allocated on MicroPython too: the texts formatted by the screen tick when they change, the
+        readings of every sensor read (the floats of DHT22 sensors, the `time.time()` big integer and the published
+        snapshot of `display_state`) and, for each request, the slices of `parse_request()` and the tuples of
+        `_route()` and of the responses cache key. The rest is CPython's: the ticks and counters beyond its small
+        integers, and the list returned by `poll()` (MicroPython's `ipoll()` does not allocate, see
+        `check_idle_allocations()` in `checks.py`)
+
+        @param device               : Main module
+        @param paint                : Screen tick function
+        @param s                    : Server object, with its values set
+
+        @return                     : Dictionary of metrics
+    '''
+
+    res = {}
+
+    sensors = [device.dht11(pin, 0) for pin in device.config.dht11_pins] + [device.dht22(pin, 0) for pin in device.config.dht22_pins]
+    sensors_sampler = device.sampler(sensors, 0)                                # Without minimum intervals, every step reads a sensor
+    idle = device.server(timeout = 0)                                           # Non-blocking, as the server task of `main()`
+    idle.bind(ip = device.ip, port = 0)
+
+    loops = (
+        ('display_alloc_bytes', paint),
+        ('sensors_alloc_bytes', lambda: device.sample_measure(s, sensors, sensors_sampler)),
+        ('server_alloc_bytes', lambda: s._handle(b'GET /?sensor=0 HTTP/1.1\r\nHost: picotemp\r\n\r\n', True)),
+        ('server_idle_alloc_bytes', idle.accept),
+    )
+
+    for name, loop in loops:
+        loop()                                                                  # Warm up caches
+
+        total = 0
+
+        tracemalloc.start()
+
+        for _ in range(ITERATIONS):
+            tracemalloc.reset_peak()
+
+            before = tracemalloc.get_traced_memory()[0]
+
+            loop()
+
+            total += tracemalloc.get_traced_memory()[1] - before
+
+        tracemalloc.stop()
+
+        res[name] = total / ITERATIONS
+
+    idle.close()
+
+    return res
+
+
+def benchmark_display(device, paint):
+    '''!
+        Measures the screen refreshes
+
+        @param device               : Main module
+        @param paint                : Screen tick function
+
+        @return                     : Dictionary of metrics
+    '''
+
+    from machine import SPI                                                     # Simulated SPI buses
+
+    elapsed = []
+    paint_screen = device.paint_screen
+
+
+    def timed_paint_screen(*args, **kwargs):
+        '''!
+            `paint_screen()` wrapper, timing every call
+        '''
+
+        start = time.perf_counter()
+
+        paint_screen(*args, **kwargs)
+
+        elapsed.append(time.perf_counter() - start)
+
+
+    bus = SPI.buses[1]
+    bus.reset()
+
+    device.paint_screen = timed_paint_screen
+
+    try:
+        for _ in range(FRAMES):
+            paint()
+
+    finally:
+        device.paint_screen = paint_screen
+
+    return {
+        'display_bus_us_per_frame': bus.bus_time / FRAMES,
+        'display_bytes_per_frame': bus.bytes_written / FRAMES,
+        'display_transactions_per_frame': bus.transactions / FRAMES,
+        'paint_screen_ms': sum(elapsed) / len(elapsed) * 1000,
+    }
+
+
+def benchmark_flash_log(device):
+    '''!
+        Measures the flash log writing throughput and its storage overhead
+
+        Records are appended to a log in a temporary directory, wrapping around its segments, and flushed at the end.
+        The storage cost is the size of the segment files divided by the records they keep, headers included
+
+        @param device               : Main module
+
+        @return                     : Dictionary of metrics
+    '''
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = device.flash_log(directory)
+
+        start = time.perf_counter()
+
+        for i in range(FLASH_LOG_RECORDS):
+            log.append(i, i % 3, 21.5, 48.0)
+
+        log.flush()
+
+        elapsed = time.perf_counter() - start
+
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        records = sum(1 for _ in log.records())
+
+    return {
+        'flash_log_bytes_per_record': size / records,
+        'flash_log_records_per_second': FLASH_LOG_RECORDS / elapsed,
+    }
+
+
+def benchmark_parser(s):
+    '''!
+        Measures the request line parsing and routing, and compares it with the former regular expressions
+
+        @param s                    : Server object, with its values set
+
+        @return                     : Dictionary of metrics
+    '''
+
+    from checks import legacy_route                                             # Former parser
+
+    sensors = len(s._measures)
+
+
+    def parse():
+        '''!
+            Parses and routes the request
+        '''
+
+        method, path, query, _ = s.parse_request(PARSER_REQUEST)
+
+        s._route(method, path, query)
+
+
+    res = {}
+
+    for name, loop in (('parse_request', parse), ('parse_request_legacy', lambda: legacy_route(PARSER_REQUEST, sensors))):
+        loop()                                                                  # Warm up caches
+
+        start = time.perf_counter()
+
+        for _ in range(PARSER_ITERATIONS):
+            loop()
+
+        res[f"{ name }_us"] = (time.perf_counter() - start) / PARSER_ITERATIONS * 1000000
+
+        total = 0
+
+        tracemalloc.start()
+
+        for _ in range(ITERATIONS):
+            tracemalloc.reset_peak()
+
+            before = tracemalloc.get_traced_memory()[0]
+
+            loop()
+
+            total += tracemalloc.get_traced_memory()[1] - before
+
+        tracemalloc.stop()
+
+        res[f"{ name }_alloc_bytes"] = total / ITERATIONS
+
+    return res
+
+
+def benchmark_sensors(device):
+    '''!
+        Measures the time to read every sensor, for each number of sensors
+
+        @param device               : Main module
+
+        @return                     : Dictionary of metrics
+    '''
+
+    res = {}
+
+    pins = [(device.dht11, pin) for pin in device.config.dht11_pins] + [(device.dht22, pin) for pin in device.config.dht22_pins]
+
+    for count in range(1, len(pins) + 1):
+        sensors = [sensor(pin) for sensor, pin in pins[:count]]                 # New sensors, so they are not rate limited
+
+        start = time.perf_counter()
+
+        device.get_measures(sensors)
+
+        res[f"get_measures_{ count }_sensors_ms"] = (time.perf_counter() - start) * 1000
+
+    return res
+
+
+def benchmark_server(device, s):
+    '''!
+        Measures the server throughput and latency with concurrent clients
+
+        The server task is emulated by a thread calling `accept()` (see `load_server()`)
+
+        @param device               : Main module
+        @param s                    : Server object, bound, with its values set
+
+        @return                     : Dictionary of metrics
+    '''
+
+    stop = [False]
+
+
+    def serve():
+        '''!
+            Server thread
+        '''
+
+        while(not stop[0]):
+            s.accept()
+
+
+    server_thread = threading.Thread(target = serve, daemon = True)
+    server_thread.start()
+
+    try:
+        res = load_server('server', s._socket.getsockname())
+
+    finally:
+        stop[0] = True
+
+        server_thread.join()
+
+    return res
+
+
+def benchmark_server_async(device):
+    '''!
+        Measures the asynchronous server (`ASYNC_SERVER` mode) throughput and latency with concurrent clients
+
+        The server runs in an event loop of its own thread, as in `main()` (see `load_server()`)
+
+        @param device               : Main module
+
+        @return                     : Dictionary of metrics
+    '''
+
+    s = device.server(history = device.measures_history, aggregates = device.measures_aggregates, backlog = device.measures_backlog)
+    s.update(device.measures, device.ip)
+
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    stop = [False]
+
+
+    async def serve():
+        '''!
+            Server coroutine, running until `stop` is set
+        '''
+
+        await s.serve(ip = device.ip, port = 0)
+
+        ready.set()
+
+        while(not stop[0]):
+            await asyncio.sleep(0.01)
+
+        s.close()
+
+
+    server_thread = threading.Thread(target = loop.run_until_complete, args = (serve(),), daemon = True)
+    server_thread.start()
+
+    ready.wait()
+
+    try:
+        res = load_server('server_async', s._server.sockets[0].getsockname())
+
+    finally:
+        stop[0] = True
+
+        server_thread.join()
+
+        loop.close()
+
+    return res
+
+
+def benchmark_server_task(device, paint, asynchronous):
+    '''!
+        Measures the server of `main()` with concurrent clients on persistent connections
+
+        The screen task runs in the tasks scheduler, as in `main()`, in an event loop of its own thread, along with
+        the asynchronous server (`ASYNC_SERVER` mode, the default one) or the server task polling for clients.
+        Every one of the `CLIENTS` clients sends `TASK_REQUESTS` requests, one after another, on persistent
+        connections, reconnecting when the server closes them. The screen task misses no deadline as long as the
+        server does not block
+
+        @param device               : Main module
+        @param paint                : Screen tick function
+        @param asynchronous         : Whether the asynchronous server is measured, instead of the server task
+
+        @return                     : Dictionary of metrics
+    '''
+
+    s = device.server(timeout = 0, history = device.measures_history, aggregates = device.measures_aggregates, backlog = device.measures_backlog)
+    s.update(device.measures, device.ip)
+
+    address = []
+    latencies = []
+    lock = threading.Lock()
+    loop = asyncio.new_event_loop()
+    name = 'server_task' if(asynchronous) else 'server_polled_task'
+    ready = threading.Event()
+    tasks_scheduler = device.scheduler()
+
+    if(asynchronous):
+        server_task = None
+
+    else:
+        s.bind(ip = device.ip, port = 0)
+
+        address.append(s._socket.getsockname())
+
+        server_task = tasks_scheduler.every('server', device.SERVER_POLL_PERIOD, lambda: device.serve_clients(s))
+
+    display_task = tasks_scheduler.every('display', device.DISPLAY_PERIOD, paint)
+
+
+    async def serve():
+        '''!
+            Scheduler coroutine, starting the asynchronous server first if needed, as `manage_network()` does, and
+            closing the server when the scheduler stops
+        '''
+
+        if(asynchronous):
+            await s.serve(ip = device.ip, port = 0)
+
+            address.append(s._server.sockets[0].getsockname())
+
+        ready.set()
+
+        await tasks_scheduler.run()
+
+        s.close()                                                               # In the event loop, which is closed afterwards
+
+
+    def client():
+        '''!
+            Client thread
+        '''
+
+        c = None
+        own = []
+
+        for _ in range(TASK_REQUESTS):
+            start = time.perf_counter()
+
+            if(c is None):
+                c = socket.create_connection(address[0])
+
+            c.sendall(b'GET /all HTTP/1.1\r\nHost: picotemp\r\n\r\n')
+
+            response = b''
+
+            while(b'\r\n\r\n' not in response or len(response.split(b'\r\n\r\n', 1)[1]) < int(response.split(b'Content-Length: ', 1)[1].split(b'\r\n', 1)[0])):
+                response += c.recv(4096)
+
+            own.append(time.perf_counter() - start)
+
+            if(b'Connection: close' in response):
+                c.close()
+
+                c = None
+
+        if(c is not None):
+            c.close()
+
+        with lock:
+            latencies.extend(own)
+
+
+    scheduler_thread = threading.Thread(target = loop.run_until_complete, args = (serve(), ), daemon = True)
+    scheduler_thread.start()
+
+    ready.wait()
+
+    clients = [threading.Thread(target = client) for _ in range(CLIENTS)]
+
+    start = time.perf_counter()
+
+    try:
+        for c in clients:
+            c.start()
+
+        for c in clients:
+            c.join()
+
+        elapsed = time.perf_counter() - start
+
+    finally:
+        loop.call_soon_threadsafe(tasks_scheduler.stop)
+
+        scheduler_thread.join()
+
+        loop.close()
+
+        s.close()
+
+    latencies.sort()
+
+    res = {
+        f"{ name }_display_missed": display_task.missed / display_task.runs,
+        f"{ name }_latency_p50_ms": latencies[len(latencies) // 2] * 1000,
+        f"{ name }_latency_p99_ms": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1000,
+        f"{ name }_requests_per_second": len(latencies) / elapsed,
+    }
+
+    if(server_task is not None):
+        res[f"{ name }_max_ms"] = server_task.time_max / 1000
+
+    return res
+
+
+def load_server(name, address):
+    '''!
+        Measures a server throughput and latency with concurrent clients
+
+        Every one of the `CLIENTS` clients sends `REQUESTS` requests, each one on its own connection
+
+        @param name                 : Metrics names prefix
+        @param address              : Server address
+
+        @return                     : Dictionary of metrics
+    '''
+
+    latencies = []
+    lock = threading.Lock()
+
+
+    def client():
+        '''!
+            Client thread
+        '''
+
+        own = []
+
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+
+            with socket.create_connection(address) as c:
+                c.sendall(b'GET /all HTTP/1.1\r\nHost: picotemp\r\nConnection: close\r\n\r\n')
+
+                while(c.recv(4096)):
+                    pass
+
+            own.append(time.perf_counter() - start)
+
+        with lock:
+            latencies.extend(own)
+
+
+    clients = [threading.Thread(target = client) for _ in range(CLIENTS)]
+
+    start = time.perf_counter()
+
+    for c in clients:
+        c.start()
+
+    for c in clients:
+        c.join()
+
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    return {
+        f"{ name }_latency_p50_ms": latencies[len(latencies) // 2] * 1000,
+        f"{ name }_latency_p99_ms": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1000,
+        f"{ name }_requests_per_second": len(latencies) / elapsed,
+    }
+
+
+def compare(results, baseline):
+    '''!
+        Regressions finder
+
+        @param results              : Dictionary of metrics
+        @param baseline             : Dictionary of baseline entries, each one a dictionary with the `value`, whether
+                                      `higher` values are better and the allowed regression (`tolerance`, relative)
+
+        @return                     : List of messages, one per regressed metric
+    '''
+
+    res = []
+
+    for name, entry in sorted(baseline.items()):
+        if(name not in results):
+            res.append(f"{ name }: missing")
+
+            continue
+
+        value = results[name]
+        tolerance = entry.get('tolerance', TOLERANCE)
+
+        if(entry.get('higher', False)):
+            limit = entry['value'] * (1 - tolerance)
+            regressed = value < limit
+
+        else:
+            limit = entry['value'] * (1 + tolerance)
+            regressed = value > limit
+
+        if(regressed):
+            res.append(f"{ name }: { value:.3f} (baseline { entry['value']:.3f}, limit { limit:.3f})")
+
+    return res
+
+
+def measure():
+    '''!
+        Benchmarks runner
+
+        Prepares the simulated device (WiFi connected, server bound to an ephemeral loopback port, sensors read once)
+        and runs every benchmark
+
+        @return                     : Dictionary of metrics
+    '''
+
+    run.setup()
+
+    import main as device                                                       # Device main module
+
+    device.connection = device.wifi(ssid = device.config.wifi_ssid, password = device.config.wifi_password)
+
+    while(device.connection.poll() != device.network.STAT_GOT_IP or device.connection.state() != device.STATE_CONNECTED):
+        pass
+
+    s = device.server(timeout = 0.05, history = device.measures_history, aggregates = device.measures_aggregates, backlog = device.measures_backlog)
+
+    device.ip = device.connection.ip()
+    device.bound = s.bind(ip = device.ip, port = 0)
+
+    sensors = [device.dht11(pin) for pin in device.config.dht11_pins] + [device.dht22(pin) for pin in device.config.dht22_pins]
+
+    device.get_measures(sensors)
+
+    s.update(device.measures, device.ip)
+
+    paint, _ = device.screen_buttons_manager()
+
+    res = {}
+
+    gc.collect()
+
+    res.update(benchmark_display(device, paint))
+    res.update(benchmark_sensors(device))
+    res.update(benchmark_server(device, s))
+    res.update(benchmark_server_async(device))
+    res.update(benchmark_server_task(device, paint, True))
+    res.update(benchmark_server_task(device, paint, False))
+    res.update(benchmark_parser(s))
+    res.update(benchmark_flash_log(device))
+    res.update(benchmark_allocations(device, paint, s))
+
+    s.close()
+
+    return res
+
+
+def main(argv = sys.argv[1:]):
+    '''!
+        Runs the benchmarks and checks them against the baseline
+
+        @param argv:    Program arguments
+
+        @return:        Return code: `0` if no metric regressed, `1` otherwise
+    '''
+
+    parser = argparse.ArgumentParser(description = 'PicoTemp benchmarks, on simulated hardware')
+    parser.add_argument('--baseline', default = BASELINE, help = 'baseline JSON file')
+    parser.add_argument('--output', help = 'results JSON file (standard output if missing)')
+    parser.add_argument('--update-baseline', action = 'store_true', help = 'store the results as the new baseline values')
+
+    args = parser.parse_args(argv)
+
+    results = measure()
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    except FileNotFoundError:
+        baseline = {}
+
+    if(args.update_baseline):
+        for name, value in results.items():
+            baseline.setdefault(name, {})['value'] = value
+
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent = 4, sort_keys = True)
+            f.write('\n')
+
+    regressions = compare(results, baseline)
+
+    output = json.dumps({'results': results, 'regressions': regressions}, indent = 4, sort_keys = True)
+
+    if(args.output):
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+    else:
+        print(output)
+
+    for regression in regressions:
+        print(f"Regression: { regression }", file = sys.stderr)
+
+    return 1 if(regressions) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
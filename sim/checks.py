@@ -0,0 +1,842 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    checks
+
+    @file       : checks.py
+    @brief      : Host-side behaviour checks
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : python3 sim/checks.py [-h] [name ...]
+    @note       : Runs the device modules against the simulated hardware (see `run.py`) and checks their behaviour.
+                  Every `check_*()` function is a check, which fails raising `AssertionError`
+'''
+
+
+import argparse                                                                 # Command line arguments parsing
+import random                                                                   # Pseudo-random numbers, for the simulated clock jitter
+import re                                                                       # Regular expressions, for the reference implementations
+import socket                                                                   # Socket functions
+import sys                                                                      # System-specific parameters and functions
+import tempfile                                                                 # Temporary directories
+import threading                                                                # CPython threads
+import time                                                                     # Time manipulation
+import traceback                                                                # Exceptions printing
+import tracemalloc                                                              # Memory allocations tracing
+
+import run                                                                      # Simulation environment
+
+
+ALLOCATION_ITERATIONS = 100                                                     # Runs of each loop of the idle allocations check
+PARSE_CASES = (                                                                 # Request, expected `parse_request()` result, whether the former parser differs on purpose
+    (b'GET / HTTP/1.1', (b'GET', b'/', b'', b'1.1'), False),
+    (b'GET /?sensor=0 HTTP/1.1', (b'GET', b'/', b'sensor=0', b'1.1'), False),
+    (b'GET /?sensor=1 HTTP/1.0', (b'GET', b'/', b'sensor=1', b'1.0'), False),
+    (b'GET /?a=b&sensor=2 HTTP/1.1', (b'GET', b'/', b'a=b&sensor=2', b'1.1'), False),
+    (b'GET /?sensor=9 HTTP/1.1', (b'GET', b'/', b'sensor=9', b'1.1'), False),
+    (b'GET /?sensor=x HTTP/1.1', (b'GET', b'/', b'sensor=x', b'1.1'), False),
+    (b'GET /?sensor= HTTP/1.1', (b'GET', b'/', b'sensor=', b'1.1'), False),
+    (b'GET /?sensor=12 HTTP/1.1', (b'GET', b'/', b'sensor=12', b'1.1'), True),     # Whole number, not its first digit
+    (b'GET /?sensor=0&sensor=1 HTTP/1.1', (b'GET', b'/', b'sensor=0&sensor=1', b'1.1'), True),     # First parameter, not the last one
+    (b'GET /?xsensor=1 HTTP/1.1', (b'GET', b'/', b'xsensor=1', b'1.1'), True),  # Whole parameter names
+    (b'GET /?sensor=1 HTTP/1.1\r\nHost: picotemp', (b'GET', b'/', b'sensor=1', b'1.1'), False),
+    (b'GET /?sensor=1 HTTP/1.1\nHost: picotemp', (b'GET', b'/', b'sensor=1', b'1.1'), False),
+    (b'GET / HTTP/2', (b'GET', b'/', b'', b'2'), False),
+    (b'GET / HTTP/1.', (b'GET', b'/', b'', b'1.'), False),
+    (b'GET  / HTTP/1.1', (b'GET', b' /', b'', b'1.1'), False),
+    (b'POST / HTTP/1.1', (b'POST', b'/', b'', b'1.1'), False),
+    (b'GET /foo HTTP/1.1', (b'GET', b'/foo', b'', b'1.1'), False),
+    (b'GET / HTTP/1.1x', None, True),                                           # Strict version
+    (b'GET / HTTP/', None, False),
+    (b'GET /', None, False),
+    (b'garbage', None, False),
+    (b'', None, False),
+)
+QUERY_INT_CASES = (                                                             # Query string, name, expected `query_int()` result
+    (b'n=42', b'n', 42),
+    (b'n=-3', b'n', -3),
+    (b'a=1&n=7', b'n', 7),
+    (b'n=x', b'n', None),
+    (b'n=', b'n', None),
+    (b'', b'n', None),
+)
+QUERY_VALUE_CASES = (                                                           # Query string, name, expected `query_value()` result
+    (b'a=1&b=2', b'b', b'2'),
+    (b'a=1', b'b', None),
+    (b'b', b'b', None),
+    (b'b=', b'b', b''),
+    (b'bb=1&b=2', b'b', b'2'),
+    (b'b=1&b=2', b'b', b'1'),
+    (b'', b'b', None),
+)
+READING = {'humidity': 50, 'readings': 1, 'temperature': 20, 'time': 0, 'valid': True, 'type': 'DHT11'}    # Sensor readings served by the servers of the checks
+SAMPLER_CASES = (                                                               # Sensor kinds, sampling periods and expected readings in `SAMPLER_DURATION`
+    ((11, 11, 22), 2000, (30, 30, 30)),
+    ((11, 11, 11), 1000, (60, 60, 60)),
+    ((11, 11, 22), [1000, 1000, 2000], (60, 60, 30)),
+    ((11, 11, 22), 1000, (60, 60, 30)),                                         # The DHT22 period is clamped to its minimum interval
+    ((11, 22), [3000, 500], (20, 30)),
+)
+SAMPLER_DURATION = 60000                                                        # Simulated milliseconds of the sampler check
+SENSORS = 3                                                                     # Sensors of the routing checks
+STATE_READERS = 3                                                               # Reader threads of the shared state check
+STATE_WRITES = 20000                                                            # Snapshots published by the shared state check, at least
+STATE_WRITES_MAX = 200000                                                       # Snapshots published by the shared state check, at most, until every reader saw several
+
+
+def legacy_route(request, sensors):
+    '''!
+        Reference implementation: request routing with regular expressions, as it was before `parse_request()`
+
+        @param request              : Raw request, as received
+        @param sensors              : Number of sensors
+
+        @return                     : A tuple (`http_version`, `index`), `index` being the sensor index, `-1` for a
+                                      redirection or `None` if not found, or `None` if the request line is malformed
+    '''
+
+    lines = request.decode().splitlines()
+
+    if(not lines):
+        return None
+
+    line = lines[0]
+    matched = re.match(r".* HTTP/(\d+\.?\d*)", line)
+
+    if(not matched):
+        return None
+
+    if(re.match(r"GET /(?:\?.*)? HTTP/(?:\d+\.?\d*)", line)):
+        matched_sensor = re.match(r"/\?.*sensor=(\d)", line[4:])
+
+        index = int(matched_sensor.group(1)) if(matched_sensor and int(matched_sensor.group(1)) < sensors) else -1
+
+    else:
+        index = None
+
+    return matched.group(1), index
+
+
+def loopback_server(timeout, sensors = 1, bind = True):
+    '''!
+        Server of the checks, serving the same readings (`READING`) for every sensor, on the loopback address
+
+        @param timeout              : Socket timeout, in seconds
+        @param sensors              : Number of sensors
+        @param bind                 : Whether the server is bound, to an ephemeral port
+
+        @return                     : Server object, with its values set
+    '''
+
+    from server import server                                                   # HTTP server
+
+    res = server(timeout = timeout)
+
+    if(bind):
+        res.bind(ip = '127.0.0.1', port = 0)
+
+    res.update([READING] * sensors, '127.0.0.1')
+
+    return res
+
+
+def route(s, request):
+    '''!
+        Request routing with `parse_request()`, in the terms of `legacy_route()`
+
+        @param s                    : Server object, with its values set
+        @param request              : Raw request, as received
+
+        @return                     : A tuple (`http_version`, `index`), as `legacy_route()` returns it
+    '''
+
+    from server import ROUTE_REDIRECT, ROUTE_SENSOR, server                     # HTTP server
+
+    parsed = server.parse_request(request)
+
+    if(parsed is None):
+        return None
+
+    method, path, query, http_version = parsed
+    res = s._route(method, path, query)
+
+    return http_version.decode(), res[1] if(res[0] == ROUTE_SENSOR) else -1 if(res[0] == ROUTE_REDIRECT) else None
+
+
+def serving(s):
+    '''!
+        Runs the server task in a thread, calling `accept()` until the returned function is called
+
+        @param s                    : Server object, bound
+
+        @return                     : Function stopping the thread
+    '''
+
+    stop = [False]
+
+
+    def serve():
+        '''!
+            Server thread
+        '''
+
+        while(not stop[0]):
+            s.accept()
+
+
+    thread = threading.Thread(target = serve, daemon = True)
+    thread.start()
+
+
+    def stopper():
+        '''!
+            Server thread stopper
+        '''
+
+        stop[0] = True
+
+        thread.join()
+
+
+    return stopper
+
+
+def receive_all(c):
+    '''!
+        Reads from a socket until the peer closes the connection, even if it resets it (as it does if it closes it
+        before reading every request sent)
+
+        @param c                    : Client socket
+
+        @return                     : Received bytes
+    '''
+
+    res = b''
+
+    try:
+        data = c.recv(4096)
+
+        while(data):
+            res += data
+            data = c.recv(4096)
+
+    except ConnectionResetError:                                                # Closed with unread data, after its response
+        pass
+
+    return res
+
+
+def check_buttons():
+    '''!
+        The presses of both buttons are queued by the interrupt handler in their order. Contact bounces, within
+        `DEBOUNCE` milliseconds of a press of the same button, are ignored, and presses are dropped while the queue is
+        full, until the pending events are consumed
+    '''
+
+    import buttons                                                              # Buttons manager module
+    import main as device                                                       # Device main module
+
+    from machine import Pin                                                     # GPIO pins management
+
+
+    def events():
+        '''!
+            Consumes every pending event
+
+            @return                     : List of the indexes of the pressed buttons, in order
+        '''
+
+        res = []
+        event = b.get()
+
+        while(event is not None):
+            res.append(event)
+
+            event = b.get()
+
+        return res
+
+
+    clock = [0]
+    saved = buttons.ticks_ms
+
+    buttons.ticks_ms = lambda: clock[0]
+
+    try:
+        b = buttons.buttons(device.config.buttons_pins)
+        pins = [Pin.pins[pin] for pin in device.config.buttons_pins]
+
+        pins[0].press()
+
+        clock[0] += 1
+
+        pins[0].press()                                                         # Bounce
+
+        clock[0] = buttons.DEBOUNCE - 1
+
+        pins[0].press()                                                         # Bounce
+        pins[1].press()                                                         # Debounced on its own
+
+        clock[0] = buttons.DEBOUNCE
+
+        pins[0].press()
+        pins[1].press()                                                         # Bounce
+
+        assert events() == [0, 1, 0]
+        assert b.get() is None
+
+        for i in range(buttons.QUEUE_SIZE + 3):
+            clock[0] += buttons.DEBOUNCE
+
+            pins[i % 2].press()
+
+        assert events() == [i % 2 for i in range(buttons.QUEUE_SIZE)]          # The newest ones were dropped
+
+        clock[0] += buttons.DEBOUNCE
+
+        pins[1].press()
+
+        assert events() == [1]
+
+    finally:
+        buttons.ticks_ms = saved
+
+
+def check_display_transfers():
+    '''!
+        The screen refreshes send only the changed rows, whole, straight from the preallocated row views of the
+        buffer, so no `memoryview` is created while the garbage collector is disabled, and keep the shadow copy in
+        sync with the buffer
+    '''
+
+    from OLED_1inch3 import OLED_1inch3                                         # Display driver
+
+    oled = OLED_1inch3()
+    sent = []
+    write = oled.spi.write
+
+    oled.spi.write = lambda buf: sent.append(buf) or write(buf)
+
+    try:
+        oled.show()
+
+        assert len(sent) == 2 * len(oled._rows), len(sent)
+        assert all(data is row for data, row in zip(sent[1::2], oled._rows)), 'row views not reused'
+
+        for x, y in ((0, 0), (127, 63), (64, 10)):
+            sent.clear()
+
+            oled.pixel(x, y, 1)
+            oled.show()
+
+            assert len(sent) == 2 and sent[0] is oled._address_buf and sent[1] is oled._rows[y], (x, y, sent)
+            assert oled._address_buf[0] == 0xb0, oled._address_buf
+            assert oled._shadow == oled.buffer, (x, y)
+
+        sent.clear()
+
+        oled.show()
+
+        assert not sent, sent
+
+    finally:
+        oled.spi.write = write
+
+
+def check_flash_log_recovery():
+    '''!
+        The flash log keeps the newest records across restarts, wrapping around its segments, and starts a new segment
+        after an interrupted write instead of appending after a partial record
+    '''
+
+    from flash_log import RECORD_SIZE, flash_log                                # Persistent measurements log
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = flash_log(directory, segments = 3, segment_records = 8, batch_records = 4)
+
+        for i in range(20):
+            log.append(i, 0, i, None)
+
+        log.flush()
+
+        log = flash_log(directory, segments = 3, segment_records = 8, batch_records = 4)
+
+        assert [record[0] for record in log.records()] == list(range(20)), list(log.records())
+
+        for i in range(20, 30):
+            log.append(i, 1, None, i)
+
+        log.flush()
+
+        assert [record[0] for record in log.records()] == list(range(8, 30)), list(log.records())
+
+        with open(log._path(log._segment), 'ab') as f:
+            f.write(bytes(RECORD_SIZE // 2))
+
+        log = flash_log(directory, segments = 3, segment_records = 8, batch_records = 4)
+        log.append(30, 2, 0, 0)
+        log.flush()
+
+        assert [record[0] for record in log.records()] == list(range(16, 31)), list(log.records())
+
+
+def check_idle_allocations():
+    '''!
+        The main loop tasks allocate no heap memory while they have nothing to do: the server task without clients,
+        the sensors task until the next sensor is due and the state publication without changes. As on the device,
+        ticks are small integers (the clock is frozen at `0`) and the server polls through an iterator without
+        results, as MicroPython's `ipoll()` returns (CPython's `poll()` returns a new list)
+    '''
+
+    import dht_sensor                                                           # Common sensor module
+    import main as device                                                       # Device main module
+    import sampler                                                              # Sensors sampling scheduler
+    import server                                                               # HTTP server
+
+    idle = iter(())
+    saved = (dht_sensor.ticks_ms, sampler.ticks_ms, server.ticks_ms)
+
+    dht_sensor.ticks_ms = sampler.ticks_ms = server.ticks_ms = lambda: 0
+
+    s = device.server(timeout = 0)
+
+    try:
+        s.bind(ip = '127.0.0.1', port = 0)
+        s.update(device.measures, '127.0.0.1')
+
+        s._poll = lambda timeout: idle
+
+        sensors = [device.dht11(pin, 0) for pin in device.config.dht11_pins]
+        sensors_sampler = device.sampler(sensors, len(sensors))                 # One millisecond slots, so CPython does not allocate the ticks differences either
+
+        loops = (
+            ('server', s.accept),
+            ('sensors', lambda: device.sample_measure(s, sensors, sensors_sampler)),   # Only the first call reads a sensor
+            ('state', device.publish_state),
+        )
+
+        for name, loop in loops:
+            loop()                                                              # Warm up caches
+
+            i = 0
+
+            tracemalloc.start()
+
+            while(i < ALLOCATION_ITERATIONS):                                   # Not `range()`, whose iterator is allocated
+                loop()
+
+                i += 1
+
+            peak = tracemalloc.get_traced_memory()[1]
+
+            tracemalloc.stop()
+
+            assert peak == 0, (name, peak)
+
+    finally:
+        s.close()
+
+        dht_sensor.ticks_ms, sampler.ticks_ms, server.ticks_ms = saved
+
+
+def check_keep_alive():
+    '''!
+        The server task does not block on a persistent connection: while it is idle, other clients are served and
+        `accept()` returns after its timeout, and its requests are served even if they arrive in parts across calls
+    '''
+
+    s = loopback_server(0.05)
+
+
+    def exchange(c, *parts):
+        '''!
+            Sends a request in parts, calling `accept()` after each one, and reads its response
+
+            @param c                    : Client socket
+            @param parts                : Request parts
+
+            @return                     : Response status line and headers
+        '''
+
+        for part in parts:
+            c.sendall(part)
+
+            for _ in range(3):
+                s.accept()
+
+        return c.recv(4096).split(b'\r\n\r\n')[0]
+
+
+    try:
+        with socket.create_connection(s._socket.getsockname(), timeout = 1) as persistent:
+            assert b'Connection: keep-alive' in exchange(persistent, b'GET /all HTTP/1.1\r\nHost: picotemp\r\n\r\n')
+
+            start = time.perf_counter()
+
+            for _ in range(5):
+                s.accept()
+
+            assert time.perf_counter() - start < 1, time.perf_counter() - start
+
+            with socket.create_connection(s._socket.getsockname(), timeout = 1) as other:
+                assert b'Connection: close' in exchange(other, b'GET /all HTTP/1.1\r\nHost: picotemp\r\nConnection: close\r\n\r\n')
+
+            assert b'200 OK' in exchange(persistent, b'GET /all HTTP/1.1\r\n', b'Host: picotemp\r\n\r\n')
+            assert len(s._clients) == 1 and s._clients[0].served == 2, s._clients
+
+    finally:
+        s.close()
+
+
+def check_network_rebind():
+    '''!
+        A failed server binding after a WiFi reconnection is retried in the next network task run, instead of ending
+        the program, which only happens if the first binding since boot fails. The polled server is bound, both modes
+        share the retries
+    '''
+
+    import asyncio                                                              # Asynchronous I/O
+    import main as device                                                       # Device main module
+
+    clock = [0]
+    failures = [0]
+    exits = []
+    wifi = sys.modules[device.wifi.__module__]                                  # WiFi module, whose ticks are simulated
+    saved = (wifi.ticks_ms, device.ASYNC_SERVER, device.bound, device.bound_once, device.connection, device.global_exit, device.SERVER_PORT, device.uptime_initial)
+
+    s = device.server(timeout = 0)
+    bind = s.bind
+
+
+    def failing_bind(**kwargs):
+        '''!
+            `bind()` wrapper, failing while `failures` is not zero
+        '''
+
+        if(failures[0]):
+            failures[0] -= 1
+
+            return False
+
+        return bind(**kwargs)
+
+
+    def tick(until):
+        '''!
+            Runs the network task, a simulated second apart, until `until()` is true
+
+            @param until                : Condition function
+        '''
+
+        for _ in range(100):
+            asyncio.run(device.manage_network(s))
+
+            if(until()):
+                return
+
+            clock[0] += 1000
+
+        raise AssertionError('condition not reached')
+
+
+    s.bind = failing_bind
+    wifi.ticks_ms = lambda: clock[0]
+
+    device.ASYNC_SERVER = False
+    device.bound = None
+    device.bound_once = False
+    device.connection = device.wifi(ssid = device.config.wifi_ssid, password = device.config.wifi_password)
+    device.global_exit = lambda: exits.append(device.bound)
+    device.SERVER_PORT = 0
+    device.uptime_initial = 0
+
+    try:
+        tick(lambda: device.bound)
+
+        device.network.WLAN(device.network.STA_IF).drop()
+
+        tick(lambda: device.bound is None)
+
+        failures[0] = 1
+
+        device.network.WLAN(device.network.STA_IF).restore()
+
+        tick(lambda: device.bound)
+
+        assert not exits and failures[0] == 0, (exits, failures)
+
+        s.close()
+
+        device.bound = None
+        device.bound_once = False
+        failures[0] = 1
+
+        tick(lambda: exits)
+
+        assert device.bound is None, device.bound
+
+    finally:
+        s.close()
+
+        wifi.ticks_ms, device.ASYNC_SERVER, device.bound, device.bound_once, device.connection, device.global_exit, device.SERVER_PORT, device.uptime_initial = saved
+
+        device.network.WLAN(device.network.STA_IF).restore()
+
+
+def check_parse_request():
+    '''!
+        Request lines are parsed as expected, and routed as the former regular expressions did, but for the intended
+        differences
+    '''
+
+    from server import server                                                   # HTTP server
+
+    s = loopback_server(0, SENSORS, False)
+    s.close()
+
+    for request, expected, differs in PARSE_CASES:
+        assert server.parse_request(request) == expected, (request, server.parse_request(request), expected)
+
+        if(not differs):
+            assert route(s, request) == legacy_route(request, SENSORS), (request, route(s, request), legacy_route(request, SENSORS))
+
+        else:
+            assert route(s, request) != legacy_route(request, SENSORS), request
+
+
+def check_query_parameters():
+    '''!
+        Query string parameters are read as expected
+    '''
+
+    from server import server                                                   # HTTP server
+
+    for query, name, expected in QUERY_VALUE_CASES:
+        assert server.query_value(query, name) == expected, (query, name, server.query_value(query, name))
+
+    for query, name, expected in QUERY_INT_CASES:
+        assert server.query_int(query, name) == expected, (query, name, server.query_int(query, name))
+
+
+def check_redirect_port():
+    '''!
+        Redirections point to the port the server is bound to, which is omitted if it is the default one
+    '''
+
+    with socket.socket() as free:                                               # A port not in use
+        free.bind(('127.0.0.1', 0))
+
+        port = free.getsockname()[1]
+
+    s = loopback_server(0, bind = False)
+
+    try:
+        assert b'Location: http://127.0.0.1/?sensor=0\r\n' in s._handle(b'GET /?sensor=9 HTTP/1.1\r\n\r\n')[0]
+
+        assert s.bind(ip = '127.0.0.1', port = port)
+        assert f"Location: http://127.0.0.1:{ port }/?sensor=0\r\n".encode() in s._handle(b'GET /?sensor=9 HTTP/1.1\r\n\r\n')[0]
+
+    finally:
+        s.close()
+
+
+def check_request_size_cap():
+    '''!
+        A request reaching the size cap without the end of its headers is handled with what was received, and the
+        connection is closed afterwards, as its remaining headers (here, `Connection: close`) were not read
+    '''
+
+    from server import REQUEST_MAX_SIZE                                         # HTTP server
+
+    s = loopback_server(0.05)
+
+    stop = serving(s)
+
+    try:
+        request = b'GET /all HTTP/1.1\r\nHost: picotemp\r\nX-Padding: ' + b'a' * REQUEST_MAX_SIZE + b'\r\nConnection: close\r\n\r\n'
+
+        with socket.create_connection(s._socket.getsockname(), timeout = 10) as c:
+            c.sendall(request + b'GET /all HTTP/1.1\r\nHost: picotemp\r\n\r\n')
+
+            response = receive_all(c)
+
+    finally:
+        stop()
+
+        s.close()
+
+    assert response.count(b'HTTP/1.1 ') == 1, response
+    assert b'Connection: close' in response, response
+
+
+def check_sampler_rate():
+    '''!
+        Sensors are read at their configured rates by the sensors task of `main()`, which runs a few simulated
+        milliseconds late, with common and per-sensor periods. Periods shorter than the minimum interval of a sensor
+        are clamped to it, without slowing down the other sensors
+    '''
+
+    import dht_sensor                                                           # Common sensor module
+    import main as device                                                       # Device main module
+    import sampler                                                              # Sensors sampling scheduler
+
+    clock = [0]
+    generator = random.Random(0)
+    saved = (dht_sensor.ticks_ms, sampler.sleep, sampler.ticks_ms)
+
+
+    def sleep(seconds):
+        '''!
+            Simulated sleep, advancing the simulated clock
+
+            @param seconds              : Seconds to sleep
+        '''
+
+        clock[0] += round(seconds * 1000)
+
+
+    dht_sensor.ticks_ms = sampler.ticks_ms = lambda: clock[0]
+    sampler.sleep = sleep
+
+    try:
+        for kinds, periods, expected in SAMPLER_CASES:
+            clock[0] = 0
+
+            sensors = [(device.dht11 if(kind == 11) else device.dht22)(pin, 1000 if(kind == 11) else 2000) for pin, kind in enumerate(kinds)]
+            sensors_sampler = sampler.sampler(sensors, periods)
+
+            for sensor in sensors:
+                sensor._sensor.read_latency = 0                                 # Simulated time does not pass while reading
+
+            period = max(min(sensors_sampler.slot(), device.SENSORS_POLL_PERIOD), 1)   # As `main()` registers the task
+
+            for due in range(0, SAMPLER_DURATION, period):
+                clock[0] = due + generator.randint(0, 3)
+
+                sensors_sampler.poll()
+
+            readings = [sensor.readings() for sensor in sensors]
+
+            assert readings == list(expected), (kinds, periods, readings, expected)
+
+    finally:
+        dht_sensor.ticks_ms, sampler.sleep, sampler.ticks_ms = saved
+
+
+def check_shared_state():
+    '''!
+        Readers in other threads only see whole snapshots, in publication order, while a writer thread modifies and
+        publishes the fields as fast as it can. The interpreter switches threads every microsecond, so they interleave
+        in the middle of every write
+    '''
+
+    from shared_state import shared_state                                       # Double-buffered state sharing between threads
+
+    state = shared_state(negative = 0, pair = (0, 0), positive = 0)
+    done = threading.Event()
+    errors = []
+    seen = [0] * STATE_READERS
+
+
+    def read(reader):
+        '''!
+            Reader thread: checks the consistency of every snapshot, and that none is older than the previous one
+
+            @param reader               : Reader index
+        '''
+
+        last = 0
+
+        while(not done.is_set()):
+            snapshot = state.get()
+
+            if(snapshot.negative != -snapshot.positive or snapshot.pair != (snapshot.positive, snapshot.positive * 2) or snapshot.positive < last):
+                errors.append(snapshot)
+
+                return
+
+            if(snapshot.positive != last):
+                seen[reader] += 1
+
+            last = snapshot.positive
+
+
+    interval = sys.getswitchinterval()
+    readers = [threading.Thread(target = read, args = (i, ), daemon = True) for i in range(STATE_READERS)]
+
+    sys.setswitchinterval(0.000001)
+
+    try:
+        for reader in readers:
+            reader.start()
+
+        i = 0
+
+        while(i < STATE_WRITES or (min(seen) < 2 and i < STATE_WRITES_MAX)):  # Thread switches are up to the interpreter
+            i += 1
+
+            state.set('positive', i)
+            state.set('pair', (i, i * 2))
+            state.set('negative', -i)
+            state.publish()
+
+    finally:
+        done.set()
+
+        for reader in readers:
+            reader.join()
+
+        sys.setswitchinterval(interval)
+
+    assert not errors, errors
+    assert min(seen) > 1, seen                                                  # Readers and writer did interleave
+    assert state.get() == (-i, (i, i * 2), i), state.get()
+
+
+def main(argv = sys.argv[1:]):
+    '''!
+        Runs the checks
+
+        @param argv:    Program arguments: names of the checks to run (every one if missing)
+
+        @return:        Return code: `0` if every check passed, `1` otherwise
+    '''
+
+    checks = {name[6:]: function for name, function in sorted(globals().items()) if(name.startswith('check_'))}
+
+    parser = argparse.ArgumentParser(description = 'PicoTemp checks, on simulated hardware')
+    parser.add_argument('names', nargs = '*', help = f"checks to run, among: { ', '.join(checks) }")
+
+    args = parser.parse_args(argv)
+
+    for name in args.names:
+        if(name not in checks):
+            parser.error(f"unknown check: { name }")
+
+    run.setup()
+
+    failed = 0
+
+    for name in (args.names or checks):
+        try:
+            checks[name]()
+
+        except Exception:
+            failed += 1
+
+            print(f"FAIL { name }")
+
+            traceback.print_exc()
+
+        else:
+            print(f"ok   { name }")
+
+    return 1 if(failed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    config
+
+    @file       : config.py
+    @brief      : Simulation config class
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported instead of the device configuration, see `run.py`)
+    @note       : See `lib/config_template.py` for the meaning of every setting
+'''
+
+
+class config(object):
+    alloc_monitor = False
+    async_server = True
+    backlog_size = 512
+    buttons_pins = [15, 17]
+    dst = True
+    dht11_interval = 1000
+    dht11_pins = [2, 13]
+    dht22_interval = 2000
+    dht22_pins = [4]
+    gc_threshold = 8192
+    history_size = 120
+    log_directory = None
+    ntp_period = 3600
+    sampling_period = 2
+    sampling_periods = None
+    screen = True
+    server_port = 8080                                                          # Unprivileged port
+    wifi_ssid = 'SIMULATION'
+    wifi_password = 'SIMULATION'
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    dht
+
+    @file       : dht.py
+    @brief      : MicroPython dht module simulation
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported instead of MicroPython's dht module, see `run.py`)
+    @note       : ...
+'''
+
+
+from random import Random                                                       # Pseudo-random numbers, for noise and failures
+from time import sleep                                                          # Sleep function
+
+
+class DHTBase:
+    failure_rate = 0                                                            # Probability of a reading failing
+    humidity_base = 50
+    noise = 1                                                                   # Maximum random deviation from the base values
+    read_latency = 0                                                            # Seconds blocked by each reading
+    resolution = 1
+    seed = 0
+    temperature_base = 22
+
+    _humidity = None
+    _pin = None
+    _random = None
+    _temperature = None
+
+
+    def __init__(self, pin):
+        '''!
+            Class constructor
+
+            Initializes default values of the class. Every sensor gets its own deterministic random generator, so runs
+            can be reproduced
+
+            @param pin                  : Data pin
+        '''
+
+        self._pin = pin
+        self._random = Random(self.seed + (pin._id if(hasattr(pin, '_id') and isinstance(pin._id, int)) else 0))
+
+
+    def humidity(self):
+        '''!
+            Humidity observer
+
+            @return                     : Humidity of the last successful reading, in %
+        '''
+
+        return self._humidity
+
+
+    def measure(self):
+        '''!
+            Sensor reader
+
+            Blocks for `read_latency` seconds, as the real bit-banged protocol, and fails with `failure_rate`
+            probability, raising `OSError` as the real driver does on timeouts and checksum errors
+        '''
+
+        if(self.read_latency):
+            sleep(self.read_latency)
+
+        if(self._random.random() < self.failure_rate):
+            raise OSError(110)                                                  # ETIMEDOUT
+
+        self._temperature = self._value(self.temperature_base)
+        self._humidity = self._value(self.humidity_base)
+
+
+    def temperature(self):
+        '''!
+            Temperature observer
+
+            @return                     : Temperature of the last successful reading, in ºC
+        '''
+
+        return self._temperature
+
+
+    def _value(self, base):
+        '''!
+            Noisy value generator
+
+            @param base                 : Base value
+
+            @return                     : Value around the base one, rounded to the sensor resolution
+        '''
+
+        value = base + self._random.uniform(-self.noise, self.noise)
+
+        return int(round(value)) if(self.resolution == 1) else round(value / self.resolution) * self.resolution
+
+
+class DHT11(DHTBase):
+    read_latency = 0.023                                                        # Start signal (18 ms) and transfer, approximately
+    resolution = 1
+
+
+class DHT22(DHTBase):
+    read_latency = 0.006                                                        # Start signal (1 ms) and transfer, approximately
+    resolution = 0.1
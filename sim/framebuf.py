@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    framebuf
+
+    @file       : framebuf.py
+    @brief      : MicroPython framebuf module simulation
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported instead of MicroPython's framebuf module, see `run.py`)
+    @note       : Monochrome formats only. Text is drawn with a synthetic 8x8 font, so every character is different,
+                  but it does not look like MicroPython's one
+'''
+
+
+MONO_HLSB = 3
+MONO_HMSB = 4
+MONO_VLSB = 0
+MVLSB = MONO_VLSB
+
+CHAR_SIZE = 8
+
+
+class FrameBuffer:
+    _buffer = None
+    _format = None
+    _stride = None
+    height = None
+    width = None
+
+
+    def __init__(self, buffer, width, height, format, stride = None):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param buffer               : Object with a buffer protocol, big enough for the frame
+            @param width                : Width, in pixels
+            @param height               : Height, in pixels
+            @param format               : Pixels format (`MONO_HLSB`, `MONO_HMSB` or `MONO_VLSB`)
+            @param stride               : Pixels between each horizontal line, `width` if `None`
+        '''
+
+        if(format not in (MONO_HLSB, MONO_HMSB, MONO_VLSB)):
+            raise ValueError('invalid format')
+
+        self._buffer = buffer
+        self._format = format
+        self._stride = stride if(stride is not None) else width
+        self.height = height
+        self.width = width
+
+
+    def blit(self, fbuf, x, y, key = -1, palette = None):
+        '''!
+            Frame buffer drawer
+
+            @param fbuf                 : Frame buffer to be drawn
+            @param x                    : Left coordinate
+            @param y                    : Top coordinate
+            @param key                  : Color not drawn (transparent), `-1` for none
+            @param palette              : Frame buffer translating the colors, `None` for none
+        '''
+
+        if(
+            x == 0 and y == 0 and key == -1 and palette is None and fbuf._format == self._format and
+            fbuf.width == self.width and fbuf.height == self.height and fbuf._stride == self._stride
+        ):
+            self._buffer[:len(fbuf._buffer)] = fbuf._buffer                     # Same layout, plain copy
+
+        else:
+            for j in range(max(0, -y), min(fbuf.height, self.height - y)):
+                for i in range(max(0, -x), min(fbuf.width, self.width - x)):
+                    c = fbuf._get(i, j)
+
+                    if(palette is not None):
+                        c = palette._get(c, 0)
+
+                    if(c != key):
+                        self._set(x + i, y + j, c)
+
+
+    def fill(self, c):
+        '''!
+            Frame buffer filler
+
+            @param c                    : Color
+        '''
+
+        value = 0xFF if(c & 1) else 0x00
+
+        for i in range(len(self._buffer)):
+            self._buffer[i] = value
+
+
+    def fill_rect(self, x, y, w, h, c):
+        '''!
+            Filled rectangle drawer
+
+            @param x                    : Left coordinate
+            @param y                    : Top coordinate
+            @param w                    : Width
+            @param h                    : Height
+            @param c                    : Color
+        '''
+
+        for j in range(max(0, y), min(self.height, y + h)):
+            for i in range(max(0, x), min(self.width, x + w)):
+                self._set(i, j, c)
+
+
+    def _get(self, x, y):
+        '''!
+            Pixel reader, without bounds checking
+
+            @param x                    : Horizontal coordinate
+            @param y                    : Vertical coordinate
+
+            @return                     : Pixel color
+        '''
+
+        if(self._format == MONO_VLSB):
+            return (self._buffer[(y >> 3) * self._stride + x] >> (y & 7)) & 1
+
+        elif(self._format == MONO_HLSB):
+            return (self._buffer[(y * self._stride + x) >> 3] >> (7 - (x & 7))) & 1
+
+        else:
+            return (self._buffer[(y * self._stride + x) >> 3] >> (x & 7)) & 1
+
+
+    def hline(self, x, y, w, c):
+        '''!
+            Horizontal line drawer
+
+            @param x                    : Left coordinate
+            @param y                    : Vertical coordinate
+            @param w                    : Width
+            @param c                    : Color
+        '''
+
+        self.fill_rect(x, y, w, 1, c)
+
+
+    def line(self, x1, y1, x2, y2, c):
+        '''!
+            Line drawer (Bresenham's algorithm)
+
+            @param x1                   : Start horizontal coordinate
+            @param y1                   : Start vertical coordinate
+            @param x2                   : End horizontal coordinate
+            @param y2                   : End vertical coordinate
+            @param c                    : Color
+        '''
+
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if(x1 < x2) else -1
+        sy = 1 if(y1 < y2) else -1
+        error = dx + dy
+
+        while(True):
+            self.pixel(x1, y1, c)
+
+            if(x1 == x2 and y1 == y2):
+                break
+
+            e2 = 2 * error
+
+            if(e2 >= dy):
+                error += dy
+                x1 += sx
+
+            if(e2 <= dx):
+                error += dx
+                y1 += sy
+
+
+    def pixel(self, x, y, c = None):
+        '''!
+            Pixel reader / writer
+
+            @param x                    : Horizontal coordinate
+            @param y                    : Vertical coordinate
+            @param c                    : Color, `None` to read it
+
+            @return                     : Pixel color if `c` is `None` (`None` outside the frame buffer)
+        '''
+
+        if(0 <= x < self.width and 0 <= y < self.height):
+            if(c is None):
+                return self._get(x, y)
+
+            self._set(x, y, c)
+
+        return None
+
+
+    def rect(self, x, y, w, h, c, f = False):
+        '''!
+            Rectangle drawer
+
+            @param x                    : Left coordinate
+            @param y                    : Top coordinate
+            @param w                    : Width
+            @param h                    : Height
+            @param c                    : Color
+            @param f                    : Whether it is filled
+        '''
+
+        if(f):
+            self.fill_rect(x, y, w, h, c)
+
+        else:
+            self.fill_rect(x, y, w, 1, c)
+            self.fill_rect(x, y + h - 1, w, 1, c)
+            self.fill_rect(x, y, 1, h, c)
+            self.fill_rect(x + w - 1, y, 1, h, c)
+
+
+    def scroll(self, xstep, ystep):
+        '''!
+            Contents shifter
+
+            @param xstep                : Pixels to shift horizontally
+            @param ystep                : Pixels to shift vertically
+        '''
+
+        pixels = [[self._get(i, j) for i in range(self.width)] for j in range(self.height)]
+
+        for j in range(self.height):
+            for i in range(self.width):
+                if(0 <= i - xstep < self.width and 0 <= j - ystep < self.height):
+                    self._set(i, j, pixels[j - ystep][i - xstep])
+
+
+    def _set(self, x, y, c):
+        '''!
+            Pixel writer, without bounds checking
+
+            @param x                    : Horizontal coordinate
+            @param y                    : Vertical coordinate
+            @param c                    : Color
+        '''
+
+        if(self._format == MONO_VLSB):
+            i = (y >> 3) * self._stride + x
+            mask = 1 << (y & 7)
+
+        elif(self._format == MONO_HLSB):
+            i = (y * self._stride + x) >> 3
+            mask = 0x80 >> (x & 7)
+
+        else:
+            i = (y * self._stride + x) >> 3
+            mask = 1 << (x & 7)
+
+        if(c & 1):
+            self._buffer[i] |= mask
+
+        else:
+            self._buffer[i] &= ~mask & 0xFF
+
+
+    def text(self, s, x, y, c = 1):
+        '''!
+            Text drawer
+
+            @param s                    : Text
+            @param x                    : Left coordinate
+            @param y                    : Top coordinate
+            @param c                    : Color
+        '''
+
+        for n, char in enumerate(s):
+            glyph = _glyph(ord(char))
+
+            for j in range(CHAR_SIZE):
+                for i in range(CHAR_SIZE):
+                    if((glyph[j] >> (7 - i)) & 1):
+                        self.pixel(x + n * CHAR_SIZE + i, y + j, c)
+
+
+    def vline(self, x, y, h, c):
+        '''!
+            Vertical line drawer
+
+            @param x                    : Horizontal coordinate
+            @param y                    : Top coordinate
+            @param h                    : Height
+            @param c                    : Color
+        '''
+
+        self.fill_rect(x, y, 1, h, c)
+
+
+def _glyph(code):
+    '''!
+        Synthetic glyph generator
+
+        @param code                 : Character code
+
+        @return                     : Eight rows of eight pixels, blank for spaces and control characters
+    '''
+
+    if(code <= 32):
+        return bytes(CHAR_SIZE)
+
+    seed = (code * 2654435761) & 0xFFFFFFFF
+
+    res = bytearray(CHAR_SIZE)
+
+    for j in range(1, CHAR_SIZE - 1):                                           # Blank top and bottom rows, as the real font
+        seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+
+        res[j] = (seed >> 16) & 0x7E                                            # Blank left and right columns
+
+    return res
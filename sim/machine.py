@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    machine
+
+    @file       : machine.py
+    @brief      : MicroPython machine module simulation
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported instead of MicroPython's machine module, see `run.py`)
+    @note       : Only `Pin` and `SPI` are simulated
+'''
+
+
+SPI_TRANSACTION_OVERHEAD = 10                                                   # Simulated microseconds to start a SPI transaction (chip select, DMA setup...)
+
+
+class Pin:
+    IN = 0
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+    OPEN_DRAIN = 2
+    OUT = 1
+    PULL_DOWN = 2
+    PULL_UP = 1
+
+    pins = {}                                                                   # Last pin created for each identifier, to script the simulation
+
+    _handler = None
+    _id = None
+    _mode = None
+    _pull = None
+    _trigger = None
+    _value = 0
+
+
+    def __init__(self, id, mode = -1, pull = -1, value = None):
+        '''!
+            Class constructor
+
+            Initializes default values of the class. Inputs read their pull level until `set_input()` is called
+
+            @param id                   : Pin identifier
+            @param mode                 : Pin mode (`IN`, `OUT` or `OPEN_DRAIN`)
+            @param pull                 : Pull resistor (`PULL_UP` or `PULL_DOWN`)
+            @param value                : Initial output value
+        '''
+
+        self._id = id
+        self._mode = mode
+        self._pull = pull
+        self._value = 1 if(pull == Pin.PULL_UP) else 0
+
+        if(value is not None):
+            self._value = 1 if(value) else 0
+
+        Pin.pins[id] = self
+
+
+    def __call__(self, value = None):
+        '''!
+            Value reader / writer, as `value()`
+        '''
+
+        return self.value(value)
+
+
+    def irq(self, handler = None, trigger = IRQ_FALLING | IRQ_RISING):
+        '''!
+            Interrupt configurator
+
+            @param handler              : Function called with the pin when the interrupt triggers, `None` to disable it
+            @param trigger              : Edges triggering the interrupt (`IRQ_FALLING`, `IRQ_RISING` or both)
+        '''
+
+        self._handler = handler
+        self._trigger = trigger
+
+
+    def off(self):
+        '''!
+            Output low setter
+        '''
+
+        self._value = 0
+
+
+    def on(self):
+        '''!
+            Output high setter
+        '''
+
+        self._value = 1
+
+
+    def press(self):
+        '''!
+            Button press simulator
+
+            Pulls a pulled up input low and releases it, firing the interrupts of both edges
+        '''
+
+        self.set_input(0)
+        self.set_input(1)
+
+
+    def set_input(self, value):
+        '''!
+            Input level simulator
+
+            Changes the level read from the pin, firing the interrupt handler if it was configured for the edge
+
+            @param value                : New level
+        '''
+
+        value = 1 if(value) else 0
+
+        if(value != self._value):
+            self._value = value
+
+            if(self._handler is not None and self._trigger & (Pin.IRQ_RISING if(value) else Pin.IRQ_FALLING)):
+                self._handler(self)
+
+
+    def value(self, value = None):
+        '''!
+            Value reader / writer
+
+            @param value                : Output value, `None` to read the level
+
+            @return                     : Pin level if `value` is `None`
+        '''
+
+        if(value is None):
+            return self._value
+
+        self._value = 1 if(value) else 0
+
+        return None
+
+
+class SPI:
+    buses = {}                                                                  # Last bus created for each identifier, to inspect the simulation
+
+    _baudrate = None
+    bus_time = 0
+    bytes_written = 0
+    log = None
+    transactions = 0
+
+
+    def __init__(self, id, baudrate = 1000000, polarity = 0, phase = 0, bits = 8, firstbit = 0, sck = None, mosi = None, miso = None, log = False):
+        '''!
+            Class constructor
+
+            Initializes default values of the class
+
+            @param id                   : Bus identifier
+            @param baudrate             : Clock rate, in bits per second
+            @param log                  : Whether the data of every transaction is recorded in `log`
+        '''
+
+        self._baudrate = baudrate
+        self.log = [] if(log) else None
+
+        SPI.buses[id] = self
+
+
+    def reset(self):
+        '''!
+            Statistics resetter
+        '''
+
+        self.bus_time = 0
+        self.bytes_written = 0
+        self.transactions = 0
+
+        if(self.log is not None):
+            self.log = []
+
+
+    def write(self, buf):
+        '''!
+            Writer
+
+            Records the transaction and accounts its simulated bus time, in microseconds, at the configured clock rate
+
+            @param buf                  : Data to be written
+
+            @return                     : `None`
+        '''
+
+        self.transactions += 1
+        self.bytes_written += len(buf)
+        self.bus_time += SPI_TRANSACTION_OVERHEAD + len(buf) * 8 * 1000000 // self._baudrate
+
+        if(self.log is not None):
+            self.log.append(bytes(buf))
+
+        return None
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    network
+
+    @file       : network.py
+    @brief      : MicroPython network module simulation
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported instead of MicroPython's network module, see `run.py`)
+    @note       : The station interface gets the loopback address, so the real (CPython) sockets can be used
+'''
+
+
+from ticks import ticks_diff, ticks_ms                                          # Millisecond ticks
+
+
+AP_IF = 1
+STA_IF = 0
+STAT_CONNECT_FAIL = -1
+STAT_CONNECTING = 1
+STAT_GOT_IP = 3
+STAT_IDLE = 0
+STAT_NO_AP_FOUND = -2
+STAT_WRONG_PASSWORD = -3
+
+
+class WLAN:
+    _interfaces = {}
+
+    _active = False
+    _connected_at = None
+    _rssi_index = 0
+    connect_delay = 0                                                           # Milliseconds from `connect()` to `connect_status`
+    connect_status = STAT_GOT_IP                                                # Status reached by connection attempts
+    ip = '127.0.0.1'
+    link = True                                                                 # Whether the access point is reachable
+    rssi = -60                                                                  # RSSI in dBm, or list of values returned in turn
+
+
+    def __new__(cls, interface = STA_IF):
+        '''!
+            Instance getter
+
+            There is a single instance per interface, as in MicroPython, so the simulation can be scripted through it
+
+            @param interface            : Interface (`STA_IF` or `AP_IF`)
+        '''
+
+        if(interface not in cls._interfaces):
+            cls._interfaces[interface] = super().__new__(cls)
+
+        return cls._interfaces[interface]
+
+
+    def active(self, active = None):
+        '''!
+            Interface state reader / writer
+
+            @param active               : Whether the interface is active, `None` to read it
+
+            @return                     : Interface state if `active` is `None`
+        '''
+
+        if(active is None):
+            return self._active
+
+        self._active = bool(active)
+
+        if(not self._active):
+            self._connected_at = None
+
+        return None
+
+
+    def connect(self, ssid = None, key = None):
+        '''!
+            Connection attempt starter
+
+            @param ssid                 : Network SSID
+            @param key                  : Network password
+        '''
+
+        self._connected_at = ticks_ms()
+
+
+    def disconnect(self):
+        '''!
+            Disconnector
+        '''
+
+        self._connected_at = None
+
+
+    def drop(self):
+        '''!
+            Link loss simulator
+
+            Makes the access point unreachable, e.g. while it reboots, until `restore()` is called
+        '''
+
+        self.link = False
+
+
+    def ifconfig(self):
+        '''!
+            Addresses observer
+
+            @return                     : A tuple (`ip`, `netmask`, `gateway`, `dns`)
+        '''
+
+        return (self.ip, '255.0.0.0', self.ip, self.ip) if(self.isconnected()) else ('0.0.0.0',) * 4
+
+
+    def isconnected(self):
+        '''!
+            Connection checker
+
+            @return                     : Whether the interface got an IP address
+        '''
+
+        return self.status() == STAT_GOT_IP
+
+
+    @classmethod
+    def reset(cls):
+        '''!
+            Simulation resetter
+
+            Discards the instances, so the next ones are created with the default behaviour
+        '''
+
+        cls._interfaces = {}
+
+
+    def restore(self):
+        '''!
+            Link recovery simulator
+
+            Makes the access point reachable again, after `drop()`
+        '''
+
+        self.link = True
+
+
+    def status(self, param = None):
+        '''!
+            Status observer
+
+            @param param                : `'rssi'` to read the RSSI, `None` to read the connection status
+
+            @return                     : RSSI in dBm, or connection status (`STAT_*`)
+        '''
+
+        if(param == 'rssi'):
+            if(self.status() != STAT_GOT_IP):
+                raise OSError('not connected')
+
+            if(isinstance(self.rssi, (list, tuple))):
+                res = self.rssi[self._rssi_index % len(self.rssi)]
+
+                self._rssi_index += 1
+
+                return res
+
+            return self.rssi
+
+        elif(param is not None):
+            raise ValueError('unknown status param')
+
+        if(not self._active or self._connected_at is None):
+            return STAT_IDLE
+
+        elif(not self.link):
+            return STAT_NO_AP_FOUND
+
+        elif(ticks_diff(ticks_ms(), self._connected_at) < self.connect_delay):
+            return STAT_CONNECTING
+
+        else:
+            return self.connect_status
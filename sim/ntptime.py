@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    ntptime
+
+    @file       : ntptime.py
+    @brief      : MicroPython ntptime module simulation
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : (imported instead of MicroPython's ntptime module, see `run.py`)
+    @note       : The host clock is never changed
+'''
+
+
+from time import sleep                                                          # Sleep function
+
+
+delay = 0                                                                       # Seconds blocked by each synchronization
+fail = False                                                                    # Whether synchronizations fail
+host = 'pool.ntp.org'
+synchronizations = 0
+
+
+def settime():
+    '''!
+        Clock synchronizer
+
+        Blocks for `delay` seconds and raises `OSError` if `fail` is set, as the real module does on timeouts
+    '''
+
+    global synchronizations
+
+    if(delay):
+        sleep(delay)
+
+    if(fail):
+        raise OSError(110)                                                      # ETIMEDOUT
+
+    synchronizations += 1
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+'''!
+    run
+
+    @file       : run.py
+    @brief      : Host-side simulation launcher
+
+    @author     : Veltys
+    @date       : 2026-10-18
+    @version    : 1.0.0
+    @usage      : python3 sim/run.py [seconds] | ./sim/run.py [seconds]
+    @note       : Runs the unmodified main module under CPython, with the simulated hardware modules of this
+                  directory. The server listens on http://127.0.0.1:8080/
+'''
+
+
+import os                                                                       # Paths management
+import sys                                                                      # System-specific parameters and functions
+import threading                                                                # CPython threads
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIMULATION = os.path.dirname(os.path.abspath(__file__))
+
+
+def setup():
+    '''!
+        Prepares the simulation environment
+
+        Puts the simulated modules before the device ones in the modules search path (so they replace the MicroPython
+        ones and the device configuration) and moves to the repository root, as resources are loaded with relative
+        paths. Nothing is imported, so it must be called before importing any device module
+    '''
+
+    for path in (ROOT, os.path.join(ROOT, 'lib'), SIMULATION):
+        if(path in sys.path):
+            sys.path.remove(path)
+
+        sys.path.insert(0, path)
+
+    os.chdir(ROOT)
+
+
+def main(argv = sys.argv[1:]):
+    '''!
+        Runs the device program in the simulation
+
+        @param argv:    Program arguments: seconds to run before pressing the exit button (forever if missing)
+
+        @return:        Return code
+    '''
+
+    setup()
+
+    import main as device                                                       # Device main module
+
+    from config import config                                                   # Simulated configuration
+    from machine import Pin                                                     # Simulated pins
+
+    if(argv and config.screen):
+        timer = threading.Timer(float(argv[0]), lambda: Pin.pins[config.buttons_pins[1]].press())
+        timer.daemon = True
+        timer.start()
+
+    return device.main([])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])